@@ -46,7 +46,6 @@ class TapoCoordinator(ABC, DataUpdateCoordinator[StateMap]):
         device: TapoDevice,
         polling_interval: timedelta,
     ):
-        print("<coordinators.py/TapoCoordinator> init...")
         self._device = device
         super().__init__(
             hass,
@@ -69,7 +68,6 @@ class TapoCoordinator(ABC, DataUpdateCoordinator[StateMap]):
         return target_type in self._states
 
     def get_state_of(self, target_type: Type[T]) -> T:
-        print("<coordinators.py/TapoCoordinator> get_state_of, target_type: ", target_type)
         return self._states.get(target_type)
 
     def update_state_of(self, target_type: Type[T], state: Optional[T]) -> StateMap:
@@ -98,9 +96,7 @@ class TapoCoordinator(ABC, DataUpdateCoordinator[StateMap]):
         try:
             # Note: asyncio.TimeoutError and aiohttp.ClientError are already
             # handled by the data update coordinator.
-            print("<coordinators.py/TapoCoordinator/_async_update_data> trying...")
             async with async_timeout.timeout(10):
-                print("<coordinators.py/TapoCoordinator/_async_update_data> timeout(10)")
                 return await self._update_state()
         except TapoException as error:
             self._raise_from_tapo_exception(error)
@@ -125,7 +121,6 @@ class PlugTapoCoordinator(TapoCoordinator):
         device: PlugDevice,
         polling_interval: timedelta,
     ):
-        print("<coordinators.py/PlugTapoCoordinator> init...")
         super().__init__(hass, device, polling_interval)
 
     @cached_property
@@ -136,7 +131,6 @@ class PlugTapoCoordinator(TapoCoordinator):
         )
 
     async def _update_state(self):
-        print("<coordinators.py/PlugTapoCoordinator> _update_state --> update coordinator._states")
         plug = cast(PlugDevice, self.device)
         plug_state = (await plug.get_state()).get_or_raise()  # device_info with plug specified state.
         self.update_state_of(PlugDeviceState, plug_state)
@@ -152,7 +146,7 @@ class PlugTapoCoordinator(TapoCoordinator):
 async def create_coordinator(
     hass: HomeAssistant, client: TapoClient, host: str, polling_interval: timedelta
 ) -> Try["TapoCoordinator"]:
-    print("<coordinators.py/create_coordinator> do create coordinator...")
+    _LOGGER.debug("Creating coordinator for %s", host)
     device_info = (await client.get_device_info()).map(lambda x: TapoDeviceInfo(**x))
     if device_info.is_success():
         model = get_short_model(device_info.get().model)
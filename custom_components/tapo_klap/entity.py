@@ -22,7 +22,6 @@ class BaseTapoEntity(CoordinatorEntity[C]):
     @property
     def device_info(self) -> DeviceInfo:  # 注意和TapoDeviceInfo进行区分
         """展示设备信息"""
-        print("<entity.py/BaseTapoEntity/device_info> Property --> deviceInfo")
         return {
             "identifiers": {(DOMAIN, self._base_data.device_id)},
             "name": self._base_data.friendly_name,
@@ -39,5 +38,4 @@ class BaseTapoEntity(CoordinatorEntity[C]):
     @callback
     def _handle_coordinator_update(self) -> None:
         self._base_data = self.coordinator.get_state_of(TapoDeviceInfo)
-        print("<entity.py/BaseTapoEntity/_handle_coordinator_update> do async_write_ha_state")
         self.async_write_ha_state()
@@ -118,6 +118,12 @@ def get_arguments() -> argparse.Namespace:
         help="Skip pip install of specific packages on startup",
     )
 
+    parser.add_argument(
+        "--template-bytecode-cache",
+        action="store_true",
+        help="Store the bytecode of compiled templates to speed up the next start",
+    )
+
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose logging to file."
     )
@@ -197,6 +203,7 @@ def main() -> int:
         log_no_color=args.log_no_color,
         skip_pip=args.skip_pip,
         skip_pip_packages=args.skip_pip_packages,
+        template_bytecode_cache=args.template_bytecode_cache,
         recovery_mode=args.recovery_mode,
         debug=args.debug,
         open_ui=args.open_ui,
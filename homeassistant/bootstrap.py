@@ -16,7 +16,7 @@ from typing import TYPE_CHECKING, Any
 import voluptuous as vol
 import yarl
 
-from . import config as conf_util, config_entries, core, loader
+from . import config as conf_util, config_entries, core, loader, requirements
 from .components import http
 from .const import (
     FORMAT_DATETIME,
@@ -143,6 +143,9 @@ async def async_setup_hass(
     if not (recovery_mode := runtime_config.recovery_mode):
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
 
+        if runtime_config.template_bytecode_cache:
+            await template.async_load_bytecode_cache(hass)
+
         try:
             config_dict = await conf_util.async_hass_config_yaml(hass)
         except HomeAssistantError as err:
@@ -256,6 +259,7 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
         restore_state.async_load(hass),
+        loader.async_load_manifest_cache(hass),
     )
 
 
@@ -544,6 +548,58 @@ async def async_setup_multi_components(
             )
 
 
+async def _async_preload_integrations(
+    hass: core.HomeAssistant,
+    config: dict[str, Any],
+    integrations: list[loader.Integration],
+) -> None:
+    """Import integrations and the platforms we know they will load.
+
+    The imports run one at a time in the executor, an integration that is set
+    up before it was preloaded imports itself. Integrations are only imported
+    once their requirements and those of their dependencies are known to be
+    installed. Importing them earlier could load an outdated version of a
+    requirement that stays loaded after it is upgraded.
+    """
+    platforms: dict[str, list[str]] = {}
+    for integration in integrations:
+        if integration.config_flow:
+            platforms.setdefault(integration.domain, []).append("config_flow")
+        for p_name, _ in conf_util.config_per_platform(config, integration.domain):
+            if isinstance(p_name, str):
+                platforms.setdefault(p_name, []).append(integration.domain)
+
+    for integration in integrations:
+        platform_names = platforms.pop(integration.domain, ())
+        if await _async_requirements_installed(hass, integration):
+            await integration.async_preload(platform_names)
+
+    for int_or_exc in (await loader.async_get_integrations(hass, platforms)).values():
+        if isinstance(
+            int_or_exc, loader.Integration
+        ) and await _async_requirements_installed(hass, int_or_exc):
+            await int_or_exc.async_preload(platforms[int_or_exc.domain])
+
+
+async def _async_requirements_installed(
+    hass: core.HomeAssistant, integration: loader.Integration
+) -> bool:
+    """Return if the requirements of an integration and its dependencies are installed."""
+    if not await integration.resolve_dependencies():
+        return False
+    integrations = [integration]
+    for int_or_exc in (
+        await loader.async_get_integrations(hass, integration.all_dependencies)
+    ).values():
+        if not isinstance(int_or_exc, loader.Integration):
+            return False
+        integrations.append(int_or_exc)
+    return all(
+        requirements.async_requirements_installed(hass, itg.requirements)
+        for itg in integrations
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -646,6 +702,21 @@ async def _async_set_up_integrations(
         - stage_1_domains
     )
 
+    # Import the integrations of both stages one at a time in the executor
+    # while they are being set up
+    hass.async_create_background_task(
+        _async_preload_integrations(
+            hass,
+            config,
+            [
+                integration_cache[domain]
+                for domain in (*stage_1_domains, *stage_2_domains)
+                if domain in integration_cache
+            ],
+        ),
+        "preload integrations",
+    )
+
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
 
@@ -1,13 +1,14 @@
 """Base classes for HA Bluetooth scanners for bluetooth."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Any
 
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 from bluetooth_adapters import DiscoveredDeviceAdvertisementData
+from bluetooth_data_tools import parse_advertisement_data_tuple
 from habluetooth import BaseHaRemoteScanner, BaseHaScanner, HaBluetoothConnector
 from home_assistant_bluetooth import BluetoothServiceInfoBleak
 
@@ -20,6 +21,7 @@ from homeassistant.core import (
 )
 
 from . import models
+from .const import RAW_ADVERTISEMENT_REPEAT_SECONDS, RAW_ADVERTISEMENT_RSSI_THRESHOLD
 
 
 @dataclass(slots=True)
@@ -42,6 +44,11 @@ class HomeAssistantRemoteScanner(BaseHaRemoteScanner):
         "hass",
         "_storage",
         "_cancel_stop",
+        "_last_raw_advertisements",
+        "_last_raw_advertisements_pruned",
+        "advertisements_received",
+        "advertisements_deduped",
+        "advertisements_dispatched",
     )
 
     def __init__(
@@ -58,6 +65,12 @@ class HomeAssistantRemoteScanner(BaseHaRemoteScanner):
         assert models.MANAGER is not None
         self._storage = models.MANAGER.storage
         self._cancel_stop: CALLBACK_TYPE | None = None
+        # address -> (raw advertisement, rssi, monotonic time) when last dispatched
+        self._last_raw_advertisements: dict[str, tuple[bytes, int, float]] = {}
+        self._last_raw_advertisements_pruned = 0.0
+        self.advertisements_received = 0
+        self.advertisements_deduped = 0
+        self.advertisements_dispatched = 0
         super().__init__(scanner_id, name, new_info_callback, connector, connectable)
 
     @hass_callback
@@ -98,9 +111,61 @@ class HomeAssistantRemoteScanner(BaseHaRemoteScanner):
             ),
         )
 
+    @hass_callback
+    def _async_on_raw_advertisements(
+        self,
+        advertisements: Iterable[tuple[str, int, bytes, dict[str, Any]]],
+        advertisement_monotonic_time: float,
+    ) -> None:
+        """Handle a batch of raw advertisements as (address, rssi, data, details).
+
+        A repeat of the last dispatched advertisement of an address with the
+        same data and an RSSI within RAW_ADVERTISEMENT_RSSI_THRESHOLD of it is
+        dropped before it is parsed, unless it was dispatched
+        RAW_ADVERTISEMENT_REPEAT_SECONDS ago.
+        """
+        now = advertisement_monotonic_time
+        last_advertisements = self._last_raw_advertisements
+        received = deduped = 0
+        for address, rssi, raw, details in advertisements:
+            received += 1
+            if (
+                (last := last_advertisements.get(address))
+                and last[0] == raw
+                and abs(last[1] - rssi) < RAW_ADVERTISEMENT_RSSI_THRESHOLD
+                and now - last[2] < RAW_ADVERTISEMENT_REPEAT_SECONDS
+            ):
+                deduped += 1
+                continue
+            last_advertisements[address] = (raw, rssi, now)
+            self._async_on_advertisement(
+                address,
+                rssi,
+                *parse_advertisement_data_tuple((raw,)),
+                details,
+                now,
+            )
+        self.advertisements_received += received
+        self.advertisements_deduped += deduped
+        self.advertisements_dispatched += received - deduped
+        if (
+            now - self._last_raw_advertisements_pruned
+            > RAW_ADVERTISEMENT_REPEAT_SECONDS
+        ):
+            self._last_raw_advertisements_pruned = now
+            for address in [
+                address
+                for address, (_, _, last_time) in last_advertisements.items()
+                if now - last_time >= RAW_ADVERTISEMENT_REPEAT_SECONDS
+            ]:
+                del last_advertisements[address]
+
     async def async_diagnostics(self) -> dict[str, Any]:
         """Return diagnostic information about the scanner."""
         diag = await super().async_diagnostics()
+        diag["advertisements_received"] = self.advertisements_received
+        diag["advertisements_deduped"] = self.advertisements_deduped
+        diag["advertisements_dispatched"] = self.advertisements_dispatched
         diag["storage"] = self._storage.async_get_advertisement_history_as_dict(
             self.source
         )
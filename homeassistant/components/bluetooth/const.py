@@ -33,3 +33,9 @@ START_TIMEOUT = 15
 # are not present
 LINUX_FIRMWARE_LOAD_FALLBACK_SECONDS = 120
 BLUETOOTH_DISCOVERY_COOLDOWN_SECONDS = 5
+
+# Remote scanners drop repeats of a raw advertisement with the same payload
+# and an RSSI within this many dBm of the last dispatched one
+RAW_ADVERTISEMENT_RSSI_THRESHOLD: Final = 5
+# Repeats are still dispatched this often so the device does not go stale
+RAW_ADVERTISEMENT_REPEAT_SECONDS: Final = 5.0
@@ -2,10 +2,7 @@
 from __future__ import annotations
 
 from aioesphomeapi import BluetoothLEAdvertisement, BluetoothLERawAdvertisement
-from bluetooth_data_tools import (
-    int_to_bluetooth_address,
-    parse_advertisement_data_tuple,
-)
+from bluetooth_data_tools import int_to_bluetooth_address
 
 from homeassistant.components.bluetooth import (
     MONOTONIC_TIME,
@@ -40,12 +37,15 @@ class ESPHomeScanner(HomeAssistantRemoteScanner):
         self, advertisements: list[BluetoothLERawAdvertisement]
     ) -> None:
         """Call the registered callback."""
-        now = MONOTONIC_TIME()
-        for adv in advertisements:
-            self._async_on_advertisement(
-                int_to_bluetooth_address(adv.address),
-                adv.rssi,
-                *parse_advertisement_data_tuple((adv.data,)),
-                {"address_type": adv.address_type},
-                now,
-            )
+        self._async_on_raw_advertisements(
+            (
+                (
+                    int_to_bluetooth_address(adv.address),
+                    adv.rssi,
+                    adv.data,
+                    {"address_type": adv.address_type},
+                )
+                for adv in advertisements
+            ),
+            MONOTONIC_TIME(),
+        )
@@ -10,9 +10,10 @@ import voluptuous as vol
 
 from homeassistant.components import frontend
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import Recorder, get_instance, history
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE, EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant, valid_entity_id
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
@@ -20,6 +21,7 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
+from .cache import HistoryCache
 from .const import DOMAIN
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
@@ -44,6 +46,11 @@ CONFIG_SCHEMA = vol.Schema(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the history hooks."""
+    instance: Recorder | None = hass.data.get(DATA_INSTANCE)
+    if instance is not None and EVENT_STATE_CHANGED not in instance.exclude_event_types:
+        cache = HistoryCache(hass, instance)
+        cache.async_setup()
+        hass.data[DOMAIN] = cache
     hass.http.register_view(HistoryPeriodView())
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_setup(hass)
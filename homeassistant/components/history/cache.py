@@ -0,0 +1,480 @@
+"""In-memory cache of recent states for the history websocket api."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime as dt, timedelta
+from itertools import islice
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder import history
+from homeassistant.components.recorder.const import (
+    ALL_DOMAIN_EXCLUDE_ATTRS,
+    SIGNAL_STATES_PURGED,
+)
+from homeassistant.components.recorder.db_schema import MAX_STATE_ATTRS_BYTES
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, HomeAssistant, State, callback, split_entity_id
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.json import json_bytes, json_fragment
+import homeassistant.util.dt as dt_util
+
+from .const import HISTORY_CACHE_HORIZON_SECONDS, MAX_HISTORY_CACHE_BYTES
+
+if TYPE_CHECKING:
+    from homeassistant.components.recorder import Recorder
+
+# The last_updated timestamp and the state, or None if the entity was removed
+CachedState = tuple[float, State | None]
+
+_TIMESTAMP = itemgetter(0)
+_EMPTY_ATTRIBUTES = json_fragment(b"{}")
+_ONE_MICROSECOND = timedelta(microseconds=1)
+# Rough memory used by a cached State with its datetimes and context,
+# and by each attribute of a state that does not share its attributes
+# with the previous state of the entity
+_ESTIMATED_STATE_BYTES = 512
+_ESTIMATED_ATTRIBUTE_BYTES = 128
+
+
+@dataclass(slots=True)
+class _EntityStates:
+    """Recent states of an entity."""
+
+    # All states after this time are cached
+    covered_since_ts: float
+    # The state that was current at covered_since_ts if it is known
+    base: CachedState | None
+    states: deque[CachedState] = field(default_factory=deque)
+    # The approximate size of the states in bytes
+    size: int = 0
+
+
+@dataclass(slots=True)
+class HistoryCacheSnapshot:
+    """Cached states needed to answer a history query.
+
+    If db_end_time is set, the states before it must be fetched from
+    the database and the cached states continue them.
+    """
+
+    db_end_time: dt | None
+    # The state before the cached states and the cached states of each entity
+    entities: dict[str, tuple[CachedState | None, list[CachedState]]]
+
+
+class HistoryCache:
+    """Cache the recent states of recorded entities.
+
+    The states are fed from state_changed events with the entity filter
+    of the recorder applied. States older than the horizon or beyond the
+    maximum approximate size of the cache are evicted oldest first.
+
+    Nothing is cached while the recorder is disabled, and entities are
+    no longer cached once states they depend on are purged.
+    """
+
+    def __init__(self, hass: HomeAssistant, recorder: Recorder) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self._recorder = recorder
+        self._entity_filter = recorder.entity_filter
+        self._entities: dict[str, _EntityStates] = {}
+        # Entities whose states arrived out of order are always
+        # fetched from the database
+        self._uncacheable: set[str] = set()
+        # The entity and size of each cached state in the order they were added
+        self._order: deque[tuple[_EntityStates, int]] = deque()
+        self._states = 0
+        self._bytes = 0
+
+    @property
+    def cached_entities(self) -> int:
+        """Return the number of cached entities."""
+        return len(self._entities)
+
+    @property
+    def cached_states(self) -> int:
+        """Return the number of cached states."""
+        return self._states
+
+    @property
+    def cached_bytes(self) -> int:
+        """Return the approximate size of the cached states in bytes."""
+        return self._bytes
+
+    @callback
+    def async_setup(self) -> None:
+        """Start caching from the current states."""
+        now_ts = dt_util.utc_to_timestamp(dt_util.utcnow())
+        entity_filter = self._entity_filter
+        for state in self.hass.states.async_all():
+            if entity_filter(state.entity_id):
+                self._entities[state.entity_id] = _EntityStates(
+                    now_ts, (dt_util.utc_to_timestamp(state.last_updated), state)
+                )
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+        async_dispatcher_connect(
+            self.hass, SIGNAL_STATES_PURGED, self._async_states_purged
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Add the new state to the cache."""
+        if not self._recorder.enabled:
+            # The state will not be recorded
+            self._async_clear()
+            return
+        entity_id: str = event.data["entity_id"]
+        if entity_id in self._uncacheable or not self._entity_filter(entity_id):
+            return
+        cached: CachedState
+        if (new_state := event.data["new_state"]) is None:
+            cached = (dt_util.utc_to_timestamp(event.time_fired), None)
+        else:
+            cached = (dt_util.utc_to_timestamp(new_state.last_updated), new_state)
+        if (entity := self._entities.get(entity_id)) is None:
+            entity = self._entities[entity_id] = _EntityStates(cached[0], None)
+        elif cached[0] < (
+            entity.states[-1][0] if entity.states else entity.covered_since_ts
+        ):
+            # The cached states would no longer match the database
+            # if the clock went backwards
+            self._uncacheable.add(entity_id)
+            self._async_remove_entity(entity_id)
+            return
+        size = _ESTIMATED_STATE_BYTES
+        if new_state is not None:
+            size += len(new_state.state)
+            if not entity.states or (
+                (last_state := entity.states[-1][1]) is None
+                or last_state.attributes is not new_state.attributes
+            ):
+                size += _ESTIMATED_ATTRIBUTE_BYTES * len(new_state.attributes)
+        entity.states.append(cached)
+        entity.size += size
+        self._order.append((entity, size))
+        self._states += 1
+        self._bytes += size
+        self._async_evict(cached[0] - HISTORY_CACHE_HORIZON_SECONDS)
+
+    @callback
+    def _async_remove_entity(self, entity_id: str) -> None:
+        """Stop caching the states of an entity until its state changes."""
+        entity = self._entities.pop(entity_id)
+        self._states -= len(entity.states)
+        self._bytes -= entity.size
+        entity.states.clear()
+        entity.size = 0
+
+    @callback
+    def _async_clear(self) -> None:
+        """Remove all cached states."""
+        self._entities.clear()
+        self._order.clear()
+        self._states = 0
+        self._bytes = 0
+
+    @callback
+    def _async_states_purged(
+        self, purge_before: dt, entity_filter: Callable[[str], bool] | None
+    ) -> None:
+        """Stop caching entities whose oldest known state was purged."""
+        purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+        for entity_id, entity in list(self._entities.items()):
+            oldest_ts = entity.base[0] if entity.base else entity.covered_since_ts
+            if oldest_ts < purge_before_ts and (
+                entity_filter is None or entity_filter(entity_id)
+            ):
+                self._async_remove_entity(entity_id)
+
+    @callback
+    def _async_evict(self, expire_before_ts: float) -> None:
+        """Evict the oldest states until the cache is within its limits."""
+        order = self._order
+        while order:
+            entity, size = order[0]
+            if not entity.states:
+                # The entity is no longer cached
+                order.popleft()
+                continue
+            if (
+                self._bytes <= MAX_HISTORY_CACHE_BYTES
+                and entity.states[0][0] >= expire_before_ts
+            ):
+                return
+            order.popleft()
+            entity.base = entity.states.popleft()
+            entity.covered_since_ts = entity.base[0]
+            entity.size -= size
+            self._states -= 1
+            self._bytes -= size
+
+    @callback
+    def async_snapshot(
+        self, entity_ids: Iterable[str], start_time: dt, end_time: dt | None
+    ) -> HistoryCacheSnapshot | None:
+        """Return the cached states needed for a history query.
+
+        Returns None if the query must be answered from the database.
+        """
+        if not self._recorder.enabled:
+            self._async_clear()
+            self.misses += 1
+            return None
+        start_ts = dt_util.utc_to_timestamp(start_time)
+        entities: list[tuple[str, _EntityStates]] = []
+        boundary_ts = 0.0
+        for entity_id in dict.fromkeys(entity_ids):
+            if not self._entity_filter(entity_id):
+                continue
+            if (entity := self._entities.get(entity_id)) is None:
+                self.misses += 1
+                return None
+            entities.append((entity_id, entity))
+            boundary_ts = max(boundary_ts, entity.covered_since_ts)
+        if end_time and boundary_ts >= dt_util.utc_to_timestamp(end_time):
+            self.misses += 1
+            return None
+        if start_ts > boundary_ts:
+            self.hits += 1
+            return HistoryCacheSnapshot(
+                None,
+                {
+                    entity_id: _split_states(entity, start_ts, False)
+                    for entity_id, entity in entities
+                },
+            )
+        # The database returns the states up to and including the boundary
+        # so the state at the boundary is known for all entities
+        self.partial_hits += 1
+        return HistoryCacheSnapshot(
+            dt_util.utc_from_timestamp(boundary_ts) + _ONE_MICROSECOND,
+            {
+                entity_id: _split_states(entity, boundary_ts, True)
+                for entity_id, entity in entities
+            },
+        )
+
+
+def _split_states(
+    entity: _EntityStates, cut_ts: float, prev_at_cut: bool
+) -> tuple[CachedState | None, list[CachedState]]:
+    """Return the state before cut_ts and the states after it.
+
+    If prev_at_cut is set, a state at cut_ts is returned as the state before.
+    """
+    states = entity.states
+    after = bisect_right(states, cut_ts, key=_TIMESTAMP)
+    cached = list(islice(states, after, None))
+    before = after if prev_at_cut else bisect_left(states, cut_ts, key=_TIMESTAMP)
+    if before:
+        return states[before - 1], cached
+    if (base := entity.base) is not None and (
+        base[0] <= cut_ts if prev_at_cut else base[0] < cut_ts
+    ):
+        return base, cached
+    return None, cached
+
+
+def get_significant_states_json(
+    hass: HomeAssistant,
+    snapshot: HistoryCacheSnapshot | None,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> tuple[dict[str, json_fragment], float]:
+    """Return the compressed significant states of each entity as json.
+
+    The states come from the snapshot and the database is only queried for
+    the states older than the snapshot. Also returns the last_updated
+    timestamp of the newest state.
+    """
+    db_states: dict[str, bytes] = {}
+    last_time_ts = 0.0
+    if snapshot is None or snapshot.db_end_time:
+        db_states, last_time_ts = history.get_significant_states_json(
+            hass,
+            start_time,
+            snapshot.db_end_time if snapshot else end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    if snapshot is None:
+        return {
+            entity_id: json_fragment(states) for entity_id, states in db_states.items()
+        }, last_time_ts
+
+    start_ts = None
+    if include_start_time_state and not snapshot.db_end_time:
+        start_ts = dt_util.utc_to_timestamp(start_time)
+    end_ts = dt_util.utc_to_timestamp(end_time) if end_time else None
+    attr_cache: dict[int, json_fragment] = {}
+    result: dict[str, json_fragment] = {}
+    for entity_id in dict.fromkeys(entity_ids):
+        entity_db_states = db_states.get(entity_id)
+        compressed_states: list[dict[str, Any]] = []
+        if entity_id in snapshot.entities:
+            prev, cached = snapshot.entities[entity_id]
+            compressed_states = _compressed_states(
+                entity_id,
+                prev,
+                cached,
+                start_ts,
+                end_ts,
+                attr_cache,
+                entity_db_states is not None,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        if not compressed_states:
+            if entity_db_states is not None:
+                result[entity_id] = json_fragment(entity_db_states)
+            continue
+        last_time_ts = max(
+            last_time_ts, compressed_states[-1][COMPRESSED_STATE_LAST_UPDATED]
+        )
+        encoded = json_bytes(compressed_states)
+        if entity_db_states is not None:
+            # The last database state is followed by the cached states
+            encoded = entity_db_states[:-1] + b"," + encoded[1:]
+        result[entity_id] = json_fragment(encoded)
+    return result, last_time_ts
+
+
+def _compressed_states(
+    entity_id: str,
+    prev: CachedState | None,
+    cached: list[CachedState],
+    start_ts: float | None,
+    end_ts: float | None,
+    attr_cache: dict[int, json_fragment],
+    continued: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> list[dict[str, Any]]:
+    """Convert cached states to the compressed state format.
+
+    This must stay in sync with _sorted_states_to_dict in the recorder
+    for the compressed state format.
+    """
+    if end_ts is not None:
+        cached = cached[: bisect_left(cached, end_ts, key=_TIMESTAMP)]
+    domain = split_entity_id(entity_id)[0]
+    if significant_changes_only and domain not in history.SIGNIFICANT_DOMAINS:
+        cached = [
+            row
+            for row in cached
+            if (state := row[1]) is None or state.last_changed == state.last_updated
+        ]
+    # The state at the start time has the start time as last_updated
+    rows: list[tuple[float, State | None, bool]] = []
+    if start_ts is not None and prev is not None:
+        rows.append((start_ts, prev[1], False))
+    include_last_changed = not significant_changes_only
+    rows.extend((ts, state, include_last_changed) for ts, state in cached)
+    if not rows:
+        return []
+
+    if not minimal_response or domain in history.NEED_ATTRIBUTE_DOMAINS:
+        return [
+            _compressed_state(row, attr_cache, not no_attributes, True) for row in rows
+        ]
+
+    # With minimal response we only provide the full state for the
+    # first state and filter out duplicate states after it
+    rows_iter = iter(rows)
+    compressed_states: list[dict[str, Any]] = []
+    if not continued or prev is None:
+        first_row = next(rows_iter)
+        compressed_states.append(
+            _compressed_state(first_row, attr_cache, not no_attributes, False)
+        )
+        prev_state = _state_value(first_row[1])
+    else:
+        prev_state = _state_value(prev[1])
+    compressed_states.extend(
+        {
+            COMPRESSED_STATE_STATE: (prev_state := value),
+            COMPRESSED_STATE_LAST_UPDATED: ts,
+        }
+        for ts, state, _ in rows_iter
+        if (value := _state_value(state)) != prev_state
+    )
+    return compressed_states
+
+
+def _state_value(state: State | None) -> str | None:
+    """Return the recorded state value."""
+    # Removed entities are recorded without a state
+    return None if state is None else state.state
+
+
+def _compressed_state(
+    row: tuple[float, State | None, bool],
+    attr_cache: dict[int, json_fragment],
+    include_attributes: bool,
+    empty_attributes: bool,
+) -> dict[str, Any]:
+    """Convert a cached state to a compressed state."""
+    ts, state, include_last_changed = row
+    comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: _state_value(state)}
+    if include_attributes:
+        comp_state[COMPRESSED_STATE_ATTRIBUTES] = _recorded_attributes(
+            state, attr_cache
+        )
+    elif empty_attributes:
+        comp_state[COMPRESSED_STATE_ATTRIBUTES] = _EMPTY_ATTRIBUTES
+    comp_state[COMPRESSED_STATE_LAST_UPDATED] = ts
+    if (
+        include_last_changed
+        and state is not None
+        and state.last_changed != state.last_updated
+    ):
+        comp_state[COMPRESSED_STATE_LAST_CHANGED] = dt_util.utc_to_timestamp(
+            state.last_changed
+        )
+    return comp_state
+
+
+def _recorded_attributes(
+    state: State | None, attr_cache: dict[int, json_fragment]
+) -> json_fragment:
+    """Return the attributes the recorder stores for a state as json."""
+    if state is None:
+        return _EMPTY_ATTRIBUTES
+    if (encoded := attr_cache.get(id(state.attributes))) is not None:
+        return encoded
+    exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
+    if state_info := state.state_info:
+        exclude_attrs = exclude_attrs | state_info["unrecorded_attributes"]
+    attributes = json_bytes(
+        {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
+    )
+    if len(attributes) > MAX_STATE_ATTRS_BYTES:
+        attributes = b"{}"
+    attr_cache[id(state.attributes)] = encoded = json_fragment(attributes)
+    return encoded
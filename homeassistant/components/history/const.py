@@ -5,3 +5,8 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+HISTORY_CACHE_HORIZON_SECONDS = 86400
+
+# Approximate memory used by the cached states
+MAX_HISTORY_CACHE_BYTES = 32 * 1024 * 1024
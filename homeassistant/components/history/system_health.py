@@ -0,0 +1,32 @@
+"""Provide info to system health."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .cache import HistoryCache
+from .const import DOMAIN
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    cache: HistoryCache | None = hass.data.get(DOMAIN)
+    if cache is None:
+        return {}
+    return {
+        "cached_entities": cache.cached_entities,
+        "cached_states": cache.cached_states,
+        "cache_hits": cache.hits,
+        "cache_partial_hits": cache.partial_hits,
+        "cache_misses": cache.misses,
+    }
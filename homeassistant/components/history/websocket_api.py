@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Iterable, Mapping, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
-from typing import Any, cast
+from typing import Any
 
 import voluptuous as vol
 
@@ -34,11 +34,12 @@ from homeassistant.helpers.event import (
     async_track_point_in_utc_time,
     async_track_state_change_event,
 )
-from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.json import JSON_DUMP, json_fragment
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .cache import HistoryCache, HistoryCacheSnapshot, get_significant_states_json
+from .const import DOMAIN, EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -65,32 +66,28 @@ def async_setup(hass: HomeAssistant) -> None:
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
+    snapshot: HistoryCacheSnapshot | None,
     start_time: dt,
     end_time: dt | None,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states, _ = get_significant_states_json(
+        hass,
+        snapshot,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
     )
+    return JSON_DUMP(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -155,11 +152,13 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    snapshot = await _async_cache_snapshot(hass, entity_ids, start_time, end_time)
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
+            snapshot,
             start_time,
             end_time,
             entity_ids,
@@ -172,7 +171,7 @@ async def ws_get_history_during_period(
 
 
 def _generate_stream_message(
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: Mapping[str, list[dict[str, Any]] | json_fragment],
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -200,7 +199,7 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: Mapping[str, list[dict[str, Any]] | json_fragment],
 ) -> str:
     """Generate a websocket response."""
     return JSON_DUMP(
@@ -213,9 +212,10 @@ def _generate_websocket_response(
 def _generate_historical_response(
     hass: HomeAssistant,
     msg_id: int,
+    snapshot: HistoryCacheSnapshot | None,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
@@ -223,29 +223,17 @@ def _generate_historical_response(
     send_empty: bool,
 ) -> tuple[float, dt | None, str | None]:
     """Generate a historical response."""
-    states = cast(
-        MutableMapping[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
+    states, last_time_ts = get_significant_states_json(
+        hass,
+        snapshot,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
     )
-    last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
 
     if last_time_ts == 0:
         # If we did not send any states ever, we need to send an empty response
@@ -270,7 +258,7 @@ async def _async_send_historical_states(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
@@ -279,10 +267,12 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
+    snapshot = await _async_cache_snapshot(hass, entity_ids, start_time, end_time)
     last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
+        snapshot,
         start_time,
         end_time,
         entity_ids,
@@ -297,6 +287,24 @@ async def _async_send_historical_states(
     return last_time_dt if last_time_ts != 0 else None
 
 
+async def _async_cache_snapshot(
+    hass: HomeAssistant, entity_ids: list[str], start_time: dt, end_time: dt | None
+) -> HistoryCacheSnapshot | None:
+    """Return the cached states for a query if the history cache is enabled."""
+    # The cache follows the format of the states_meta schema, databases
+    # that have not been migrated yet are always queried
+    cache: HistoryCache | None = hass.data.get(DOMAIN)
+    instance = get_instance(hass)
+    if cache is None or not instance.states_meta_manager.active:
+        return None
+    snapshot = cache.async_snapshot(entity_ids, start_time, end_time)
+    if snapshot and snapshot.db_end_time:
+        # The states up to the boundary are read from the database
+        # so they must be committed before it is queried
+        await instance.async_block_till_done()
+    return snapshot
+
+
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
     """Convert a state to a compressed state."""
     comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state.state}
@@ -5,11 +5,14 @@ from collections.abc import Callable, Generator, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import islice
 import logging
 from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -67,6 +70,12 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# Rows fetched and humanified at once when streaming events
+STREAM_CHUNK_ROWS = 2048
+# Contexts remembered when streaming events, the contexts that were
+# referenced least recently are forgotten first
+MAX_STREAM_CONTEXT_LOOKUP = 16384
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -142,33 +151,64 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
-            )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
-            )
+            stmt = self._statement_for_request(session, start_day, end_day)
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
 
+    def stream_events(
+        self, start_day: dt, end_day: dt
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """Get events for a period of time in chunks.
+
+        The rows are fetched with a server side cursor and humanified one
+        chunk at a time so the memory used does not grow with the time window.
+        Unlike get_events, an event is not augmented with a context that was
+        last referenced more than MAX_STREAM_CONTEXT_LOOKUP contexts earlier.
+        """
+        logbook_run = self.logbook_run
+        with session_scope(hass=self.hass, read_only=True) as session:
+            stmt = self._statement_for_request(session, start_day, end_day)
+            result = session.connection().execute(
+                stmt, execution_options={"yield_per": STREAM_CHUNK_ROWS}
+            )
+            for rows in result.partitions():
+                events = self.humanify(rows)
+                # The events of the chunk are decoded, only the contexts
+                # are needed for the next chunks
+                logbook_run.event_cache.clear()
+                _trim_context_lookup(
+                    logbook_run.context_lookup, rows, MAX_STREAM_CONTEXT_LOOKUP
+                )
+                if events:
+                    yield events
+
+    def _statement_for_request(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> StatementLambdaElement:
+        """Generate the logbook statement for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
+            )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
+            )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
     ) -> list[dict[str, str]]:
@@ -183,6 +223,28 @@ class EventProcessor:
         )
 
 
+def _trim_context_lookup(
+    context_lookup: dict[bytes | None, Row | EventAsRow | None],
+    rows: Sequence[Row],
+    max_size: int,
+) -> None:
+    """Forget the least recently referenced contexts above max_size.
+
+    The contexts referenced by the rows are moved to the end of the lookup
+    so the contexts that are still in use are kept.
+    """
+    for row in rows:
+        for context_id_bin in (row.context_id_bin, row.context_parent_id_bin):
+            if context_id_bin and (
+                context_row := context_lookup.pop(context_id_bin, None)
+            ):
+                context_lookup[context_id_bin] = context_row
+    if (excess := len(context_lookup) - max_size) <= 0:
+        return
+    for context_id_bin in list(islice(filter(None, context_lookup), excess)):
+        del context_lookup[context_id_bin]
+
+
 def _humanify(
     rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result,
     ent_reg: er.EntityRegistry,
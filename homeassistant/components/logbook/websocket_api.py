@@ -104,6 +104,7 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
@@ -126,6 +127,7 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
@@ -138,6 +140,7 @@ async def _async_send_historical_events(
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
@@ -159,6 +162,7 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
@@ -167,6 +171,11 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[str, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
+
+    def _send_message(message: str) -> None:
+        """Send a message from the executor."""
+        hass.loop.call_soon_threadsafe(connection.send_message, message)
+
     return await get_instance(hass).async_add_executor_job(
         _ws_stream_get_events,
         msg_id,
@@ -175,6 +184,7 @@ async def _async_get_ws_stream_events(
         formatter,
         event_processor,
         partial,
+        _send_message,
     )
 
 
@@ -196,9 +206,21 @@ def _ws_stream_get_events(
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
+    send_message: Callable[[str], None],
 ) -> tuple[str, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    """Fetch events and convert them to json in the executor.
+
+    The events are fetched in chunks, all chunks except the last one are
+    sent as partial messages as soon as they are ready. The last chunk is
+    returned so the caller can decide if it needs to be sent.
+    """
+    events: list[dict[str, Any]] = []
+    for chunk in event_processor.stream_events(start_day, end_day):
+        if events:
+            message = _generate_stream_message(events, start_day, end_day)
+            message["partial"] = True
+            send_message(JSON_DUMP(formatter(msg_id, message)))
+        events = chunk
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
@@ -436,11 +458,19 @@ def _ws_formatted_get_events(
     end_time: dt,
     event_processor: EventProcessor,
 ) -> str:
-    """Fetch events and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id, event_processor.get_events(start_time, end_time)
+    """Fetch events and convert them to json in the executor.
+
+    The events are fetched and serialized in chunks so only one chunk
+    of events is in memory at a time.
+    """
+    return messages.construct_result_message(
+        msg_id,
+        "["
+        + ",".join(
+            JSON_DUMP(events)[1:-1]
+            for events in event_processor.stream_events(start_time, end_time)
         )
+        + "]",
     )
 
 
@@ -3,22 +3,36 @@ from __future__ import annotations
 
 import logging
 import re
+from typing import cast
 
 import voluptuous as vol
 
-from homeassistant.const import EVENT_LOGGING_CHANGED  # noqa: F401
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_LOGGING_CHANGED  # noqa: F401
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import state_trace
+from homeassistant.util.json import JsonValueType
 
 from . import websocket_api
 from .const import (
+    ATTR_CLEAR,
+    ATTR_INTEGRATION,
     ATTR_LEVEL,
     DOMAIN,
     LOGGER_DEFAULT,
     LOGGER_FILTERS,
     LOGGER_LOGS,
     LOGSEVERITY,
+    SERVICE_DISABLE_STATE_TRACE,
+    SERVICE_ENABLE_STATE_TRACE,
+    SERVICE_GET_STATE_TRACE,
     SERVICE_SET_DEFAULT_LEVEL,
     SERVICE_SET_LEVEL,
 )
@@ -33,6 +47,15 @@ _VALID_LOG_LEVEL = vol.All(vol.Upper, vol.In(LOGSEVERITY), LOGSEVERITY.__getitem
 
 SERVICE_SET_DEFAULT_LEVEL_SCHEMA = vol.Schema({ATTR_LEVEL: _VALID_LOG_LEVEL})
 SERVICE_SET_LEVEL_SCHEMA = vol.Schema({cv.string: _VALID_LOG_LEVEL})
+SERVICE_STATE_TRACE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional(ATTR_INTEGRATION): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+SERVICE_GET_STATE_TRACE_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_CLEAR, default=False): cv.boolean}
+)
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -97,6 +120,40 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         schema=SERVICE_SET_LEVEL_SCHEMA,
     )
 
+    @callback
+    def async_state_trace_service_handler(service: ServiceCall) -> None:
+        """Handle state trace services."""
+        entity_ids = service.data.get(ATTR_ENTITY_ID)
+        integrations = service.data.get(ATTR_INTEGRATION)
+        if service.service == SERVICE_ENABLE_STATE_TRACE:
+            state_trace.enable(entity_ids or (), integrations or ())
+        else:
+            state_trace.disable(entity_ids, integrations)
+
+    @callback
+    def async_get_state_trace(service: ServiceCall) -> ServiceResponse:
+        """Return the recorded state trace points."""
+        records = state_trace.records()
+        if service.data[ATTR_CLEAR]:
+            state_trace.clear()
+        return {"records": cast(list[JsonValueType], records)}
+
+    for service in (SERVICE_ENABLE_STATE_TRACE, SERVICE_DISABLE_STATE_TRACE):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            async_state_trace_service_handler,
+            schema=SERVICE_STATE_TRACE_SCHEMA,
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_STATE_TRACE,
+        async_get_state_trace,
+        schema=SERVICE_GET_STATE_TRACE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
     return True
 
 
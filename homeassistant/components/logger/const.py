@@ -5,6 +5,9 @@ DOMAIN = "logger"
 
 SERVICE_SET_DEFAULT_LEVEL = "set_default_level"
 SERVICE_SET_LEVEL = "set_level"
+SERVICE_ENABLE_STATE_TRACE = "enable_state_trace"
+SERVICE_DISABLE_STATE_TRACE = "disable_state_trace"
+SERVICE_GET_STATE_TRACE = "get_state_trace"
 
 LOGSEVERITY_NOTSET = "NOTSET"
 LOGSEVERITY_DEBUG = "DEBUG"
@@ -34,6 +37,8 @@ LOGGER_LOGS = "logs"
 LOGGER_FILTERS = "filters"
 
 ATTR_LEVEL = "level"
+ATTR_INTEGRATION = "integration"
+ATTR_CLEAR = "clear"
 
 STORAGE_KEY = "core.logger"
 STORAGE_LOG_KEY = "logs"
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
 from dataclasses import dataclass
-from functools import lru_cache
+from datetime import datetime
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -93,6 +94,8 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+# Maximum number of received messages handled in a single event loop iteration
+MAX_MESSAGES_PER_BATCH = 1000
 
 MQTT_ENTRIES_NAMING_BLOG_URL = (
     "https://developers.home-assistant.io/blog/2023-057-21-change-naming-mqtt-entities/"
@@ -232,7 +235,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -304,6 +306,112 @@ def _is_simple_match(topic: str) -> bool:
     return not ("+" in topic or "#" in topic)
 
 
+class _TopicTrieNode:
+    """A single topic level in a subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Index of wildcard subscriptions keyed by topic level.
+
+    Every level of a subscription's topic filter maps to a node, with the
+    wildcards `+` and `#` stored as regular children. Matching a topic walks
+    the trie level by level, so the cost scales with the depth of the topic
+    instead of the number of subscriptions.
+    """
+
+    __slots__ = ("_root", "_count")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions in the trie."""
+        return self._count
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions in the trie."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._count += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie and prune empty nodes.
+
+        Raises KeyError or ValueError if the subscription is not in the trie.
+        """
+        path: list[tuple[_TopicTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        self._count -= 1
+        for parent, level in reversed(path):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def has_topic_filter(self, topic_filter: str) -> bool:
+        """Return if a subscription exists for this exact topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching the topic."""
+        matches: list[Subscription] = []
+        # Topics starting with $ are not matched by wildcards on the first level
+        wildcards = not topic.startswith("$")
+        nodes = [self._root]
+        for level in topic.split("/"):
+            next_nodes: list[_TopicTrieNode] = []
+            for node in nodes:
+                if not (children := node.children):
+                    continue
+                if wildcards:
+                    if (multi := children.get("#")) is not None:
+                        matches.extend(multi.subscriptions)
+                    if (single := children.get("+")) is not None:
+                        next_nodes.append(single)
+                if (exact := children.get(level)) is not None:
+                    next_nodes.append(exact)
+            if not next_nodes:
+                return matches
+            nodes = next_nodes
+            wildcards = True
+        for node in nodes:
+            matches.extend(node.subscriptions)
+            # A `#` filter also matches the parent level, `a/#` matches `a`
+            if (multi := node.children.get("#")) is not None:
+                matches.extend(multi.subscriptions)
+        return matches
+
+
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -396,7 +504,14 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
+        # Bumped whenever the tracked subscriptions change, so a batch of
+        # received messages knows when its cached topic matches are stale.
+        self._subscriptions_version = 0
+        # Messages received by the paho thread waiting to be handled by the
+        # event loop. A single wakeup is scheduled for all pending messages.
+        self._pending_messages: deque[mqtt.MQTTMessage] = deque()
+        self._pending_messages_scheduled = False
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -499,8 +614,9 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions
+            or self._wildcard_subscriptions.has_topic_filter(topic)
         )
 
     async def async_publish(
@@ -581,31 +697,28 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
+        self._subscriptions_version += 1
         if _is_simple_match(subscription.topic):
             self._simple_subscriptions.setdefault(subscription.topic, []).append(
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
+        self._subscriptions_version += 1
         topic = subscription.topic
         try:
             if _is_simple_match(topic):
@@ -649,11 +762,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -663,7 +773,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -822,39 +931,83 @@ class MQTT:
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
         """Message received callback."""
-        self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
+        self._pending_messages.append(msg)
+        if not self._pending_messages_scheduled:
+            self._pending_messages_scheduled = True
+            self.loop.call_soon_threadsafe(self._mqtt_handle_pending_messages)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions.match(topic))
         return subscriptions
 
+    @callback
+    def _mqtt_handle_pending_messages(self) -> None:
+        """Handle the messages queued by the paho thread."""
+        # Reset the flag before draining, a message appended by the paho
+        # thread after this point schedules a new wakeup.
+        self._pending_messages_scheduled = False
+        pending = self._pending_messages
+        msgs = [
+            pending.popleft() for _ in range(min(len(pending), MAX_MESSAGES_PER_BATCH))
+        ]
+        if pending:
+            # Yield to the event loop before handling the rest of a burst
+            self.loop.call_soon(self._mqtt_handle_pending_messages)
+        self._mqtt_handle_messages(msgs)
+
     @callback
     def _mqtt_handle_message(self, msg: mqtt.MQTTMessage) -> None:
-        _LOGGER.debug(
-            "Received%s message on %s (qos=%s): %s",
-            " retained" if msg.retain else "",
-            msg.topic,
-            msg.qos,
-            msg.payload[0:8192],
-        )
-        timestamp = dt_util.utcnow()
+        self._mqtt_handle_messages((msg,))
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+    @callback
+    def _mqtt_handle_messages(self, msgs: Iterable[mqtt.MQTTMessage]) -> None:
+        """Handle a batch of received messages.
 
+        The timestamp and the subscription lookups are shared by all messages
+        in the batch.
+        """
+        timestamp = dt_util.utcnow()
+        matches: dict[str, list[Subscription]] = {}
+        subscriptions_version = self._subscriptions_version
+
+        for msg in msgs:
+            topic = msg.topic
+            _LOGGER.debug(
+                "Received%s message on %s (qos=%s): %s",
+                " retained" if msg.retain else "",
+                topic,
+                msg.qos,
+                msg.payload[0:8192],
+            )
+            if subscriptions_version != self._subscriptions_version:
+                # A callback changed the subscriptions during this batch
+                matches.clear()
+                subscriptions_version = self._subscriptions_version
+            if (subscriptions := matches.get(topic)) is None:
+                subscriptions = matches[topic] = self._matching_subscriptions(topic)
+            self._mqtt_dispatch_message(msg, topic, subscriptions, timestamp)
+
+    @callback
+    def _mqtt_dispatch_message(
+        self,
+        msg: mqtt.MQTTMessage,
+        topic: str,
+        subscriptions: list[Subscription],
+        timestamp: datetime,
+    ) -> None:
+        """Run the subscription callbacks for a received message."""
         for subscription in subscriptions:
             if msg.retain:
                 retained_topics = self._retained_topics.setdefault(subscription, set())
                 # Skip if the subscription already received a retained message
-                if msg.topic in retained_topics:
+                if topic in retained_topics:
                     continue
                 # Remember the subscription had an initial retained message
-                self._retained_topics[subscription].add(msg.topic)
+                self._retained_topics[subscription].add(topic)
 
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
@@ -864,7 +1017,7 @@ class MQTT:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
-                        msg.topic,
+                        topic,
                         subscription.encoding,
                         subscription.job,
                     )
@@ -872,7 +1025,7 @@ class MQTT:
             self.hass.async_run_hass_job(
                 subscription.job,
                 ReceiveMessage(
-                    msg.topic,
+                    topic,
                     payload,
                     msg.qos,
                     msg.retain,
@@ -976,13 +1129,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -0,0 +1,192 @@
+"""Bulk insert of States and Events rows for the recorder event session."""
+from __future__ import annotations
+
+from typing import Any, cast
+
+from sqlalchemy import Table, bindparam, insert, update
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, State
+import homeassistant.util.dt as dt_util
+
+from .db_schema import (
+    EVENT_ORIGIN_TO_IDX,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from .models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+STATES_TABLE = cast(Table, States.__table__)
+EVENTS_TABLE = cast(Table, Events.__table__)
+
+
+class PendingStatesRow:
+    """A States row waiting to be written by the next bulk insert.
+
+    Rows that reference StatesMeta or StateAttributes which are still
+    pending in the session, or the previous state of the same entity which
+    is pending in the same batch, keep a reference that is resolved to an
+    id right before the insert.
+    """
+
+    __slots__ = ("params", "state_id", "old_state", "states_meta", "state_attributes")
+
+    def __init__(self, params: dict[str, Any]) -> None:
+        """Initialize a pending States row."""
+        self.params = params
+        self.state_id: int | None = None
+        self.old_state: PendingStatesRow | None = None
+        self.states_meta: StatesMeta | None = None
+        self.state_attributes: StateAttributes | None = None
+
+    @staticmethod
+    def from_event(event: Event) -> PendingStatesRow:
+        """Create a pending row from a state_changed event.
+
+        This must stay in sync with States.from_event.
+        """
+        state: State | None = event.data.get("new_state")
+        context = event.context
+        params: dict[str, Any] = {
+            "entity_id": event.data["entity_id"],
+            "state": "",
+            "last_updated_ts": None,
+            "last_changed_ts": None,
+            "old_state_id": None,
+            "attributes_id": None,
+            "metadata_id": None,
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+        }
+        # None state means the state was removed from the state machine
+        if state is None:
+            params["last_updated_ts"] = dt_util.utc_to_timestamp(event.time_fired)
+            return PendingStatesRow(params)
+
+        params["state"] = state.state
+        params["last_updated_ts"] = dt_util.utc_to_timestamp(state.last_updated)
+        if state.last_updated != state.last_changed:
+            params["last_changed_ts"] = dt_util.utc_to_timestamp(state.last_changed)
+        return PendingStatesRow(params)
+
+
+class PendingEventsRow:
+    """An Events row waiting to be written by the next bulk insert."""
+
+    __slots__ = ("params", "event_type", "event_data")
+
+    def __init__(self, params: dict[str, Any]) -> None:
+        """Initialize a pending Events row."""
+        self.params = params
+        self.event_type: EventTypes | None = None
+        self.event_data: EventData | None = None
+
+    @staticmethod
+    def from_event(event: Event) -> PendingEventsRow:
+        """Create a pending row from a native event.
+
+        This must stay in sync with Events.from_event.
+        """
+        context = event.context
+        return PendingEventsRow(
+            {
+                "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+                "time_fired_ts": dt_util.utc_to_timestamp(event.time_fired),
+                "context_id_bin": ulid_to_bytes_or_none(context.id),
+                "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+                "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+                "event_type_id": None,
+                "data_id": None,
+            }
+        )
+
+
+class BulkInsertWriter:
+    """Collect a commit interval's worth of rows and write them in bulk.
+
+    The rows are written with a single executemany INSERT per table instead
+    of flushing one ORM object per event through the unit of work. The
+    states are inserted with RETURNING so the state_ids are known without
+    a SELECT, which means the writer can only be used with dialects that
+    support RETURNING for executemany.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk insert writer."""
+        self.states: list[PendingStatesRow] = []
+        self.events: list[PendingEventsRow] = []
+
+    def __bool__(self) -> bool:
+        """Return if there are rows waiting to be written."""
+        return bool(self.states or self.events)
+
+    def add_state(self, row: PendingStatesRow) -> None:
+        """Add a States row to the next bulk insert."""
+        self.states.append(row)
+
+    def add_event(self, row: PendingEventsRow) -> None:
+        """Add an Events row to the next bulk insert."""
+        self.events.append(row)
+
+    def reset(self) -> None:
+        """Drop all rows after the session has been rolled back."""
+        self.states.clear()
+        self.events.clear()
+
+    def write(self, session: Session) -> None:
+        """Write the pending rows.
+
+        The session must be flushed before calling this so the pending
+        StatesMeta, StateAttributes, EventTypes and EventData rows that
+        the rows reference have their ids assigned.
+        """
+        connection = session.connection()
+        if events := self.events:
+            params_list: list[dict[str, Any]] = []
+            for event_row in events:
+                params = event_row.params
+                if (event_type := event_row.event_type) is not None:
+                    params["event_type_id"] = event_type.event_type_id
+                if (event_data := event_row.event_data) is not None:
+                    params["data_id"] = event_data.data_id
+                params_list.append(params)
+            connection.execute(insert(EVENTS_TABLE), params_list)
+
+        if states := self.states:
+            params_list = []
+            for state_row in states:
+                params = state_row.params
+                if (states_meta := state_row.states_meta) is not None:
+                    params["metadata_id"] = states_meta.metadata_id
+                if (state_attributes := state_row.state_attributes) is not None:
+                    params["attributes_id"] = state_attributes.attributes_id
+                params_list.append(params)
+            result = connection.execute(
+                insert(STATES_TABLE).returning(
+                    STATES_TABLE.c.state_id, sort_by_parameter_order=True
+                ),
+                params_list,
+            )
+            for state_row, state_id in zip(states, result.scalars()):
+                state_row.state_id = state_id
+            # The old_state_id of a state that replaced a state from the same
+            # batch is only known after the insert
+            if old_state_links := [
+                {"b_state_id": state_row.state_id, "b_old_state_id": old.state_id}
+                for state_row in states
+                if (old := state_row.old_state) is not None
+            ]:
+                connection.execute(
+                    update(STATES_TABLE)
+                    .where(STATES_TABLE.c.state_id == bindparam("b_state_id"))
+                    .values(old_state_id=bindparam("b_old_state_id")),
+                    old_state_links,
+                )
+
+        self.reset()
@@ -0,0 +1,104 @@
+"""Compile short term statistics of many entities from flat columns."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+import math
+
+from homeassistant.core import State
+
+from .models import LazyState
+
+
+def _timestamp_to_microseconds(timestamp: float) -> int:
+    """Convert a POSIX timestamp to exact microseconds since the epoch.
+
+    The timestamp is rounded to microseconds the same way
+    datetime.fromtimestamp rounds it, which is how the
+    last_updated datetime of a LazyState is created.
+    """
+    fraction, seconds = math.modf(timestamp)
+    return int(seconds) * 1_000_000 + round(fraction * 1e6)
+
+
+class ColumnarStates:
+    """Float states of many statistics packed into flat columns.
+
+    The states of all statistics are appended to the same columns and
+    the offsets of the first state of each statistic are kept. The
+    last_updated of each state is stored as exact integer microseconds
+    so compiling does not create a datetime or timedelta per state.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.statistic_ids: list[str] = []
+        self._offsets: list[int] = []
+        self._values: list[float] = []
+        self._timestamps: list[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of statistics."""
+        return len(self.statistic_ids)
+
+    def add(self, statistic_id: str, fstates: Iterable[tuple[float, State]]) -> None:
+        """Add the float states of a statistic ordered by last_updated."""
+        values = self._values
+        offset = len(values)
+        timestamps = self._timestamps
+        for fstate, state in fstates:
+            values.append(fstate)
+            # Avoid creating a datetime for each state loaded from the database
+            timestamps.append(
+                _timestamp_to_microseconds(
+                    state.last_updated_timestamp
+                    if type(state) is LazyState  # pylint: disable=unidiomatic-typecheck
+                    else state.last_updated.timestamp()
+                )
+            )
+        if len(values) == offset:
+            return
+        self.statistic_ids.append(statistic_id)
+        self._offsets.append(offset)
+
+    def compile(
+        self, start: datetime, end: datetime
+    ) -> dict[str, tuple[float, float, float]]:
+        """Compile the time weighted mean, min and max of each statistic.
+
+        The result is identical to weighting each state by the duration
+        in seconds until the next state change, or until the end of the
+        period for the last state, and accumulating the weighted values
+        in order. States which were last updated before the start of the
+        period are weighted from the start of the period.
+        """
+        start_us = _timestamp_to_microseconds(start.timestamp())
+        end_us = _timestamp_to_microseconds(end.timestamp())
+        values = self._values
+        timestamps = self._timestamps
+        offsets = self._offsets
+        compiled: dict[str, tuple[float, float, float]] = {}
+        for statistic_id, first, last in zip(
+            self.statistic_ids, offsets, [*offsets[1:], len(values)]
+        ):
+            period_start_us = prev_us = max(timestamps[first], start_us)
+            prev_value = values[first]
+            accumulated = 0.0
+            for index in range(first + 1, last):
+                state_us = max(timestamps[index], start_us)
+                # The durations are converted from exact integer microseconds
+                # the same way timedelta.total_seconds does
+                accumulated += prev_value * ((state_us - prev_us) / 1e6)
+                prev_value = values[index]
+                prev_us = state_us
+            accumulated += prev_value * ((end_us - prev_us) / 1e6)
+            # If the only state change happened at the exact end of the period
+            # there is no meaningful average, use 0.0 like a zero duration
+            period_seconds = (end_us - period_start_us) / 1e6
+            statistic_values = values[first:last]
+            compiled[statistic_id] = (
+                accumulated / period_seconds if period_seconds else 0.0,
+                min(statistic_values),
+                max(statistic_values),
+            )
+        return compiled
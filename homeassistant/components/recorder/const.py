@@ -12,6 +12,9 @@ from homeassistant.const import (
 from homeassistant.helpers.json import JSON_DUMP  # noqa: F401
 
 DATA_INSTANCE = "recorder_instance"
+# Sent with the purge_before datetime and the filter of the purged entities,
+# or None for all entities, when states have been purged from the database
+SIGNAL_STATES_PURGED = "recorder_states_purged"
 SQLITE_URL_PREFIX = "sqlite://"
 MARIADB_URL_PREFIX = "mariadb://"
 MARIADB_PYMYSQL_URL_PREFIX = "mariadb+pymysql://"
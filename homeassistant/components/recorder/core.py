@@ -41,6 +41,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .bulk_insert import BulkInsertWriter, PendingEventsRow, PendingStatesRow
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
@@ -150,6 +151,10 @@ KEEP_ALIVE_TASK = KeepAliveTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
 
+# The maximum number of tasks to drain from the queue
+# before resolving their ids with one query per table
+MAX_TASKS_PER_DRAIN = 1000
+
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
@@ -178,6 +183,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        bulk_writes: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -215,6 +221,18 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Write States and Events with bulk inserts instead of ORM objects
+        # if the database supports it, see _setup_connection
+        self.bulk_writes = bulk_writes
+        self._bulk_writer: BulkInsertWriter | None = None
+        # Tasks that have been drained from the queue but not processed yet
+        self._drained_tasks = 0
+        # Ids resolved by the batched preload since the last commit
+        # and the number of queries it took to resolve them
+        self._preloaded_ids = 0
+        self._preload_queries = 0
+        # Total number of SELECTs the batched preload has saved
+        self.preload_queries_saved = 0
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -253,7 +271,7 @@ class Recorder(threading.Thread):
     @property
     def backlog(self) -> int:
         """Return the number of items in the recorder backlog."""
-        return self._queue.qsize()
+        return self._queue.qsize() + self._drained_tasks
 
     @property
     def dialect_name(self) -> SupportedDialect | None:
@@ -860,9 +878,10 @@ class Recorder(threading.Thread):
         startup_tasks: list[RecorderTask] = []
         while not queue_.empty() and (task := queue_.get_nowait()):
             startup_tasks.append(task)
-        self._pre_process_startup_tasks(startup_tasks)
+        self._pre_process_tasks(startup_tasks)
         for task in startup_tasks:
             self._guarded_process_one_task_or_recover(task)
+        self._clear_serialized()
 
         # Clear startup tasks since this thread runs forever
         # and we don't want to hold them in memory
@@ -870,16 +889,58 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_recover(queue_.get())
+            task = queue_.get()
+            if queue_.empty():
+                self._guarded_process_one_task_or_recover(task)
+                continue
+            # Drain everything that is already waiting so the ids of all
+            # the events can be resolved with one query per table instead
+            # of one query per cache miss.
+            tasks = [task]
+            while len(tasks) < MAX_TASKS_PER_DRAIN and not queue_.empty():
+                tasks.append(queue_.get_nowait())
+            self._process_drained_tasks(tasks)
+
+    def _process_drained_tasks(self, tasks: list[RecorderTask]) -> None:
+        """Preload the ids of tasks drained from the queue and process them."""
+        self._drained_tasks = len(tasks)
+        self._guarded_pre_process_tasks(tasks)
+        for task in tasks:
+            self._drained_tasks -= 1
+            self._guarded_process_one_task_or_recover(task)
+            if self.stop_requested:
+                break
+        self._drained_tasks = 0
+        self._clear_serialized()
+
+    def _clear_serialized(self) -> None:
+        """Forget the event data and attributes serialized by the preload."""
+        self.event_data_manager.clear_serialized()
+        self.state_attributes_manager.clear_serialized()
 
-    def _pre_process_startup_tasks(self, startup_tasks: list[RecorderTask]) -> None:
-        """Pre process startup tasks."""
+    def _guarded_pre_process_tasks(self, tasks: list[RecorderTask]) -> None:
+        """Pre process tasks, guarding against database errors.
+
+        If the preload fails the ids are resolved one by one when
+        the events are processed.
+        """
+        if not self.enabled or self.event_session is None:
+            return
+        try:
+            self._pre_process_tasks(tasks)
+        except SQLAlchemyError as err:
+            _LOGGER.debug(
+                "Error while preloading ids for %s tasks: %s", len(tasks), err
+            )
+
+    def _pre_process_tasks(self, tasks: list[RecorderTask]) -> None:
+        """Pre process tasks."""
         # Prime all the state_attributes and event_data caches
         # before we start processing events
         state_change_events: list[Event] = []
         non_state_change_events: list[Event] = []
 
-        for task in startup_tasks:
+        for task in tasks:
             if isinstance(task, EventTask):
                 event_ = task.event
                 if event_.event_type == EVENT_STATE_CHANGED:
@@ -889,10 +950,16 @@ class Recorder(threading.Thread):
 
         assert self.event_session is not None
         session = self.event_session
-        self.event_data_manager.load(non_state_change_events, session)
-        self.event_type_manager.load(non_state_change_events, session)
-        self.states_meta_manager.load(state_change_events, session)
-        self.state_attributes_manager.load(state_change_events, session)
+        max_bind_vars = self.max_bind_vars
+        for loaded in (
+            self.event_data_manager.load(non_state_change_events, session),
+            self.event_type_manager.load(non_state_change_events, session),
+            self.states_meta_manager.load(state_change_events, session),
+            self.state_attributes_manager.load(state_change_events, session),
+        ):
+            if loaded:
+                self._preloaded_ids += loaded
+                self._preload_queries += -(-loaded // max_bind_vars)
 
     def _guarded_process_one_task_or_recover(self, task: RecorderTask) -> None:
         """Process a task, guarding against exceptions to ensure the loop does not collapse."""
@@ -1026,6 +1093,11 @@ class Recorder(threading.Thread):
 
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
+        if self._bulk_writer is not None:
+            self._process_non_state_changed_event_into_bulk_writer(
+                event, self._bulk_writer
+            )
+            return
         session = self.event_session
         assert session is not None
         dbevent = Events.from_event(event)
@@ -1070,8 +1142,59 @@ class Recorder(threading.Thread):
 
         self._add_to_session(session, dbevent)
 
+    def _process_non_state_changed_event_into_bulk_writer(
+        self, event: Event, bulk_writer: BulkInsertWriter
+    ) -> None:
+        """Process any event except state changed into the bulk insert writer."""
+        session = self.event_session
+        assert session is not None
+        row = PendingEventsRow.from_event(event)
+
+        # Map the event_type to the EventTypes table
+        event_type_manager = self.event_type_manager
+        if pending_event_types := event_type_manager.get_pending(event.event_type):
+            row.event_type = pending_event_types
+        elif event_type_id := event_type_manager.get(event.event_type, session, True):
+            row.params["event_type_id"] = event_type_id
+        else:
+            event_types = EventTypes(event_type=event.event_type)
+            event_type_manager.add_pending(event_types)
+            self._add_to_session(session, event_types)
+            row.event_type = event_types
+
+        if event.data:
+            event_data_manager = self.event_data_manager
+            if not (
+                shared_data_bytes := event_data_manager.serialize_from_event(event)
+            ):
+                return
+
+            # Map the event data to the EventData table
+            shared_data = shared_data_bytes.decode("utf-8")
+            # Matching attributes found in the pending commit
+            if pending_event_data := event_data_manager.get_pending(shared_data):
+                row.event_data = pending_event_data
+            # Matching attributes id found in the cache
+            elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
+                (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
+                and (data_id := event_data_manager.get(shared_data, hash_, session))
+            ):
+                row.params["data_id"] = data_id
+            else:
+                # No matching attributes found, save them in the DB
+                dbevent_data = EventData(shared_data=shared_data, hash=hash_)
+                event_data_manager.add_pending(dbevent_data)
+                self._add_to_session(session, dbevent_data)
+                row.event_data = dbevent_data
+
+        self._event_session_has_pending_writes = True
+        bulk_writer.add_event(row)
+
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
+        if self._bulk_writer is not None:
+            self._process_state_changed_event_into_bulk_writer(event, self._bulk_writer)
+            return
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
         entity_removed = not event.data.get("new_state")
@@ -1143,6 +1266,83 @@ class Recorder(threading.Thread):
 
         self._add_to_session(session, dbstate)
 
+    def _process_state_changed_event_into_bulk_writer(
+        self, event: Event, bulk_writer: BulkInsertWriter
+    ) -> None:
+        """Process a state_changed event into the bulk insert writer."""
+        state_attributes_manager = self.state_attributes_manager
+        states_meta_manager = self.states_meta_manager
+        entity_removed = not event.data.get("new_state")
+        entity_id = event.data["entity_id"]
+
+        row = PendingStatesRow.from_event(event)
+        params = row.params
+
+        states_manager = self.states_manager
+        if old_state := states_manager.pop_pending_row(entity_id):
+            row.old_state = old_state
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            params["old_state_id"] = old_state_id
+        if entity_removed:
+            params["state"] = None
+
+        if states_meta_manager.active:
+            params["entity_id"] = None
+
+        if entity_id is None or not (
+            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
+        ):
+            return
+
+        assert self.event_session is not None
+        session = self.event_session
+        # Map the entity_id to the StatesMeta table
+        if pending_states_meta := states_meta_manager.get_pending(entity_id):
+            row.states_meta = pending_states_meta
+        elif metadata_id := states_meta_manager.get(entity_id, session, True):
+            params["metadata_id"] = metadata_id
+        elif states_meta_manager.active and entity_removed:
+            # If the entity was removed, we don't need to add it to the
+            # StatesMeta table or record it in the pending commit
+            # if it does not have a metadata_id allocated to it as
+            # it either never existed or was just renamed.
+            return
+        else:
+            states_meta = StatesMeta(entity_id=entity_id)
+            states_meta_manager.add_pending(states_meta)
+            self._add_to_session(session, states_meta)
+            row.states_meta = states_meta
+
+        # Map the event data to the StateAttributes table
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
+        # Matching attributes found in the pending commit
+        if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
+            row.state_attributes = pending_event_data
+        # Matching attributes id found in the cache
+        elif (
+            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
+        ) or (
+            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+            and (
+                attributes_id := state_attributes_manager.get(
+                    shared_attrs, hash_, session
+                )
+            )
+        ):
+            params["attributes_id"] = attributes_id
+        else:
+            # No matching attributes found, save them in the DB
+            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+            state_attributes_manager.add_pending(dbstate_attributes)
+            self._add_to_session(session, dbstate_attributes)
+            row.state_attributes = dbstate_attributes
+
+        # Only rows that are written get a state_id to link the next state to
+        if not entity_removed:
+            states_manager.add_pending_row(entity_id, row)
+        self._event_session_has_pending_writes = True
+        bulk_writer.add_state(row)
+
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -1180,6 +1380,12 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._bulk_writer:
+            # The bulk inserted rows refer to the ids of the
+            # pending StatesMeta, StateAttributes, EventTypes
+            # and EventData so they must be flushed first.
+            session.flush()
+            self._bulk_writer.write(session)
         session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1192,6 +1398,18 @@ class Recorder(threading.Thread):
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
 
+        if preloaded_ids := self._preloaded_ids:
+            queries_saved = preloaded_ids - self._preload_queries
+            self.preload_queries_saved += queries_saved
+            _LOGGER.debug(
+                "Resolved %s ids with %s queries, saved %s queries",
+                preloaded_ids,
+                self._preload_queries,
+                queries_saved,
+            )
+            self._preloaded_ids = 0
+            self._preload_queries = 0
+
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
         # do it after EXPIRE_AFTER_COMMITS commits
@@ -1218,6 +1436,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self._bulk_writer:
+            self._bulk_writer.reset()
 
         if not self.event_session:
             return
@@ -1276,7 +1496,7 @@ class Recorder(threading.Thread):
 
     async def async_block_till_done(self) -> None:
         """Async version of block_till_done."""
-        if self._queue.empty() and not self._event_session_has_pending_writes:
+        if not self.backlog and not self._event_session_has_pending_writes:
             return
         event = asyncio.Event()
         self.queue_task(SynchronizeTask(event))
@@ -1404,6 +1624,17 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
+        if self.bulk_writes:
+            # The capabilities of the dialect are only known after
+            # the first connection has been made by create_all.
+            if self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+                self._bulk_writer = BulkInsertWriter()
+            else:
+                _LOGGER.warning(
+                    "The %s database does not support RETURNING for bulk inserts, "
+                    "bulk writes are disabled",
+                    self.engine.dialect.name,
+                )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
@@ -3,11 +3,13 @@ from __future__ import annotations
 
 from collections.abc import MutableMapping
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED
 from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.json import json_bytes
 
 from ... import recorder
 from ..filters import Filters
@@ -16,6 +18,7 @@ from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_json as _modern_get_significant_states_json,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -27,6 +30,7 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_json",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +119,63 @@ def get_significant_states(
     )
 
 
+def get_significant_states_json(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> tuple[dict[str, bytes], float]:
+    """Return the compressed significant states of each entity as json.
+
+    Also returns the last_updated timestamp of the newest state.
+    """
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_json(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    states = cast(
+        MutableMapping[str, list[dict[str, Any]]],
+        _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+    last_time_ts = 0.0
+    for state_list in states.values():
+        if (
+            state_list
+            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
+            > last_time_ts
+        ):
+            last_time_ts = cast(float, state_last_time)
+    return {
+        entity_id: json_bytes(state_list) for entity_id, state_list in states.items()
+    }, last_time_ts
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1,12 +1,15 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+from array import array
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby, islice, repeat
 from operator import itemgetter
 from typing import Any, cast
 
+import numpy as np
+import orjson
 from sqlalchemy import (
     CompoundSelect,
     Select,
@@ -20,9 +23,16 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.helpers.json import json_bytes
 import homeassistant.util.dt as dt_util
 
 from ... import recorder
@@ -31,6 +41,7 @@ from ..filters import Filters
 from ..models import (
     LazyState,
     datetime_to_timestamp_or_none,
+    decode_attributes_from_source,
     extract_metadata_ids,
     process_timestamp,
     row_to_compressed_state,
@@ -49,6 +60,14 @@ _FIELD_MAP = {
     "last_updated_ts": 2,
 }
 
+_STATE_START = b'{"' + COMPRESSED_STATE_STATE.encode() + b'":'
+_ATTRIBUTES_KEY = b',"' + COMPRESSED_STATE_ATTRIBUTES.encode() + b'":'
+_LAST_UPDATED_KEY = b',"' + COMPRESSED_STATE_LAST_UPDATED.encode() + b'":'
+_LAST_CHANGED_KEY = b',"' + COMPRESSED_STATE_LAST_CHANGED.encode() + b'":'
+_EMPTY_ATTRIBUTES_PART = _ATTRIBUTES_KEY + b"{}"
+_STATE_END = b"},"
+_COLUMNS_CHUNK_SIZE = 10000
+
 
 def _stmt_and_join_attributes(
     no_attributes: bool, include_last_changed: bool
@@ -209,6 +228,94 @@ def get_significant_states_with_session(
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
+    if not (
+        prepared := _prepare_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = prepared
+    assert entity_ids is not None
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_json(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> tuple[dict[str, bytes], float]:
+    """Return significant states in the compressed state format as json.
+
+    The states of each entity are returned as json bytes that are the
+    same as serializing the compressed states returned by
+    get_significant_states, along with the last_updated timestamp of the
+    newest state. The rows are read into columns and the json is written
+    straight from the columns instead of creating a dict for each row.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            prepared := _prepare_significant_states_stmt(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return {}, 0.0
+        stmt, entity_id_to_metadata_id, start_time_ts = prepared
+        assert entity_ids is not None
+        # Long time windows are fetched in partitions since the
+        # rows are only needed until they are added to the columns
+        columns = _HistoryColumns.from_rows(
+            execute_stmt_lambda_element(
+                session, stmt, start_time, end_time, orm_rows=False
+            ),
+            start_time_ts,
+            not significant_changes_only,
+        )
+    return columns.to_compressed_json(
+        entity_ids, entity_id_to_metadata_id, minimal_response, no_attributes
+    )
+
+
+def _prepare_significant_states_stmt(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Prepare the statement to query significant states.
+
+    Returns None if none of the entities have been recorded.
+    """
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
@@ -219,7 +326,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,14 +364,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -770,3 +873,213 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+class _HistoryColumns:
+    """Significant states of many entities read into typed columns.
+
+    The rows must be sorted by metadata_id and last_updated. States and
+    attributes are stored as codes into lists of the distinct values
+    since they repeat for most rows.
+    """
+
+    __slots__ = (
+        "metadata_ids",
+        "state_codes",
+        "states",
+        "last_updated_ts",
+        "last_changed_ts",
+        "attribute_codes",
+        "attributes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.metadata_ids = array("q")
+        self.state_codes = array("q")
+        self.states: list[str | None] = []
+        self.last_updated_ts = array("d")
+        self.last_changed_ts = array("d")
+        self.attribute_codes = array("q")
+        self.attributes: list[str | None] = []
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Row],
+        start_time_ts: float | None,
+        include_last_changed: bool,
+    ) -> _HistoryColumns:
+        """Read the rows into columns."""
+        columns = cls()
+        state_to_code: dict[str | None, int] = {}
+        attributes_to_code: dict[str | None, int] = {}
+        last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+        attributes_idx: int | None = None
+        rows_iter = iter(rows)
+        while chunk := list(islice(rows_iter, _COLUMNS_CHUNK_SIZE)):
+            if attributes_idx is None and "attributes" in chunk[0]._fields:
+                attributes_idx = chunk[0]._fields.index("attributes")
+            columns.metadata_ids.extend(
+                map(itemgetter(_FIELD_MAP["metadata_id"]), chunk)
+            )
+            columns.state_codes.extend(
+                _values_to_codes(
+                    list(map(itemgetter(_FIELD_MAP["state"]), chunk)), state_to_code
+                )
+            )
+            columns.last_updated_ts.extend(
+                [row[last_updated_ts_idx] or 0.0 for row in chunk]
+            )
+            if include_last_changed:
+                columns.last_changed_ts.extend(
+                    [row[last_updated_ts_idx + 1] or 0.0 for row in chunk]
+                )
+            if attributes_idx is not None:
+                columns.attribute_codes.extend(
+                    _values_to_codes(
+                        list(map(itemgetter(attributes_idx), chunk)),
+                        attributes_to_code,
+                    )
+                )
+        if start_time_ts is not None:
+            # The state at the start time is selected with a last_updated_ts of 0
+            last_updated_ts = np.frombuffer(columns.last_updated_ts, dtype=np.float64)
+            last_updated_ts[last_updated_ts == 0] = start_time_ts
+        columns.states = list(state_to_code)
+        columns.attributes = list(attributes_to_code)
+        return columns
+
+    def to_compressed_json(
+        self,
+        entity_ids: list[str],
+        entity_id_to_metadata_id: dict[str, int | None],
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> tuple[dict[str, bytes], float]:
+        """Write the compressed states of each entity as json.
+
+        This must stay in sync with _sorted_states_to_dict for the
+        compressed state format.
+        """
+        if not self.metadata_ids:
+            return {}, 0.0
+        dumps = orjson.dumps
+        # The json of each distinct state and attributes is only created once
+        state_starts = [_STATE_START + dumps(state) for state in self.states]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        attributes_parts = [
+            _ATTRIBUTES_KEY
+            + json_bytes(decode_attributes_from_source(source, attr_cache))
+            for source in self.attributes
+        ]
+        metadata_ids = np.frombuffer(self.metadata_ids, dtype=np.int64)
+        state_codes = np.frombuffer(self.state_codes, dtype=np.int64)
+        attribute_codes = np.frombuffer(self.attribute_codes, dtype=np.int64)
+        last_updated_ts = np.frombuffer(self.last_updated_ts, dtype=np.float64)
+        last_changed_ts = np.frombuffer(self.last_changed_ts, dtype=np.float64)
+        # The rows of each metadata_id start at the matching offset
+        offsets = np.flatnonzero(np.diff(metadata_ids, prepend=-1)).tolist()
+        ends = [*offsets[1:], len(metadata_ids)]
+
+        def _full_states(rows: slice, include_attributes: bool) -> bytes:
+            """Return compressed states with attributes and last_changed."""
+            row_ts = last_updated_ts[rows]
+            attributes_column: Iterable[bytes]
+            if not include_attributes:
+                attributes_column = repeat(b"")
+            elif attribute_codes.size:
+                attributes_column = map(
+                    attributes_parts.__getitem__, attribute_codes[rows].tolist()
+                )
+            else:
+                attributes_column = repeat(_EMPTY_ATTRIBUTES_PART)
+            last_changed_column: Iterable[bytes] = repeat(b"")
+            if last_changed_ts.size:
+                row_last_changed_ts = last_changed_ts[rows]
+                if (
+                    with_last_changed := np.flatnonzero(
+                        (row_last_changed_ts != 0) & (row_last_changed_ts != row_ts)
+                    )
+                ).size:
+                    last_changed_column = [b""] * len(row_ts)
+                    for index, encoded in zip(
+                        with_last_changed.tolist(),
+                        _dump_floats(row_last_changed_ts[with_last_changed]),
+                    ):
+                        last_changed_column[index] = _LAST_CHANGED_KEY + encoded
+            return b"".join(
+                chain.from_iterable(
+                    zip(
+                        map(state_starts.__getitem__, state_codes[rows].tolist()),
+                        attributes_column,
+                        repeat(_LAST_UPDATED_KEY),
+                        _dump_floats(row_ts),
+                        last_changed_column,
+                        repeat(_STATE_END),
+                    )
+                )
+            )
+
+        metadata_id_to_entity_id = {
+            metadata_id: entity_id
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id is not None
+        }
+        encoded_entities: dict[str, bytes] = {}
+        last_time_ts = 0.0
+        for start, end in zip(offsets, ends):
+            entity_id = metadata_id_to_entity_id[int(metadata_ids[start])]
+            if (
+                not minimal_response
+                or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+            ):
+                encoded = _full_states(slice(start, end), True)
+                last_index = end - 1
+            else:
+                # With minimal response we only provide the full state for
+                # the first state and filter out duplicate states after it
+                entity_codes = state_codes[start:end]
+                changed = (
+                    start + 1 + np.flatnonzero(entity_codes[1:] != entity_codes[:-1])
+                )
+                encoded = _full_states(slice(start, start + 1), not no_attributes)
+                last_index = start
+                if changed.size:
+                    encoded += b"".join(
+                        chain.from_iterable(
+                            zip(
+                                map(
+                                    state_starts.__getitem__,
+                                    state_codes[changed].tolist(),
+                                ),
+                                repeat(_LAST_UPDATED_KEY),
+                                _dump_floats(last_updated_ts[changed]),
+                                repeat(_STATE_END),
+                            )
+                        )
+                    )
+                    last_index = int(changed[-1])
+            # The last state is not followed by a separator
+            encoded_entities[entity_id] = b"[" + encoded[:-1] + b"]"
+            last_time_ts = max(last_time_ts, float(last_updated_ts[last_index]))
+
+        # Keep the order of the requested entity_ids
+        return {
+            entity_id: encoded_entities[entity_id]
+            for entity_id in dict.fromkeys(entity_ids)
+            if entity_id in encoded_entities
+        }, last_time_ts
+
+
+def _values_to_codes(values: list[Any], value_to_code: dict[Any, int]) -> Iterator[int]:
+    """Return the code of each value and add codes for new values."""
+    for value in dict.fromkeys(values):
+        if value not in value_to_code:
+            value_to_code[value] = len(value_to_code)
+    return map(value_to_code.__getitem__, values)
+
+
+def _dump_floats(values: np.ndarray) -> list[bytes]:
+    """Return the json of each float."""
+    return orjson.dumps(values.tolist())[1:-1].split(b",")
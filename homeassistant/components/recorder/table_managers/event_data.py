@@ -31,9 +31,21 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
         self.active = True  # always active
+        # Data serialized by load keyed by the id of the event, the events
+        # are kept alive by their tasks until clear_serialized is called
+        self._serialized: dict[int, bytes | None] = {}
 
     def serialize_from_event(self, event: Event) -> bytes | None:
-        """Serialize event data."""
+        """Serialize event data.
+
+        Reuses the data serialized by load for the event.
+        """
+        if (event_id := id(event)) in self._serialized:
+            return self._serialized.pop(event_id)
+        return self._serialize_from_event(event)
+
+    def _serialize_from_event(self, event: Event) -> bytes | None:
+        """Serialize event data without using the data serialized by load."""
         try:
             return EventData.shared_data_bytes_from_event(
                 event, self.recorder.dialect_name
@@ -42,18 +54,38 @@ class EventDataManager(BaseLRUTableManager[EventData]):
             _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
             return None
 
-    def load(self, events: list[Event], session: Session) -> None:
+    def load(self, events: list[Event], session: Session) -> int:
         """Load the shared_datas to data_ids mapping into memory from events.
 
+        Returns the number of shared_datas that were looked up in the database.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        id_map = self._id_map
+        pending = self._pending
+        serialized = self._serialized
         if hashes := {
             EventData.hash_shared_data_bytes(shared_event_bytes)
             for event in events
-            if (shared_event_bytes := self.serialize_from_event(event))
+            if (
+                shared_event_bytes := serialized.setdefault(
+                    id(event), self._serialize_from_event(event)
+                )
+            )
+            and (shared_data := shared_event_bytes.decode("utf-8")) not in id_map
+            and shared_data not in pending
         }:
             self._load_from_hashes(hashes, session)
+        return len(hashes)
+
+    def clear_serialized(self) -> None:
+        """Forget the data serialized by load that was not used.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._serialized.clear()
 
     def get(self, shared_data: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_datas to the data_id.
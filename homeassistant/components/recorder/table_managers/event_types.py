@@ -30,17 +30,27 @@ class EventTypeManager(BaseLRUTableManager[EventTypes]):
         super().__init__(recorder, CACHE_SIZE)
         self._non_existent_event_types: LRU = LRU(CACHE_SIZE)
 
-    def load(self, events: list[Event], session: Session) -> None:
+    def load(self, events: list[Event], session: Session) -> int:
         """Load the event_type to event_type_ids mapping into memory.
 
+        Returns the number of event_types that were looked up in the database.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        self.get_many(
-            {event.event_type for event in events if event.event_type is not None},
-            session,
-            True,
-        )
+        id_map = self._id_map
+        pending = self._pending
+        non_existent = self._non_existent_event_types
+        if missing := {
+            event_type
+            for event in events
+            if (event_type := event.event_type) is not None
+            and event_type not in id_map
+            and event_type not in pending
+            and event_type not in non_existent
+        }:
+            self.get_many(missing, session, True)
+        return len(missing)
 
     def get(
         self, event_type: str, session: Session, from_recorder: bool = False
@@ -1,6 +1,7 @@
 """Support managing States."""
 from __future__ import annotations
 
+from ..bulk_insert import PendingStatesRow
 from ..db_schema import States
 
 
@@ -10,6 +11,7 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_rows: dict[str, PendingStatesRow] = {}
         self._last_committed_id: dict[str, int] = {}
 
     def pop_pending(self, entity_id: str) -> States | None:
@@ -22,6 +24,16 @@ class StatesManager:
         """
         return self._pending.pop(entity_id, None)
 
+    def pop_pending_row(self, entity_id: str) -> PendingStatesRow | None:
+        """Pop a pending bulk insert row.
+
+        Pending rows are states that will be written by the next bulk insert.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_rows.pop(entity_id, None)
+
     def pop_committed(self, entity_id: str) -> int | None:
         """Pop a committed state.
 
@@ -43,6 +55,16 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_row(self, entity_id: str, row: PendingStatesRow) -> None:
+        """Add a pending bulk insert row.
+
+        Pending rows are states that will be written by the next bulk insert.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_rows[entity_id] = row
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the state_id of the new States into committed.
 
@@ -52,6 +74,10 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        for entity_id, row in self._pending_rows.items():
+            assert row.state_id is not None
+            self._last_committed_id[entity_id] = row.state_id
+        self._pending_rows.clear()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -61,6 +87,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_rows.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -27,22 +27,26 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         self._did_first_load = False
         super().__init__(recorder, CACHE_SIZE)
 
-    def load(self, events: list[Event], session: Session) -> None:
+    def load(self, events: list[Event], session: Session) -> int:
         """Load the entity_id to metadata_id mapping into memory.
 
+        Returns the number of entity_ids that were looked up in the database.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
         self._did_first_load = True
-        self.get_many(
-            {
-                event.data["new_state"].entity_id
-                for event in events
-                if event.data.get("new_state") is not None
-            },
-            session,
-            True,
-        )
+        id_map = self._id_map
+        pending = self._pending
+        if missing := {
+            entity_id
+            for event in events
+            if (new_state := event.data.get("new_state")) is not None
+            and (entity_id := new_state.entity_id) not in id_map
+            and entity_id not in pending
+        }:
+            self.get_many(missing, session, True)
+        return len(missing)
 
     def get(self, entity_id: str, session: Session, from_recorder: bool) -> int | None:
         """Resolve entity_id to the metadata_id.
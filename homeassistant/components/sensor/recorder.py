@@ -4,7 +4,6 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable, MutableMapping
 import datetime
-import itertools
 import logging
 import math
 from typing import Any
@@ -17,6 +16,7 @@ from homeassistant.components.recorder import (
     history,
     statistics,
 )
+from homeassistant.components.recorder.columnar_statistics import ColumnarStates
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -78,53 +78,6 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
-def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
-) -> float:
-    """Calculate a time weighted average.
-
-    The average is calculated by weighting the states by duration in seconds between
-    state changes.
-    Note: there's no interpolation of values between state changes.
-    """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    period_seconds = (end - start).total_seconds()
-    if period_seconds == 0:
-        # If the only state changed that happened was at the exact moment
-        # at the end of the period, we can't calculate a meaningful average
-        # so we return 0.0 since it represents a time duration smaller than
-        # we can measure. This probably means the precision of statistics
-        # column schema in the database is incorrect but it is actually possible
-        # to happen if the state change event fired at the exact microsecond
-        return 0.0
-    return accumulated / period_seconds
-
-
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -453,6 +406,12 @@ def compile_statistics(  # noqa: C901
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
+    # Compile mean, min and max of all entities from flat columns
+    columns = ColumnarStates()
+    for entity_id, _, _, valid_float_states in to_process:
+        if wanted_statistics[entity_id] & {"mean", "min", "max"}:
+            columns.add(entity_id, valid_float_states)
+    compiled_columns = columns.compile(start, end)
     for (  # pylint: disable=too-many-nested-blocks
         entity_id,
         statistics_unit,
@@ -496,13 +455,14 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(*itertools.islice(zip(*valid_float_states), 1))
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(*itertools.islice(zip(*valid_float_states), 1))
-
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+        if entity_id in compiled_columns:
+            mean, min_, max_ = compiled_columns[entity_id]
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max_
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min_
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = mean
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
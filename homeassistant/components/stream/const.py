@@ -39,6 +39,9 @@ SOURCE_TIMEOUT = 30  # Timeout for reading stream source
 STREAM_RESTART_INCREMENT = 10  # Increase wait_timeout by this amount each retry
 STREAM_RESTART_RESET_TIME = 300  # Reset wait_timeout after this many seconds
 
+MAX_KEYFRAME_IMAGES = 8  # Max number of encoded keyframe images to keep per stream
+MAX_KEYFRAME_IMAGE_BYTES = 4 * 1024 * 1024  # Max size of the kept keyframe images
+
 CONF_LL_HLS = "ll_hls"
 CONF_PART_DURATION = "part_duration"
 CONF_SEGMENT_DURATION = "segment_duration"
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass, field
 import datetime
@@ -21,12 +21,14 @@ from homeassistant.util.decorator import Registry
 from .const import (
     ATTR_STREAMS,
     DOMAIN,
+    MAX_KEYFRAME_IMAGE_BYTES,
+    MAX_KEYFRAME_IMAGES,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -421,10 +423,13 @@ class KeyFrameConverter:
     An overview of the thread and state interaction:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
+        get_image returns the cached image if there is no new packet and an
+            image of the requested size was already generated from the last frame
         get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
+        _generate_image will try to decode a frame from the packet
         _generate_image will clear the packet, so there will only be one attempt per packet
-    If successful, self._image will be updated and returned by get_image
+        _generate_image creates an image of the requested size from the last frame
+    If successful, the image is cached, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
     """
 
@@ -445,6 +450,14 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._frame: VideoFrame | None = None
+        # Incremented each time a frame is decoded
+        self._frame_sequence = 0
+        # Images of the last frame by (frame sequence, width, height, orientation)
+        self._images: OrderedDict[
+            tuple[int, int | None, int | None, int], bytes
+        ] = OrderedDict()
+        self._images_size = 0
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
@@ -483,7 +496,9 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
-    def _generate_image(self, width: int | None, height: int | None) -> None:
+    def _generate_image(
+        self, width: int | None, height: int | None, orientation: int
+    ) -> bytes | None:
         """Generate the keyframe image.
 
         This is run in an executor thread, but since it is called within an
@@ -491,8 +506,23 @@ class KeyFrameConverter:
         at a time per instance.
         """
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
-            return
+        if not self._turbojpeg:
+            return None
+        if self._packet and self._codec_context:
+            self._decode_packet()
+        if not (frame := self._frame):
+            return None
+        if width and height:
+            if orientation >= 5:
+                frame = frame.reformat(width=height, height=width)
+            else:
+                frame = frame.reformat(width=width, height=height)
+        bgr_array = self.transform_image(frame.to_ndarray(format="bgr24"), orientation)
+        return bytes(self._turbojpeg.encode(bgr_array))
+
+    def _decode_packet(self) -> None:
+        """Decode the stashed keyframe packet into a frame."""
+        assert self._codec_context
         packet = self._packet
         self._packet = None
         for _ in range(2):  # Retry once if codec context needs to be flushed
@@ -512,17 +542,25 @@ class KeyFrameConverter:
             _LOGGER.debug("Unable to decode keyframe")
             return
         if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            self._frame = frames[0]
+            self._frame_sequence += 1
+
+    @callback
+    def _async_cache_image(
+        self, key: tuple[int, int | None, int | None, int], image: bytes
+    ) -> None:
+        """Cache an image and evict the least recently used images."""
+        images = self._images
+        # Images of previous frames will not be requested again
+        for old_key in [old_key for old_key in images if old_key[0] != key[0]]:
+            self._images_size -= len(images.pop(old_key))
+        images[key] = image
+        self._images_size += len(image)
+        while len(images) > 1 and (
+            len(images) > MAX_KEYFRAME_IMAGES
+            or self._images_size > MAX_KEYFRAME_IMAGE_BYTES
+        ):
+            self._images_size -= len(images.popitem(last=False)[1])
 
     async def async_get_image(
         self,
@@ -536,6 +574,21 @@ class KeyFrameConverter:
         if wait_for_next_keyframe:
             self._event.clear()
             await self._event.wait()
+        if not (width and height):
+            width = height = None
+        orientation = self._dynamic_stream_settings.orientation
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            key = (self._frame_sequence, width, height, orientation)
+            if self._packet is None and (image := self._images.get(key)):
+                self._images.move_to_end(key)
+                self._image = image
+                return image
+            image = await self._hass.async_add_executor_job(
+                self._generate_image, width, height, orientation
+            )
+            if image is not None:
+                self._image = image
+                self._async_cache_image(
+                    (self._frame_sequence, width, height, orientation), image
+                )
         return self._image
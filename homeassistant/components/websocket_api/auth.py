@@ -11,7 +11,7 @@ from voluptuous.humanize import humanize_error
 from homeassistant.auth.models import RefreshToken, User
 from homeassistant.components.http.ban import process_success_login, process_wrong_login
 from homeassistant.const import __version__
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
 from homeassistant.util.json import JsonValueType
 
 from .connection import ActiveConnection
@@ -60,10 +60,12 @@ class AuthPhase:
         send_message: Callable[[str | dict[str, Any]], None],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
+        send_state_diff_message: Callable[[int, Event, str], None] | None = None,
     ) -> None:
         """Initialize the authentiated connection."""
         self._hass = hass
         self._send_message = send_message
+        self._send_state_diff_message = send_state_diff_message
         self._cancel_ws = cancel_ws
         self._logger = logger
         self._request = request
@@ -106,5 +108,10 @@ class AuthPhase:
         process_success_login(self._request)
         self._send_message(auth_ok_message())
         return ActiveConnection(
-            self._logger, self._hass, self._send_message, user, refresh_token
+            self._logger,
+            self._hass,
+            self._send_message,
+            user,
+            refresh_token,
+            self._send_state_diff_message,
         )
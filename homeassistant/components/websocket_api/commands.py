@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     HomeAssistant,
@@ -33,12 +34,18 @@ from homeassistant.exceptions import (
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity,
+    entityfilter,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     EventStateChangedData,
     TrackTemplate,
     TrackTemplateResult,
+    async_call_later,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -57,6 +64,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -64,6 +72,19 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_SUBSCRIPTIONS = "websocket_api_entity_subscriptions"
+
+CONF_ATTRIBUTES = "attributes"
+CONF_MIN_INTERVAL = "min_interval"
+
+STATE_CHANGED_FILTER_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entity_id"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("domain"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_ATTRIBUTES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_MIN_INTERVAL): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -130,11 +151,121 @@ def _forward_events_unconditional(
     send_message(messages.cached_event_message(msg_id, event))
 
 
+@callback
+def _async_state_changed_event_filter(
+    hass: HomeAssistant,
+    filter_config: dict[str, Any],
+    forward_events: Callable[[Event], None],
+) -> tuple[Callable[[Event], bool], CALLBACK_TYPE]:
+    """Compile a state changed subscription filter into an event filter.
+
+    The filter runs before the event is forwarded so events that are
+    filtered out are never serialized. The last event of an entity that
+    min_interval held back is forwarded when the interval ends.
+
+    Returns the event filter and a callback that cancels the pending
+    forwards of held back events.
+    """
+    entity_filter: entityfilter.EntityFilter | None = None
+    if "entity_id" in filter_config or "domain" in filter_config:
+        entity_filter = entityfilter.convert_filter(
+            {
+                entityfilter.CONF_INCLUDE_DOMAINS: filter_config.get("domain", []),
+                entityfilter.CONF_INCLUDE_ENTITY_GLOBS: filter_config.get(
+                    "entity_id", []
+                ),
+                entityfilter.CONF_INCLUDE_ENTITIES: [],
+                entityfilter.CONF_EXCLUDE_DOMAINS: [],
+                entityfilter.CONF_EXCLUDE_ENTITY_GLOBS: [],
+                entityfilter.CONF_EXCLUDE_ENTITIES: [],
+            }
+        )
+    attributes: list[str] | None = filter_config.get(CONF_ATTRIBUTES)
+    min_interval: float | None = filter_config.get(CONF_MIN_INTERVAL)
+    last_forwarded: dict[str, float] = {}
+    # The last held back event of each entity and the cancel
+    # callback of its forward at the end of the interval
+    held_back: dict[str, tuple[Event, CALLBACK_TYPE]] = {}
+
+    @callback
+    def _async_forward_held_back(entity_id: str, _now: dt.datetime) -> None:
+        """Forward the last held back event of an entity."""
+        event, _ = held_back.pop(entity_id)
+        last_forwarded[entity_id] = dt_util.utcnow().timestamp()
+        forward_events(event)
+
+    @callback
+    def _async_discard_held_back(entity_id: str) -> None:
+        """Discard the held back event of an entity."""
+        if (held := held_back.pop(entity_id, None)) is not None:
+            held[1]()
+
+    @callback
+    def _async_cancel_held_back() -> None:
+        """Cancel the forwards of all held back events."""
+        for _, cancel in held_back.values():
+            cancel()
+        held_back.clear()
+
+    @callback
+    def _event_filter(event: Event) -> bool:
+        """Return if a state changed event matches the filter."""
+        entity_id: str = event.data["entity_id"]
+        if entity_filter is not None and not entity_filter(entity_id):
+            return False
+        old_state: State | None = event.data["old_state"]
+        new_state: State | None = event.data["new_state"]
+        if attributes is not None:
+            if old_state is None or new_state is None:
+                return any(
+                    attribute in state.attributes
+                    for state in (old_state, new_state)
+                    if state is not None
+                    for attribute in attributes
+                )
+            if all(
+                old_state.attributes.get(attribute)
+                == new_state.attributes.get(attribute)
+                for attribute in attributes
+            ):
+                return False
+        if min_interval:
+            # Entities being added or removed are always forwarded
+            if new_state is None:
+                _async_discard_held_back(entity_id)
+                last_forwarded.pop(entity_id, None)
+                return True
+            time_fired = event.time_fired.timestamp()
+            if (
+                old_state is not None
+                and (last := last_forwarded.get(entity_id)) is not None
+                and time_fired - last < min_interval
+            ):
+                if (held := held_back.get(entity_id)) is not None:
+                    held_back[entity_id] = (event, held[1])
+                else:
+                    held_back[entity_id] = (
+                        event,
+                        async_call_later(
+                            hass,
+                            last + min_interval - time_fired,
+                            partial(_async_forward_held_back, entity_id),
+                        ),
+                    )
+                return False
+            _async_discard_held_back(entity_id)
+            last_forwarded[entity_id] = time_fired
+        return True
+
+    return _event_filter, _async_cancel_held_back
+
+
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_events",
         vol.Optional("event_type", default=MATCH_ALL): str,
+        vol.Optional("filter"): STATE_CHANGED_FILTER_SCHEMA,
     }
 )
 def handle_subscribe_events(
@@ -151,6 +282,14 @@ def handle_subscribe_events(
         )
         raise Unauthorized(user_id=connection.user.id)
 
+    if "filter" in msg and event_type != EVENT_STATE_CHANGED:
+        connection.send_error(
+            msg["id"],
+            const.ERR_NOT_SUPPORTED,
+            f"Filters are only supported for {EVENT_STATE_CHANGED} events",
+        )
+        return
+
     if event_type == EVENT_STATE_CHANGED:
         forward_events = partial(
             _forward_events_check_permissions,
@@ -163,10 +302,27 @@ def handle_subscribe_events(
             _forward_events_unconditional, connection.send_message, msg["id"]
         )
 
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events, run_immediately=True
+    if "filter" not in msg:
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            event_type, forward_events, run_immediately=True
+        )
+        connection.send_result(msg["id"])
+        return
+
+    event_filter, cancel_held_back = _async_state_changed_event_filter(
+        hass, msg["filter"], forward_events
+    )
+    unsub = hass.bus.async_listen(
+        event_type, forward_events, event_filter=event_filter, run_immediately=True
     )
 
+    @callback
+    def _unsub_filtered() -> None:
+        """Unsubscribe and cancel the forwards of held back events."""
+        unsub()
+        cancel_held_back()
+
+    connection.subscriptions[msg["id"]] = _unsub_filtered
     connection.send_result(msg["id"])
 
 
@@ -357,26 +513,83 @@ def _send_handle_get_states_response(
     )
 
 
+class _EntitySubscription:
+    """Forward state changes to subscribe_entities streams with the same filter.
+
+    All streams share one state changed listener and the diff message is
+    only built once for each message id.
+    """
+
+    __slots__ = ("entity_ids", "subscribers", "unsub")
+
+    def __init__(self, entity_ids: frozenset[str]) -> None:
+        """Initialize the subscription."""
+        self.entity_ids = entity_ids
+        # Replaced instead of modified so subscribers can be removed
+        # while forwarding an event
+        self.subscribers: tuple[
+            tuple[Callable[[int, Event, str], None], User, int], ...
+        ] = ()
+        self.unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_forward(self, event: Event) -> None:
+        """Forward entity state changed events to websocket."""
+        entity_id = event.data["entity_id"]
+        if self.entity_ids and entity_id not in self.entity_ids:
+            return
+        messages_by_id: dict[int, str] = {}
+        for send_state_diff_message, user, msg_id in self.subscribers:
+            # We have to lookup the permissions again because the user might have
+            # changed since the subscription was created.
+            permissions = user.permissions
+            if not permissions.access_all_entities(
+                POLICY_READ
+            ) and not permissions.check_entity(entity_id, POLICY_READ):
+                continue
+            if (message := messages_by_id.get(msg_id)) is None:
+                message = messages_by_id[msg_id] = messages.cached_state_diff_message(
+                    msg_id, event
+                )
+            send_state_diff_message(msg_id, event, message)
+
+
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
+def _async_subscribe_entity_changes(
+    hass: HomeAssistant,
+    entity_ids: frozenset[str],
+    send_state_diff_message: Callable[[int, Event, str], None],
     user: User,
     msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+) -> CALLBACK_TYPE:
+    """Subscribe to the state changes of the entities."""
+    subscriptions: dict[frozenset[str], _EntitySubscription] = hass.data.setdefault(
+        ENTITY_SUBSCRIPTIONS, {}
+    )
+    if (subscription := subscriptions.get(entity_ids)) is None:
+        subscription = subscriptions[entity_ids] = _EntitySubscription(entity_ids)
+        subscription.unsub = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, subscription.async_forward, run_immediately=True
+        )
+    subscriber = (send_state_diff_message, user, msg_id)
+    subscription.subscribers = (*subscription.subscribers, subscriber)
+
+    @callback
+    def _async_unsubscribe() -> None:
+        """Unsubscribe from the state changes."""
+        subscription.subscribers = tuple(
+            other for other in subscription.subscribers if other is not subscriber
+        )
+        if (
+            subscription.subscribers
+            or subscriptions.get(entity_ids) is not subscription
+        ):
+            return
+        del subscriptions[entity_ids]
+        assert subscription.unsub is not None
+        subscription.unsub()
+
+    return _async_unsubscribe
 
 
 @callback
@@ -390,21 +603,17 @@ def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle subscribe entities command."""
-    entity_ids = set(msg.get("entity_ids", []))
+    entity_ids = frozenset(msg.get("entity_ids", []))
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            msg["id"],
-        ),
-        run_immediately=True,
+    connection.subscriptions[msg["id"]] = _async_subscribe_entity_changes(
+        hass,
+        entity_ids,
+        connection.send_state_diff_message,
+        connection.user,
+        msg["id"],
     )
     connection.send_result(msg["id"])
 
@@ -11,7 +11,7 @@ import voluptuous as vol
 
 from homeassistant.auth.models import RefreshToken, User
 from homeassistant.components.http import current_request
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.util.json import JsonValueType
 
@@ -37,6 +37,7 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "send_state_diff_message",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -54,11 +55,15 @@ class ActiveConnection:
         send_message: Callable[[str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        send_state_diff_message: Callable[[int, Event, str], None] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        self.send_state_diff_message = (
+            send_state_diff_message or self._send_state_diff_message
+        )
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
@@ -75,6 +80,11 @@ class ActiveConnection:
         """Return the representation."""
         return f"<ActiveConnection {self.get_description(None)}>"
 
+    @callback
+    def _send_state_diff_message(self, msg_id: int, event: Event, message: str) -> None:
+        """Send a state diff message without merging it with pending ones."""
+        self.send_message(message)
+
     def set_supported_features(self, features: dict[str, float]) -> None:
         """Set supported features."""
         self.supported_features = features
@@ -25,6 +25,11 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Number of pending messages from which state diff messages of the same
+# entity are merged instead of being queued one after the other.
+PENDING_MSG_MERGE_STATE_DIFFS: Final = 128
+# Maximum size of the messages that can be pending at any given time.
+MAX_PENDING_MSG_BYTES: Final = 32 * 2**20
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -12,7 +12,7 @@ from aiohttp import WSMsgType, web
 
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.json import json_loads
@@ -21,6 +21,8 @@ from .auth import AuthPhase, auth_required_message
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    MAX_PENDING_MSG_BYTES,
+    PENDING_MSG_MERGE_STATE_DIFFS,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
@@ -28,7 +30,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import message_to_json, state_diff_message
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -59,6 +61,33 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+class _PendingStateDiff:
+    """A state diff message of an entity that is waiting to be sent.
+
+    State changes of the entity that happen before the message is
+    sent are merged into it.
+    """
+
+    __slots__ = ("key", "old_state", "new_state", "message")
+
+    def __init__(
+        self,
+        key: tuple[int, str],
+        old_state: State | None,
+        new_state: State | None,
+        message: str,
+    ) -> None:
+        """Initialize the pending state diff."""
+        self.key = key
+        self.old_state = old_state
+        self.new_state = new_state
+        self.message = message
+
+    def __str__(self) -> str:
+        """Return the message."""
+        return self.message
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -74,6 +103,8 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_message_queue_bytes",
+        "_pending_state_diffs",
         "_ready_future",
     )
 
@@ -94,7 +125,10 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[str | _PendingStateDiff | None] = deque()
+        self._message_queue_bytes = 0
+        # Unsent state diff messages by subscription id and entity id
+        self._pending_state_diffs: dict[tuple[int, str], _PendingStateDiff] = {}
         self._ready_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
@@ -103,9 +137,21 @@ class WebSocketHandler:
             "<WebSocketHandler "
             f"closing={self._closing} "
             f"authenticated={self._authenticated} "
+            f"pending_messages={self.pending_messages} "
+            f"pending_bytes={self.pending_bytes} "
             f"description={self.description}>"
         )
 
+    @property
+    def pending_messages(self) -> int:
+        """Return the number of messages waiting to be sent."""
+        return len(self._message_queue) if self._message_queue is not None else 0
+
+    @property
+    def pending_bytes(self) -> int:
+        """Return the size of the messages waiting to be sent."""
+        return self._message_queue_bytes
+
     @property
     def description(self) -> str:
         """Return a description of the connection."""
@@ -119,6 +165,7 @@ class WebSocketHandler:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
+        pending_state_diffs = self._pending_state_diffs
         logger = self._logger
         wsock = self._wsock
         send_str = wsock.send_str
@@ -135,8 +182,14 @@ class WebSocketHandler:
                     messages_remaining = len(message_queue)
 
                 # A None message is used to signal the end of the connection
-                if (message := message_queue.popleft()) is None:
+                if (item := message_queue.popleft()) is None:
                     return
+                if isinstance(item, _PendingStateDiff):
+                    del pending_state_diffs[item.key]
+                    message = item.message
+                else:
+                    message = item
+                self._message_queue_bytes -= len(message)
 
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
@@ -154,8 +207,14 @@ class WebSocketHandler:
                 messages: list[str] = [message]
                 while messages_remaining:
                     # A None message is used to signal the end of the connection
-                    if (message := message_queue.popleft()) is None:
+                    if (item := message_queue.popleft()) is None:
                         return
+                    if isinstance(item, _PendingStateDiff):
+                        del pending_state_diffs[item.key]
+                        message = item.message
+                    else:
+                        message = item
+                    self._message_queue_bytes -= len(message)
                     messages.append(message)
                     messages_remaining -= 1
 
@@ -196,6 +255,64 @@ class WebSocketHandler:
         if isinstance(message, dict):
             message = message_to_json(message)
 
+        self._queue_message(message, message)
+
+    @callback
+    def _send_state_diff_message(self, msg_id: int, event: Event, message: str) -> None:
+        """Send a state diff message to the client.
+
+        When the client is not keeping up and a state diff message of the
+        same entity for the same subscription is still waiting to be sent,
+        the changes are merged into it so slow clients only receive the
+        latest state of each entity.
+
+        Async friendly.
+        """
+        if self._closing:
+            return
+
+        if len(self._message_queue) < PENDING_MSG_MERGE_STATE_DIFFS:
+            self._queue_message(message, message)
+            return
+
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data["new_state"]
+        key = (msg_id, entity_id)
+        if (pending := self._pending_state_diffs.get(key)) is None:
+            pending = _PendingStateDiff(
+                key, event.data["old_state"], new_state, message
+            )
+            if self._queue_message(pending, message):
+                self._pending_state_diffs[key] = pending
+            return
+
+        merged_message = state_diff_message(
+            msg_id, entity_id, pending.old_state, new_state
+        )
+        self._message_queue_bytes += len(merged_message) - len(pending.message)
+        pending.new_state = new_state
+        pending.message = merged_message
+        if self._message_queue_bytes > MAX_PENDING_MSG_BYTES:
+            self._cancel_pending_bytes_exceeded(merged_message)
+
+    @callback
+    def _cancel_pending_bytes_exceeded(self, message: str) -> None:
+        """Cancel the connection because too many bytes are pending."""
+        self._logger.error(
+            (
+                "%s: Client unable to keep up with pending messages. Reached %s pending"
+                " bytes. The system's load is too high or an integration is"
+                " misbehaving; Last message was: %s"
+            ),
+            self.description,
+            MAX_PENDING_MSG_BYTES,
+            message,
+        )
+        self._cancel()
+
+    @callback
+    def _queue_message(self, item: str | _PendingStateDiff, message: str) -> bool:
+        """Queue a message and return if it was queued."""
         message_queue = self._message_queue
         queue_size_before_add = len(message_queue)
         if queue_size_before_add >= MAX_PENDING_MSG:
@@ -210,9 +327,14 @@ class WebSocketHandler:
                 message,
             )
             self._cancel()
-            return
+            return False
+
+        if self._message_queue_bytes + len(message) > MAX_PENDING_MSG_BYTES:
+            self._cancel_pending_bytes_exceeded(message)
+            return False
 
-        message_queue.append(message)
+        self._message_queue_bytes += len(message)
+        message_queue.append(item)
         ready_future = self._ready_future
         if ready_future and not ready_future.done():
             ready_future.set_result(None)
@@ -222,12 +344,13 @@ class WebSocketHandler:
         if queue_size_before_add <= PENDING_MSG_PEAK:
             if peak_checker_active:
                 self._cancel_peak_checker()
-            return
+            return True
 
         if not peak_checker_active:
             self._peak_checker_unsub = async_call_later(
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
+        return True
 
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
@@ -291,7 +414,14 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(logger, hass, self._send_message, self._cancel, request)
+        auth = AuthPhase(
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            self._send_state_diff_message,
+        )
         connection = None
         disconnect_warn = None
 
@@ -457,6 +587,8 @@ class WebSocketHandler:
                     self._hass = None  # type: ignore[assignment]
                     self._logger = None  # type: ignore[assignment]
                     self._message_queue = None  # type: ignore[assignment]
+                    self._message_queue_bytes = 0
+                    self._pending_state_diffs.clear()
                     self._handle_task = None
                     self._writer_task = None
                     self._ready_future = None
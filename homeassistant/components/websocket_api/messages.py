@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 import logging
-from typing import TYPE_CHECKING, Any, Final, cast
+from typing import Any, Final
 
 import voluptuous as vol
 
@@ -157,19 +157,37 @@ def _state_diff_event(event: Event) -> dict:
         "r": [entity_id,…]
     }
     """
-    if (event_new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if TYPE_CHECKING:
-        event_new_state = cast(State, event_new_state)
-    if (event_old_state := event.data["old_state"]) is None:
-        return {
-            ENTITY_EVENT_ADD: {
-                event_new_state.entity_id: event_new_state.as_compressed_state
-            }
+    return _states_diff(
+        event.data["entity_id"], event.data["old_state"], event.data["new_state"]
+    )
+
+
+def state_diff_message(
+    iden: int, entity_id: str, old_state: State | None, new_state: State | None
+) -> str:
+    """Return a state diff event message between two states of an entity.
+
+    Used to merge the state changes of an entity that are still
+    waiting to be sent to a client into a single message.
+    """
+    return message_to_json(
+        {
+            "id": iden,
+            "type": "event",
+            "event": _states_diff(entity_id, old_state, new_state),
         }
-    if TYPE_CHECKING:
-        event_old_state = cast(State, event_old_state)
-    return _state_diff(event_old_state, event_new_state)
+    )
+
+
+def _states_diff(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict:
+    """Convert an old and new state to the minimal version."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
+        return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return _state_diff(old_state, new_state)
 
 
 def _state_diff(
@@ -82,7 +82,7 @@ from .exceptions import (
     Unauthorized,
 )
 from .helpers.json import json_dumps
-from .util import dt as dt_util, location
+from .util import dt as dt_util, location, state_trace
 from .util.async_ import (
     cancelling,
     run_callback_threadsafe,
@@ -1155,6 +1155,19 @@ class EventBus:
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
+        if (
+            state_trace.active
+            and event_data
+            and isinstance(entity_id := event_data.get("entity_id"), str)
+            and state_trace.is_traced(entity_id)
+        ):
+            state_trace.record(
+                "event_bus.async_fire",
+                entity_id,
+                event_type=event_type,
+                listeners=len(listeners) + len(match_all_listeners),
+            )
+
         if not listeners and not match_all_listeners:
             return
 
@@ -1774,6 +1787,15 @@ class StateMachine:
             same_attr = old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
+        if state_trace.active and state_trace.is_traced(entity_id):
+            state_trace.record(
+                "state_machine.async_set",
+                entity_id,
+                state=new_state,
+                state_changed=not same_state,
+                attributes_changed=not same_attr,
+            )
+
         if same_state and same_attr:
             return
 
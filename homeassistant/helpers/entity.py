@@ -50,7 +50,7 @@ from homeassistant.exceptions import (
     NoEntitySpecifiedError,
 )
 from homeassistant.loader import async_suggest_report_issue, bind_hass
-from homeassistant.util import ensure_unique_string, slugify
+from homeassistant.util import ensure_unique_string, slugify, state_trace
 
 from . import device_registry as dr, entity_registry as er
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -482,7 +482,6 @@ class Entity(ABC):
 
     @property
     def state(self) -> StateType:
-        print("<helpers/entity.py/state> Return the state of the entity --> return self._attr_state")
         """Return the state of the entity."""
         return self._attr_state
 
@@ -746,7 +745,6 @@ class Entity(ABC):
         self._async_write_ha_state()
 
     def _stringify_state(self, available: bool) -> str:
-        print("<helpers/entity.py/_stringify_state> Convert state to string...")
         """Convert state to string."""
         if not available:
             return STATE_UNAVAILABLE
@@ -778,7 +776,6 @@ class Entity(ABC):
 
     @callback
     def _async_generate_attributes(self) -> tuple[str, dict[str, Any]]:
-        print("<helpers/entity.py/_async_generate_attributes> enter...")
         """Calculate state string and attribute mapping."""
         entry = self.registry_entry
 
@@ -823,7 +820,6 @@ class Entity(ABC):
 
     @callback
     def _async_write_ha_state(self) -> None:
-        print("<helpers/entity.py/_async_write_ha_state> called.")
         """Write the state to the state machine."""
         if self._platform_state == EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
@@ -831,7 +827,6 @@ class Entity(ABC):
 
         hass = self.hass
         entity_id = self.entity_id
-        print("<helpers/entity.py/_async_write_ha_state> entity_id: ", entity_id)
 
         if (entry := self.registry_entry) and entry.disabled_by:
             if not self._disabled_reported:
@@ -849,7 +844,17 @@ class Entity(ABC):
         start = timer()
         state, attr = self._async_generate_attributes()
         end = timer()
-        print("<helpers/entity.py/_async_write_ha_state> state: ", state, ", attr: ", attr)
+
+        if state_trace.active and state_trace.is_entity_traced(
+            entity_id, self.platform.platform_name if self.platform else None
+        ):
+            state_trace.record(
+                "entity.async_write_ha_state",
+                entity_id,
+                state=state,
+                attributes=attr,
+                duration=end - start,
+            )
 
         if end - start > 0.4 and not self._slow_reported:
             self._slow_reported = True
@@ -874,7 +879,6 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
-        print("<helpers/entity.py/_async_write_ha_state> hass.states.async_set...")
         try:
             hass.states.async_set(
                 entity_id,
@@ -1267,7 +1271,6 @@ class ToggleEntity(Entity):
     @property
     @final
     def state(self) -> Literal["on", "off"] | None:
-        print("<helpers/entity.py/class ToggleEntity(Entity)/def state(self)> enter...")
         """Return the state."""
         if (is_on := self.is_on) is None:
             return None
@@ -10,7 +10,7 @@ import functools as ft
 import logging
 from random import randint
 import time
-from typing import Any, Concatenate, ParamSpec, TypedDict, TypeVar
+from typing import Any, Concatenate, Generic, ParamSpec, TypedDict, TypeVar
 
 import attr
 
@@ -285,13 +285,13 @@ def async_track_state_change_event(
 @callback
 def _async_dispatch_entity_id_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
+    callbacks: dict[str, _KeyedJobs[EventStateChangedData]],
     event: EventType[EventStateChangedData],
 ) -> None:
     """Dispatch to listeners."""
     if not (callbacks_list := callbacks.get(event.data["entity_id"])):
         return
-    for job in callbacks_list[:]:
+    for job in callbacks_list.snapshot():
         try:
             hass.async_run_hass_job(job, event)
         except Exception:  # pylint: disable=broad-except
@@ -305,7 +305,7 @@ def _async_dispatch_entity_id_event(
 @callback
 def _async_state_change_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
+    callbacks: dict[str, _KeyedJobs[EventStateChangedData]],
     event: EventType[EventStateChangedData],
 ) -> bool:
     """Filter state changes by entity_id."""
@@ -336,23 +336,100 @@ def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
 
 
-@callback  # type: ignore[arg-type]  # mypy bug?
-def _remove_listener(
-    hass: HomeAssistant,
-    listeners_key: str,
-    keys: Iterable[str],
-    job: HassJob[[EventType[_TypedDictT]], Any],
-    callbacks: dict[str, list[HassJob[[EventType[_TypedDictT]], Any]]],
-) -> None:
-    """Remove listener."""
-    for key in keys:
-        callbacks[key].remove(job)
-        if len(callbacks[key]) == 0:
-            del callbacks[key]
+class _KeyedJobs(Generic[_TypedDictT]):
+    """The jobs listening to events of a key.
 
-    if not callbacks:
-        hass.data[listeners_key]()
-        del hass.data[listeners_key]
+    The jobs are kept in an insertion ordered dict so adding or removing
+    a job does not depend on the number of jobs. Events are dispatched to
+    a tuple snapshot of the jobs which is only rebuilt after the jobs
+    changed, so listeners can be added or removed during a dispatch.
+    """
+
+    __slots__ = ("_jobs", "_snapshot")
+
+    def __init__(self) -> None:
+        """Initialize the jobs."""
+        self._jobs: dict[HassJob[[EventType[_TypedDictT]], Any], None] = {}
+        self._snapshot: tuple[HassJob[[EventType[_TypedDictT]], Any], ...] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of jobs."""
+        return len(self._jobs)
+
+    def add(self, job: HassJob[[EventType[_TypedDictT]], Any]) -> None:
+        """Add a job."""
+        self._jobs[job] = None
+        self._snapshot = None
+
+    def remove(self, job: HassJob[[EventType[_TypedDictT]], Any]) -> None:
+        """Remove a job."""
+        del self._jobs[job]
+        self._snapshot = None
+
+    def snapshot(self) -> tuple[HassJob[[EventType[_TypedDictT]], Any], ...]:
+        """Return the jobs to dispatch an event to."""
+        if (snapshot := self._snapshot) is None:
+            snapshot = self._snapshot = tuple(self._jobs)
+        return snapshot
+
+
+class _KeyedEventListener(Generic[_TypedDictT]):
+    """A job listening to events by a set of keys."""
+
+    __slots__ = ("_hass", "_listeners_key", "_callbacks", "_job", "_keys")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        listeners_key: str,
+        callbacks: dict[str, _KeyedJobs[_TypedDictT]],
+        job: HassJob[[EventType[_TypedDictT]], Any],
+        keys: set[str],
+    ) -> None:
+        """Initialize the listener and add it to the callbacks."""
+        self._hass = hass
+        self._listeners_key = listeners_key
+        self._callbacks = callbacks
+        self._job = job
+        self._keys = keys
+        self._add_keys(keys)
+
+    def _add_keys(self, keys: Iterable[str]) -> None:
+        """Add the job to the callbacks of the keys."""
+        callbacks = self._callbacks
+        job = self._job
+        for key in keys:
+            if (jobs := callbacks.get(key)) is None:
+                jobs = callbacks[key] = _KeyedJobs()
+            jobs.add(job)
+
+    def _remove_keys(self, keys: Iterable[str]) -> None:
+        """Remove the job from the callbacks of the keys."""
+        callbacks = self._callbacks
+        job = self._job
+        for key in keys:
+            jobs = callbacks[key]
+            jobs.remove(job)
+            if not jobs:
+                del callbacks[key]
+
+    @callback
+    def async_update_keys(self, keys: set[str]) -> None:
+        """Listen to events of a new non empty set of keys.
+
+        Only the keys that were added or removed are updated.
+        """
+        old_keys = self._keys
+        self._keys = keys
+        self._add_keys(keys - old_keys)
+        self._remove_keys(old_keys - keys)
+
+    @callback
+    def __call__(self) -> None:
+        """Remove the listener."""
+        self._remove_keys(self._keys)
+        if not self._callbacks:
+            self._hass.data.pop(self._listeners_key)()
 
 
 def _async_track_event(
@@ -364,7 +441,7 @@ def _async_track_event(
     dispatcher_callable: Callable[
         [
             HomeAssistant,
-            dict[str, list[HassJob[[EventType[_TypedDictT]], Any]]],
+            dict[str, _KeyedJobs[_TypedDictT]],
             EventType[_TypedDictT],
         ],
         None,
@@ -372,7 +449,7 @@ def _async_track_event(
     filter_callable: Callable[
         [
             HomeAssistant,
-            dict[str, list[HassJob[[EventType[_TypedDictT]], Any]]],
+            dict[str, _KeyedJobs[_TypedDictT]],
             EventType[_TypedDictT],
         ],
         bool,
@@ -386,11 +463,46 @@ def _async_track_event(
     if isinstance(keys, str):
         keys = [keys]
 
+    return _async_listen_keyed_event(
+        hass,
+        set(keys),
+        callbacks_key,
+        listeners_key,
+        event_type,
+        dispatcher_callable,
+        filter_callable,
+        action,
+    )
+
+
+def _async_listen_keyed_event(
+    hass: HomeAssistant,
+    keys: set[str],
+    callbacks_key: str,
+    listeners_key: str,
+    event_type: str,
+    dispatcher_callable: Callable[
+        [
+            HomeAssistant,
+            dict[str, _KeyedJobs[_TypedDictT]],
+            EventType[_TypedDictT],
+        ],
+        None,
+    ],
+    filter_callable: Callable[
+        [
+            HomeAssistant,
+            dict[str, _KeyedJobs[_TypedDictT]],
+            EventType[_TypedDictT],
+        ],
+        bool,
+    ],
+    action: Callable[[EventType[_TypedDictT]], None],
+) -> _KeyedEventListener[_TypedDictT]:
+    """Track an event by a non empty set of keys."""
     hass_data = hass.data
 
-    callbacks: dict[
-        str, list[HassJob[[EventType[_TypedDictT]], Any]]
-    ] | None = hass_data.get(callbacks_key)
+    callbacks: dict[str, _KeyedJobs[_TypedDictT]] | None = hass_data.get(callbacks_key)
     if not callbacks:
         callbacks = hass_data[callbacks_key] = {}
 
@@ -403,22 +515,13 @@ def _async_track_event(
 
     job = HassJob(action, f"track {event_type} event {keys}")
 
-    for key in keys:
-        callback_list = callbacks.get(key)
-        if callback_list:
-            callback_list.append(job)
-        else:
-            callbacks[key] = [job]
-
-    return ft.partial(_remove_listener, hass, listeners_key, keys, job, callbacks)
+    return _KeyedEventListener(hass, listeners_key, callbacks, job, keys)
 
 
 @callback
 def _async_dispatch_old_entity_id_or_entity_id_event(
     hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventEntityRegistryUpdatedData]], Any]]
-    ],
+    callbacks: dict[str, _KeyedJobs[EventEntityRegistryUpdatedData]],
     event: EventType[EventEntityRegistryUpdatedData],
 ) -> None:
     """Dispatch to listeners."""
@@ -428,7 +531,7 @@ def _async_dispatch_old_entity_id_or_entity_id_event(
         )
     ):
         return
-    for job in callbacks_list[:]:
+    for job in callbacks_list.snapshot():
         try:
             hass.async_run_hass_job(job, event)
         except Exception:  # pylint: disable=broad-except
@@ -442,9 +545,7 @@ def _async_dispatch_old_entity_id_or_entity_id_event(
 @callback
 def _async_entity_registry_updated_filter(
     hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventEntityRegistryUpdatedData]], Any]]
-    ],
+    callbacks: dict[str, _KeyedJobs[EventEntityRegistryUpdatedData]],
     event: EventType[EventEntityRegistryUpdatedData],
 ) -> bool:
     """Filter entity registry updates by entity_id."""
@@ -479,9 +580,7 @@ def async_track_entity_registry_updated_event(
 @callback
 def _async_device_registry_updated_filter(
     hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventDeviceRegistryUpdatedData]], Any]]
-    ],
+    callbacks: dict[str, _KeyedJobs[EventDeviceRegistryUpdatedData]],
     event: EventType[EventDeviceRegistryUpdatedData],
 ) -> bool:
     """Filter device registry updates by device_id."""
@@ -491,15 +590,13 @@ def _async_device_registry_updated_filter(
 @callback
 def _async_dispatch_device_id_event(
     hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventDeviceRegistryUpdatedData]], Any]]
-    ],
+    callbacks: dict[str, _KeyedJobs[EventDeviceRegistryUpdatedData]],
     event: EventType[EventDeviceRegistryUpdatedData],
 ) -> None:
     """Dispatch to listeners."""
     if not (callbacks_list := callbacks.get(event.data["device_id"])):
         return
-    for job in callbacks_list[:]:
+    for job in callbacks_list.snapshot():
         try:
             hass.async_run_hass_job(job, event)
         except Exception:  # pylint: disable=broad-except
@@ -535,12 +632,17 @@ def async_track_device_registry_updated_event(
 @callback
 def _async_dispatch_domain_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
+    callbacks: dict[str, _KeyedJobs[EventStateChangedData]],
     event: EventType[EventStateChangedData],
 ) -> None:
     """Dispatch domain event listeners."""
     domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
+    domain_jobs = callbacks.get(domain)
+    all_jobs = callbacks.get(MATCH_ALL)
+    jobs = (domain_jobs.snapshot() if domain_jobs else ()) + (
+        all_jobs.snapshot() if all_jobs else ()
+    )
+    for job in jobs:
         try:
             hass.async_run_hass_job(job, event)
         except Exception:  # pylint: disable=broad-except
@@ -552,7 +654,7 @@ def _async_dispatch_domain_event(
 @callback
 def _async_domain_added_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
+    callbacks: dict[str, _KeyedJobs[EventStateChangedData]],
     event: EventType[EventStateChangedData],
 ) -> bool:
     """Filter state changes by entity_id."""
@@ -596,7 +698,7 @@ def _async_track_state_added_domain(
 @callback
 def _async_domain_removed_filter(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
+    callbacks: dict[str, _KeyedJobs[EventStateChangedData]],
     event: EventType[EventStateChangedData],
 ) -> bool:
     """Filter state changes by entity_id."""
@@ -649,6 +751,9 @@ class _TrackStateChangeFiltered:
             action, f"track state change filtered {track_states}"
         )
         self._listeners: dict[str, Callable[[], None]] = {}
+        self._entities_listener: _KeyedEventListener[
+            EventStateChangedData
+        ] | None = None
         self._last_track_states: TrackStates = track_states
 
     @callback
@@ -668,7 +773,7 @@ class _TrackStateChangeFiltered:
             return
 
         self._setup_domains_listener(track_states.domains)
-        self._setup_entities_listener(track_states.domains, track_states.entities)
+        self._update_entities_listener(track_states.domains, track_states.entities)
 
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
@@ -692,7 +797,7 @@ class _TrackStateChangeFiltered:
             if had_all_listener:
                 return
             self._cancel_listener(_DOMAINS_LISTENER)
-            self._cancel_listener(_ENTITIES_LISTENER)
+            self._cancel_entities_listener()
             self._setup_all_listener()
             return
 
@@ -711,8 +816,7 @@ class _TrackStateChangeFiltered:
             or domains_changed
             or new_track_states.entities != last_track_states.entities
         ):
-            self._cancel_listener(_ENTITIES_LISTENER)
-            self._setup_entities_listener(
+            self._update_entities_listener(
                 new_track_states.domains, new_track_states.entities
             )
 
@@ -721,6 +825,7 @@ class _TrackStateChangeFiltered:
         """Cancel the listeners."""
         for key in list(self._listeners):
             self._listeners.pop(key)()
+        self._cancel_entities_listener()
 
     @callback
     def _cancel_listener(self, listener_name: str) -> None:
@@ -730,23 +835,44 @@ class _TrackStateChangeFiltered:
         self._listeners.pop(listener_name)()
 
     @callback
-    def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
+    def _cancel_entities_listener(self) -> None:
+        if self._entities_listener is None:
+            return
+
+        self._entities_listener()
+        self._entities_listener = None
+
+    @callback
+    def _update_entities_listener(self, domains: set[str], entities: set[str]) -> None:
+        # The listener keeps the set to only update the changed entities later
+        entities = entities.copy()
         if domains:
-            entities = entities.copy()
             entities.update(self.hass.states.async_entity_ids(domains))
 
         # Entities has changed to none
         if not entities:
+            self._cancel_entities_listener()
+            return
+
+        # Only subscribe and unsubscribe the entities that changed
+        if self._entities_listener is not None:
+            self._entities_listener.async_update_keys(entities)
             return
 
-        self._listeners[_ENTITIES_LISTENER] = _async_track_state_change_event(
-            self.hass, entities, self._action
+        self._entities_listener = _async_listen_keyed_event(
+            self.hass,
+            entities,
+            TRACK_STATE_CHANGE_CALLBACKS,
+            TRACK_STATE_CHANGE_LISTENER,
+            EVENT_STATE_CHANGED,
+            _async_dispatch_entity_id_event,
+            _async_state_change_filter,
+            self._action,
         )
 
     @callback
     def _state_added(self, event: EventType[EventStateChangedData]) -> None:
-        self._cancel_listener(_ENTITIES_LISTENER)
-        self._setup_entities_listener(
+        self._update_entities_listener(
             self._last_track_states.domains, self._last_track_states.entities
         )
         self.hass.async_run_hass_job(self._action_as_hassjob, event)
@@ -898,6 +1024,7 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: TrackTemplateResultListener,
         has_super_template: bool = False,
+        batch_delay: float | None = None,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
@@ -915,6 +1042,18 @@ class TrackTemplateResultInfo:
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
+        self._batch_delay = batch_delay
+        self._batch_events: dict[Template, EventType[EventStateChangedData]] = {}
+        self._batch_last_event: EventType[EventStateChangedData] | None = None
+        self._batch_triggers = 0
+        self._batch_handle: asyncio.TimerHandle | None = None
+        self._batch_task: asyncio.Task[None] | None = None
+        self._flushing_batch: dict[
+            Template, EventType[EventStateChangedData]
+        ] | None = None
+        self.renders_saved = 0
+        self.rerenders_avoided = 0
+
     def __repr__(self) -> str:
         """Return the representation."""
         return f"<TrackTemplateResultInfo {self._info}>"
@@ -1028,6 +1167,12 @@ class TrackTemplateResultInfo:
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
+        if self._batch_handle is not None:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            self._batch_task = None
 
     @callback
     def async_refresh(self) -> None:
@@ -1052,12 +1197,23 @@ class TrackTemplateResultInfo:
         """
         template = track_template_.template
 
+        if event and self._flushing_batch is not None:
+            # Re-render the templates of a batch with the last event that
+            # triggered them, the others have not been triggered
+            if (batch_event := self._flushing_batch.get(template)) is None:
+                return False
+            event = batch_event
+
         if event:
             info = self._info[template]
 
             if not _event_triggers_rerender(event, info):
                 return False
 
+            if _event_changes_only_unread_state(event, info):
+                self.rerenders_avoided += 1
+                return False
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1125,6 +1281,15 @@ class TrackTemplateResultInfo:
         replayed is True if the event is being replayed because the
         rate limit was hit.
         """
+        if (
+            self._batch_delay is not None
+            and event is not None
+            and not replayed
+            and track_templates is None
+        ):
+            self._batch_event(event)
+            return
+
         updates: list[TrackTemplateResult] = []
         info_changed = False
         now = event.time_fired if not replayed and event else dt_util.utcnow()
@@ -1214,6 +1379,79 @@ class TrackTemplateResultInfo:
 
         self.hass.async_run_hass_job(self._job, event, updates)
 
+    @callback
+    def _batch_event(self, event: EventType[EventStateChangedData]) -> None:
+        """Collect the templates triggered by an event to re-render them once."""
+        for track_template_ in self._track_templates:
+            template = track_template_.template
+            if (info := self._info.get(template)) is None or (
+                not _event_triggers_rerender(event, info)
+            ):
+                continue
+            if _event_changes_only_unread_state(event, info):
+                self.rerenders_avoided += 1
+                continue
+            self._batch_events[template] = event
+            self._batch_triggers += 1
+
+        if not self._batch_events:
+            return
+
+        self._batch_last_event = event
+        if self._batch_handle is not None or self._batch_task is not None:
+            return
+        if self._batch_delay:
+            self._batch_handle = self.hass.loop.call_later(
+                self._batch_delay, self._flush_batch
+            )
+        else:
+            # A task runs after the callbacks already scheduled in this loop
+            # iteration and is waited for by async_block_till_done
+            self._batch_task = self.hass.async_create_task(
+                self._async_flush_batch(), "track template result batch"
+            )
+
+    async def _async_flush_batch(self) -> None:
+        """Re-render the templates of the batch from a task."""
+        self._batch_task = None
+        self._flush_batch()
+
+    @callback
+    def _flush_batch(self) -> None:
+        """Re-render each template triggered during the batch once."""
+        self._batch_handle = None
+        batch = self._batch_events
+        event = self._batch_last_event
+        triggers = self._batch_triggers
+        self._batch_events = {}
+        self._batch_last_event = None
+        self._batch_triggers = 0
+        assert event is not None
+
+        saved = triggers - len(batch)
+        self.renders_saved += saved
+        _LOGGER.debug(
+            "Template group %s re-renders %s templates for %s triggers, saved %s"
+            " renders",
+            self._track_templates,
+            len(batch),
+            triggers,
+            saved,
+        )
+
+        self._flushing_batch = batch
+        try:
+            self._refresh(
+                event,
+                track_templates=[
+                    track_template_
+                    for track_template_ in self._track_templates
+                    if track_template_.template in batch
+                ],
+            )
+        finally:
+            self._flushing_batch = None
+
 
 TrackTemplateResultListener = Callable[
     [
@@ -1243,6 +1481,7 @@ def async_track_template_result(
     strict: bool = False,
     log_fn: Callable[[int, str], None] | None = None,
     has_super_template: bool = False,
+    batch_delay: float | None = None,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1274,13 +1513,20 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    batch_delay
+        When not None, the state changes are collected and each template
+        triggered by them is re-rendered once per batch. A batch ends
+        with the current event loop iteration when set to 0, or after
+        the delay in seconds.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, batch_delay
+    )
     tracker.async_setup(strict=strict, log_fn=log_fn)
     return tracker
 
@@ -1817,6 +2063,32 @@ def _event_triggers_rerender(
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _event_changes_only_unread_state(
+    event: EventType[EventStateChangedData], info: RenderInfo
+) -> bool:
+    """Determine if an event only changed parts of a state the template did not read.
+
+    Templates like states.light | selectattr('state', 'eq', 'on') | list | count
+    only read the state value of the states of the iterated domain, changes of
+    their attributes do not change the result.
+    """
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
+    if (
+        old_state is None
+        or new_state is None
+        or old_state.state != new_state.state
+        or info.exception is not None
+    ):
+        return False
+
+    return (
+        new_state.entity_id not in info.entities
+        and new_state.domain not in info.domains_full_state
+    )
+
+
 @callback
 def _rate_limit_for_event(
     event: EventType[EventStateChangedData],
@@ -70,6 +70,10 @@ else:
     """Dump json bytes."""
 
 
+json_fragment = orjson.Fragment
+"""Wrap already serialized json so it is embedded as is."""
+
+
 class ExtendedJSONEncoder(JSONEncoder):
     """JSONEncoder that supports Home Assistant objects and falls back to repr(o)."""
 
@@ -151,15 +155,13 @@ def _orjson_default_encoder(data: Any) -> str:
     ).decode("utf-8")
 
 
-def save_json(
+def prepare_save_json(
     filename: str,
     data: list | dict,
-    private: bool = False,
     *,
     encoder: type[json.JSONEncoder] | None = None,
-    atomic_writes: bool = False,
-) -> None:
-    """Save JSON data to a file."""
+) -> str:
+    """Serialize JSON data to save to a file."""
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -169,10 +171,9 @@ def save_json(
             # If they pass a custom encoder that is not the
             # default JSONEncoder, we use the slow path of json.dumps
             dump = json.dumps
-            json_data = json.dumps(data, indent=2, cls=encoder)
-        else:
-            dump = _orjson_default_encoder
-            json_data = _orjson_default_encoder(data)
+            return json.dumps(data, indent=2, cls=encoder)
+        dump = _orjson_default_encoder
+        return _orjson_default_encoder(data)
     except TypeError as error:
         formatted_data = format_unserializable_data(
             find_paths_unserializable_data(data, dump=dump)
@@ -181,6 +182,28 @@ def save_json(
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
+
+def save_json(
+    filename: str,
+    data: list | dict,
+    private: bool = False,
+    *,
+    encoder: type[json.JSONEncoder] | None = None,
+    atomic_writes: bool = False,
+) -> None:
+    """Save JSON data to a file."""
+    json_data = prepare_save_json(filename, data, encoder=encoder)
+    write_json_data(filename, json_data, private, atomic_writes=atomic_writes)
+
+
+def write_json_data(
+    filename: str,
+    json_data: str,
+    private: bool = False,
+    *,
+    atomic_writes: bool = False,
+) -> None:
+    """Write serialized JSON data to a file."""
     if atomic_writes:
         write_utf8_file_atomic(filename, json_data, private)
     else:
@@ -0,0 +1,17 @@
+"""Provide shared helpers for the registries."""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Literal
+
+# Maps an indexed value, like a config entry id, to the keys of the entries
+# which have that value. The inner dicts are used as ordered sets.
+RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+
+
+def unindex_key(index: RegistryIndexType, index_key: str, key: str) -> None:
+    """Remove a key from an index and drop the index key once it is empty."""
+    keys = index[index_key]
+    del keys[key]
+    if not keys:
+        del index[index_key]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, MutableMapping
 import dataclasses
 from enum import Enum
 from functools import cache, partial, wraps
@@ -10,6 +10,7 @@ import logging
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, TypeVar, cast
 
+from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_CONTROL
@@ -29,6 +30,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -69,6 +71,18 @@ _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
 ALL_SERVICE_DESCRIPTIONS_CACHE = "all_service_descriptions_cache"
+TARGET_RESOLUTION_CACHE = "service_target_resolution_cache"
+
+MAX_TARGET_RESOLUTION_CACHE_SIZE = 256
+
+# Entity registry attributes that decide if a device or area targets an entity
+_ENTITY_TARGET_ATTRIBUTES = {
+    "area_id",
+    "device_id",
+    "entity_category",
+    "entity_id",
+    "hidden_by",
+}
 
 
 @cache
@@ -467,48 +481,163 @@ def async_extract_referenced_entity_ids(
     if not selector.device_ids and not selector.area_ids:
         return selected
 
-    ent_reg = entity_registry.async_get(hass)
-    dev_reg = device_registry.async_get(hass)
-    area_reg = area_registry.async_get(hass)
+    resolved = _async_get_target_resolution_cache(hass).async_resolve(
+        frozenset(selector.device_ids), frozenset(selector.area_ids)
+    )
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
 
-    for device_id in selector.device_ids:
-        if device_id not in dev_reg.devices:
-            selected.missing_devices.add(device_id)
+    return selected
 
-    for area_id in selector.area_ids:
-        if area_id not in area_reg.areas:
-            selected.missing_areas.add(area_id)
 
-    # Find devices for targeted areas
-    selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+@dataclasses.dataclass(slots=True, frozen=True)
+class _ResolvedTargets:
+    """Class to hold the registry items referenced by device and area ids."""
 
-    if not selector.area_ids and not selected.referenced_devices:
-        return selected
+    missing_devices: frozenset[str]
+    missing_areas: frozenset[str]
+    referenced_devices: frozenset[str]
+    indirectly_referenced: frozenset[str]
 
-    for ent_entry in ent_reg.entities.values():
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if ent_entry.entity_category is not None or ent_entry.hidden_by is not None:
-            continue
 
-        if (
-            # The entity's area matches a targeted area
-            ent_entry.area_id in selector.area_ids
-            # The entity's device matches a device referenced by an area and the entity
-            # has no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # The entity's device matches a targeted device
-            or ent_entry.device_id in selector.device_ids
+class _TargetResolutionCache:
+    """Cache the registry items referenced by device and area targets.
+
+    The cache is cleared when the registries change in a way that could
+    change which items a target references.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache and listen for registry changes."""
+        self._hass = hass
+        self._registries: tuple[Any, ...] = ()
+        self._resolved: MutableMapping[
+            tuple[frozenset[str], frozenset[str]], _ResolvedTargets
+        ] = LRU(MAX_TARGET_RESOLUTION_CACHE_SIZE)
+        hass.bus.async_listen(
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_entity_registry_updated,
+            run_immediately=True,
+        )
+        hass.bus.async_listen(
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_device_registry_updated,
+            run_immediately=True,
+        )
+        hass.bus.async_listen(
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            self._async_area_registry_updated,
+            run_immediately=True,
+        )
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Clear the cache when an entity changes how it can be targeted."""
+        if event.data["action"] != "update" or not _ENTITY_TARGET_ATTRIBUTES.isdisjoint(
+            event.data["changes"]
         ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+            self._resolved.clear()
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Clear the cache when a device is added, removed or moved."""
+        if event.data["action"] != "update" or "area_id" in event.data["changes"]:
+            self._resolved.clear()
+
+    @callback
+    def _async_area_registry_updated(self, event: Event) -> None:
+        """Clear the cache when an area is added or removed."""
+        if event.data["action"] != "update":
+            self._resolved.clear()
+
+    @callback
+    def async_resolve(
+        self, device_ids: frozenset[str], area_ids: frozenset[str]
+    ) -> _ResolvedTargets:
+        """Return the registry items referenced by device and area ids."""
+        hass = self._hass
+        registries = (
+            entity_registry.async_get(hass),
+            device_registry.async_get(hass),
+            area_registry.async_get(hass),
+        )
+        if registries != self._registries:
+            # The registries were replaced without firing update events
+            self._registries = registries
+            self._resolved.clear()
+        elif resolved := self._resolved.get((device_ids, area_ids)):
+            return resolved
+
+        resolved = self._resolved[(device_ids, area_ids)] = _resolve_targets(
+            *registries, device_ids, area_ids
+        )
+        return resolved
 
-    return selected
+
+@callback
+def _async_get_target_resolution_cache(hass: HomeAssistant) -> _TargetResolutionCache:
+    """Return the target resolution cache."""
+    if (cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        cache = hass.data[TARGET_RESOLUTION_CACHE] = _TargetResolutionCache(hass)
+    return cast(_TargetResolutionCache, cache)
+
+
+def _resolve_targets(
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+    device_ids: frozenset[str],
+    area_ids: frozenset[str],
+) -> _ResolvedTargets:
+    """Resolve the registry items referenced by device and area ids."""
+    missing_devices = {
+        device_id for device_id in device_ids if device_id not in dev_reg.devices
+    }
+    missing_areas = {area_id for area_id in area_ids if area_id not in area_reg.areas}
+
+    # Find devices for targeted areas
+    referenced_devices = set(device_ids)
+    for area_id in area_ids:
+        referenced_devices.update(
+            device_entry.id
+            for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
+        )
+
+    indirectly_referenced: set[str] = set()
+    # The entity's area matches a targeted area
+    for area_id in area_ids:
+        indirectly_referenced.update(
+            ent_entry.entity_id
+            for ent_entry in ent_reg.entities.get_entries_for_area_id(area_id)
+            if _is_indirect_target(ent_entry)
+        )
+    for device_id in referenced_devices:
+        indirectly_referenced.update(
+            ent_entry.entity_id
+            for ent_entry in ent_reg.entities.get_entries_for_device_id(
+                device_id, include_disabled_entities=True
+            )
+            if _is_indirect_target(ent_entry)
+            # The entity's device matches a device referenced by an area and the
+            # entity has no explicitly set area, or a targeted device
+            and (not ent_entry.area_id or device_id in device_ids)
+        )
+
+    return _ResolvedTargets(
+        frozenset(missing_devices),
+        frozenset(missing_areas),
+        frozenset(referenced_devices),
+        frozenset(indirectly_referenced),
+    )
+
+
+def _is_indirect_target(ent_entry: entity_registry.RegistryEntry) -> bool:
+    """Return if an entity can be targeted by its device or area."""
+    # Do not add entities which are hidden or which are config
+    # or diagnostic entities.
+    return ent_entry.entity_category is None and ent_entry.hidden_by is None
 
 
 @bind_hass
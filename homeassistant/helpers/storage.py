@@ -5,6 +5,7 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
@@ -94,8 +95,14 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        serialize_in_event_loop: bool = True,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If serialize_in_event_loop is False, the data_func passed to
+        async_delay_save is called in the executor and must be thread safe.
+        Writes of data that did not change since the last write are skipped.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,6 +116,8 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._serialize_in_event_loop = serialize_in_event_loop
+        self._last_digest: bytes | None = None
 
     @property
     def path(self):
@@ -340,7 +349,7 @@ class Store(Generic[_T]):
 
             data = self._data
 
-            if "data_func" in data:
+            if "data_func" in data and self._serialize_in_event_loop:
                 data["data"] = data.pop("data_func")()
 
             self._data = None
@@ -358,17 +367,29 @@ class Store(Generic[_T]):
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
+        if "data_func" in data:
+            data["data"] = data.pop("data_func")()
+
+        json_data = json_helper.prepare_save_json(path, data, encoder=self._encoder)
+
+        if not self._serialize_in_event_loop:
+            digest = hashlib.blake2b(json_data.encode(), digest_size=16).digest()
+            if digest == self._last_digest:
+                _LOGGER.debug("Data for %s did not change, skipping write", self.key)
+                return
+
+        # The file may no longer match the last digest if the write fails
+        self._last_digest = None
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
+        json_helper.write_json_data(
+            path, json_data, self._private, atomic_writes=self._atomic_writes
         )
 
+        if not self._serialize_in_event_loop:
+            self._last_digest = digest
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -377,6 +398,7 @@ class Store(Generic[_T]):
         """Remove all data."""
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        self._last_digest = None
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
@@ -32,7 +32,6 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -55,6 +54,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
@@ -112,6 +112,8 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "object_id",
     "name",
 }
+# Attributes that are the state value or derived from the entity_id
+_STATE_VALUE_ATTRIBUTES = {"state", "domain", "object_id"}
 
 _T = TypeVar("_T")
 _R = TypeVar("_R")
@@ -153,6 +155,17 @@ CACHED_TEMPLATE_NO_COLLECT_LRU: MutableMapping[State, TemplateState] = LRU(
 )
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+#
+# Compiled templates are shared by all template environments of the
+# same type, a template source is only compiled once no matter how
+# many entities, automations or scripts use it.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -339,6 +352,7 @@ class RenderInfo:
         "all_states_lifecycle",
         "domains",
         "domains_lifecycle",
+        "domains_full_state",
         "entities",
         "rate_limit",
         "has_time",
@@ -357,6 +371,8 @@ class RenderInfo:
         self.all_states_lifecycle = False
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
+        # Domains of iterated states that had more than their state value read
+        self.domains_full_state: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
@@ -369,6 +385,7 @@ class RenderInfo:
             f" all_states_lifecycle={self.all_states_lifecycle}"
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
+            f" domains_full_state={self.domains_full_state}"
             f" entities={self.entities}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
@@ -415,6 +432,7 @@ class RenderInfo:
         self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
+        self.domains_full_state = frozenset(self.domains_full_state)
 
     def _freeze(self) -> None:
         self._freeze_sets()
@@ -945,6 +963,15 @@ class TemplateStateBase(State):
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
 
     def _collect_state(self) -> None:
+        if render_info := _render_info.get():
+            if self._collect:
+                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            else:
+                # States of iterated domains are not collected, but the
+                # template depends on more than their state value now
+                render_info.domains_full_state.add(self._state.domain)  # type: ignore[attr-defined]
+
+    def _collect_state_value(self) -> None:
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
@@ -954,8 +981,13 @@ class TemplateStateBase(State):
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            if self._collect:
+                if render_info := _render_info.get():
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            elif item not in _STATE_VALUE_ATTRIBUTES and (
+                render_info := _render_info.get()
+            ):
+                render_info.domains_full_state.add(self._state.domain)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -974,7 +1006,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.state
 
     @property
@@ -1004,13 +1036,13 @@ class TemplateStateBase(State):
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.object_id
 
     @property
@@ -1047,6 +1079,11 @@ class TemplateStateBase(State):
         self._collect_state()
         return self._state.__eq__(other)
 
+    def as_dict(self) -> ReadOnlyDict[str, Collection[Any]]:
+        """Return a dict representation of the State."""
+        self._collect_state()
+        return super().as_dict()
+
 
 class TemplateState(TemplateStateBase):
     """Class to represent a state object in a template."""
@@ -1061,6 +1098,8 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        if not self._collect:
+            self._collect_state()
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -2349,6 +2388,110 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+class CompiledTemplateCache:
+    """A size bounded cache of compiled templates.
+
+    The generated code depends on the filters of the environment, templates
+    are cached by their source and the type of the environment.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty cache."""
+        self._code: MutableMapping[tuple[str, tuple[bool, bool]], CodeType] = LRU(size)
+        self.hits = 0
+        self.misses = 0
+        self.bytecode_cache: jinja2.BytecodeCache | None = None
+
+    def __len__(self) -> int:
+        """Return the number of cached templates."""
+        return len(self._code)
+
+    def get(self, source: str, env_type: tuple[bool, bool]) -> CodeType | None:
+        """Return the compiled template or None if it is not cached."""
+        if (code := self._code.get((source, env_type))) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return code
+
+    def set(self, source: str, env_type: tuple[bool, bool], code: CodeType) -> None:
+        """Cache a compiled template."""
+        self._code[(source, env_type)] = code
+
+    def clear(self) -> None:
+        """Remove all compiled templates and reset the counters."""
+        self._code.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+COMPILED_TEMPLATE_CACHE = CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
+
+class TemplateBytecodeCache(jinja2.BytecodeCache):
+    """A jinja bytecode cache persisted in a store.
+
+    Only the bytecode of templates compiled since the start is saved, the
+    bytecode of templates that are no longer used is dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        # pylint: disable-next=import-outside-toplevel
+        from .storage import Store
+
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, BYTECODE_CACHE_STORAGE_VERSION, BYTECODE_CACHE_STORAGE_KEY
+        )
+        self._stored: dict[str, str] = {}
+        self._used: dict[str, str] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored bytecode."""
+        if (data := await self._store.async_load()) is not None and data.get(
+            "ha_version"
+        ) == __version__:
+            self._stored = data["bytecode"]
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Load the bytecode of a template into the bucket."""
+        if (bytecode := self._stored.get(bucket.key)) is None:
+            return
+        bucket.bytecode_from_string(base64.b64decode(bytecode))
+        self._used[bucket.key] = bytecode
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Store the bytecode of a compiled template."""
+        bytecode = base64.b64encode(bucket.bytecode_to_string()).decode()
+        self._stored[bucket.key] = self._used[bucket.key] = bytecode
+        # Templates may be compiled outside the event loop
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    def clear(self) -> None:
+        """Remove all bytecode."""
+        self._stored = {}
+        self._used = {}
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the bytecode."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the bytecode to store."""
+        return {"ha_version": __version__, "bytecode": self._used}
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Persist the bytecode of compiled templates across restarts."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    COMPILED_TEMPLATE_CACHE.bytecode_cache = bytecode_cache
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2362,9 +2505,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | str | None
-        ] = weakref.WeakValueDictionary()
+        self.env_type = (hass is not None, bool(limited))
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2655,10 +2796,24 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        if not isinstance(source, str):
+            return super().compile(source)
+
+        compiled = COMPILED_TEMPLATE_CACHE
+        if (code := compiled.get(source, self.env_type)) is not None:
+            return code
 
-        return cached
+        if (bytecode_cache := compiled.bytecode_cache) is None:
+            code = super().compile(source)
+        else:
+            bucket = bytecode_cache.get_bucket(
+                self, source, repr(self.env_type), source
+            )
+            if (code := bucket.code) is None:
+                code = bucket.code = super().compile(source)
+                bytecode_cache.set_bucket(bucket)
+        compiled.set(source, self.env_type, code)
+        return code
 
 
 _NO_HASS_ENV = TemplateEnvironment(None)
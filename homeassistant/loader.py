@@ -12,8 +12,10 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
 import sys
+import threading
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,6 +27,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -48,6 +51,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_CACHE = "integration_manifest_cache"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -59,6 +63,10 @@ CUSTOM_WARNING = (
 
 _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular dependency
 
+MANIFEST_CACHE_STORAGE_KEY = "core.integration_manifests"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 60
+
 MAX_LOAD_CONCURRENTLY = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
@@ -242,6 +250,152 @@ async def async_get_custom_components(
     return cast(dict[str, "Integration"], reg_or_evt)
 
 
+class _ManifestCache:
+    """Persisted manifests and dependencies of the resolved integrations.
+
+    Manifests are keyed on the path and modification time of the manifest
+    file, the whole cache is dropped when Home Assistant is updated. The
+    resolved dependencies of an integration are dropped when the manifest
+    of the integration or one of its dependencies changes or a custom
+    integration is added for one of them.
+
+    Manifests are read and stored from the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+        )
+        self._lock = threading.Lock()
+        # Domain to manifest path, modification time and manifest
+        self._manifests: dict[str, tuple[str, int, Manifest]] = {}
+        self._dependencies: dict[str, set[str]] = {}
+
+    async def async_load(self) -> None:
+        """Load the cache and drop the manifests that changed."""
+        if (data := await self._store.async_load()) is None or data.get(
+            "ha_version"
+        ) != __version__:
+            return
+        self._manifests = data["manifests"]
+        self._dependencies = {
+            domain: set(dependencies)
+            for domain, dependencies in data["dependencies"].items()
+        }
+        custom_paths: list[str] = []
+        with suppress(ImportError):
+            import custom_components  # pylint: disable=import-outside-toplevel
+
+            custom_paths = list(custom_components.__path__)
+        await self.hass.async_add_executor_job(self._validate, custom_paths)
+
+    def _validate(self, custom_paths: list[str]) -> None:
+        """Drop changed manifests and dependencies on new custom integrations."""
+        for domain, (path, mtime, _) in list(self._manifests.items()):
+            try:
+                if os.stat(path).st_mtime_ns == mtime:
+                    continue
+            except OSError:
+                pass
+            self._invalidate(domain)
+        for path in custom_paths:
+            with suppress(OSError):
+                for entry in os.scandir(path):
+                    if entry.is_dir() and not (
+                        (cached := self._manifests.get(entry.name))
+                        and cached[0].startswith(path)
+                    ):
+                        self._invalidate(entry.name)
+
+    def _invalidate(self, domain: str) -> None:
+        """Drop a manifest and the dependencies that include it."""
+        self._manifests.pop(domain, None)
+        self._dependencies = {
+            dep_domain: dependencies
+            for dep_domain, dependencies in self._dependencies.items()
+            if dep_domain != domain and domain not in dependencies
+        }
+
+    def get_manifest(self, domain: str, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the cached manifest for a manifest path."""
+        if (cached := self._manifests.get(domain)) and cached[0] == str(manifest_path):
+            return cached[2]
+        return None
+
+    def set_manifest(
+        self, domain: str, manifest_path: pathlib.Path, manifest: Manifest
+    ) -> None:
+        """Store a manifest that was read from disk."""
+        try:
+            mtime = manifest_path.stat().st_mtime_ns
+        except OSError:
+            return
+        with self._lock:
+            self._invalidate(domain)
+            self._manifests[domain] = (str(manifest_path), mtime, manifest)
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    def _is_cached(self, integration: Integration) -> bool:
+        """Return if the integration was created from the cached manifest."""
+        cached = self._manifests.get(integration.domain)
+        return cached is not None and cached[2] is integration.manifest
+
+    @callback
+    def async_get_dependencies(self, integration: Integration) -> set[str] | None:
+        """Return the cached dependencies of an integration."""
+        if not self._is_cached(integration):
+            return None
+        with self._lock:
+            return self._dependencies.get(integration.domain)
+
+    @callback
+    def async_set_dependencies(
+        self, integration: Integration, dependencies: set[str]
+    ) -> None:
+        """Store the dependencies of an integration."""
+        if not self._is_cached(integration):
+            return
+        with self._lock:
+            self._dependencies[integration.domain] = dependencies
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the cache to store."""
+        with self._lock:
+            return {
+                "ha_version": __version__,
+                "manifests": dict(self._manifests),
+                "dependencies": {
+                    domain: sorted(dependencies)
+                    for domain, dependencies in self._dependencies.items()
+                },
+            }
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the persisted manifests of the integrations.
+
+    The cache is not used in recovery and safe mode since custom
+    integrations are not loaded.
+    """
+    if hass.config.recovery_mode or hass.config.safe_mode:
+        return
+    cache = _ManifestCache(hass)
+    await cache.async_load()
+    hass.data[DATA_MANIFEST_CACHE] = cache
+
+
 async def async_get_config_flows(
     hass: HomeAssistant,
     type_filter: Literal["device", "helper", "hub", "service"] | None = None,
@@ -554,19 +708,29 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        cache: _ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+            if (
+                cache is None
+                or (manifest := cache.get_manifest(domain, manifest_path)) is None
+            ):
+                if not manifest_path.is_file():
+                    continue
+
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s",
+                        manifest_path,
+                        err,
+                    )
+                    continue
+
+                if cache is not None:
+                    cache.set_manifest(domain, manifest_path, manifest)
 
             integration = cls(
                 hass,
@@ -639,6 +803,7 @@ class Integration:
         else:
             self._all_dependencies_resolved = True
             self._all_dependencies = set()
+        self._import_lock: asyncio.Lock | None = None
 
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -774,6 +939,12 @@ class Integration:
         if self._all_dependencies_resolved is not None:
             return self._all_dependencies_resolved
 
+        cache: _ManifestCache | None = self.hass.data.get(DATA_MANIFEST_CACHE)
+        if cache and (dependencies := cache.async_get_dependencies(self)) is not None:
+            self._all_dependencies = dependencies
+            self._all_dependencies_resolved = True
+            return True
+
         self._all_dependencies_resolved = False
         try:
             dependencies = await _async_component_dependencies(self.hass, self)
@@ -800,6 +971,8 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            if cache:
+                cache.async_set_dependencies(self, dependencies)
 
         return self._all_dependencies_resolved
 
@@ -823,6 +996,22 @@ class Integration:
 
         return cache[self.domain]
 
+    async def async_get_component(self) -> ComponentProtocol:
+        """Return the component, importing it in the executor.
+
+        Imports of the integration package are serialized so two imports of
+        the same package never wait on each other's import locks.
+        """
+        cache: dict[str, ComponentProtocol] = self.hass.data[DATA_COMPONENTS]
+        if self.domain in cache:
+            return cache[self.domain]
+
+        if self.pkg_path not in sys.modules:
+            await self._async_import(
+                self.pkg_path, importlib.import_module, self.pkg_path
+            )
+        return self.get_component()
+
     def get_platform(self, platform_name: str) -> ModuleType:
         """Return a platform for an integration."""
         cache: dict[str, ModuleType] = self.hass.data[DATA_COMPONENTS]
@@ -846,6 +1035,64 @@ class Integration:
 
         return cache[full_name]
 
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform for an integration, importing it in the executor."""
+        cache: dict[str, ModuleType] = self.hass.data[DATA_COMPONENTS]
+        full_name = f"{self.domain}.{platform_name}"
+        if full_name in cache:
+            return cache[full_name]
+
+        if (name := f"{self.pkg_path}.{platform_name}") not in sys.modules:
+            await self._async_import(name, self._import_platform, platform_name)
+        return self.get_platform(platform_name)
+
+    async def async_preload(self, platform_names: Iterable[str] = ()) -> None:
+        """Import the component and platforms in the executor.
+
+        The modules are not added to the component cache and errors are
+        ignored, they are raised again when the component or platform is
+        loaded.
+        """
+        cache: dict[str, ModuleType] = self.hass.data[DATA_COMPONENTS]
+        try:
+            if self.domain not in cache and self.pkg_path not in sys.modules:
+                await self._async_import(
+                    self.pkg_path, importlib.import_module, self.pkg_path
+                )
+            for platform_name in platform_names:
+                name = f"{self.pkg_path}.{platform_name}"
+                if f"{self.domain}.{platform_name}" in cache or name in sys.modules:
+                    continue
+                await self._async_import(name, self._import_platform, platform_name)
+        except ImportError as err:
+            _LOGGER.debug("Unable to preload %s: %s", self.domain, err)
+
+    async def _async_import(
+        self, name: str, target: Callable[..., ModuleType], *args: Any
+    ) -> None:
+        """Import a module of the integration package in the executor.
+
+        Only a missing module is raised, any other exception is left to the
+        synchronous import that follows so it is logged and wrapped the same
+        way, this also covers the import deadlock detection of Python when
+        another thread is importing a module of this package.
+        """
+        if self._import_lock is None:
+            self._import_lock = asyncio.Lock()
+        async with self._import_lock:
+            if name in sys.modules:
+                return
+            try:
+                await self.hass.async_add_executor_job(target, *args)
+            except ImportError:
+                raise
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.debug(
+                    "Importing %s in the executor failed, retrying in the event loop",
+                    name,
+                    exc_info=True,
+                )
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
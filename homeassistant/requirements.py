@@ -63,6 +63,18 @@ async def async_process_requirements(
     await _async_get_manager(hass).async_process_requirements(name, requirements)
 
 
+@callback
+def async_requirements_installed(
+    hass: HomeAssistant, requirements: Iterable[str]
+) -> bool:
+    """Return if the requirements are known to be installed.
+
+    Requirements are known once they have been processed or when pip
+    is skipped for them.
+    """
+    return _async_get_manager(hass).async_requirements_installed(requirements)
+
+
 @callback
 def _async_get_manager(hass: HomeAssistant) -> RequirementsManager:
     """Get the requirements manager."""
@@ -247,6 +259,18 @@ class RequirementsManager:
             if missing:
                 await self._async_process_requirements(name, missing)
 
+    @callback
+    def async_requirements_installed(self, requirements: Iterable[str]) -> bool:
+        """Return if the requirements are known to be installed."""
+        if self.hass.config.skip_pip:
+            return True
+        skip_pip_packages = self.hass.config.skip_pip_packages
+        return all(
+            req in self.is_installed_cache
+            or (skip_pip_packages and Requirement(req).name in skip_pip_packages)
+            for req in requirements
+        )
+
     def _find_missing_requirements(self, requirements: list[str]) -> list[str]:
         """Find requirements that are missing in the cache."""
         return [req for req in requirements if req not in self.is_installed_cache]
@@ -43,6 +43,7 @@ class RuntimeConfig:
     config_dir: str
     skip_pip: bool = False
     skip_pip_packages: list[str] = dataclasses.field(default_factory=list)
+    template_bytecode_cache: bool = False
     recovery_mode: bool = False
 
     verbose: bool = False
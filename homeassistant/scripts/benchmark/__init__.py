@@ -6,19 +6,38 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
 from timeit import default_timer as timer
 from typing import TypeVar
 
-from homeassistant import core
+from homeassistant import core, loader
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+    service,
+    template,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    TrackStates,
+    TrackTemplate,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_state_change_filtered,
+    async_track_template_result,
 )
-from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.helpers.json import JSON_DUMP, JSONEncoder, json_fragment
+import homeassistant.util.yaml as yaml_util
+from homeassistant.util.yaml import loader as yaml_loader
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -227,6 +246,63 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_event_listener_churn(hass):
+    """Resubscribe 10,000 state change listeners across 5,000 entities.
+
+    Every listener tracks a few entities and moves one of them to another
+    entity each round like template listeners do after a render, while
+    state changes are dispatched in between.
+    """
+    count = 0
+    entity_count = 5000
+    listener_count = 10000
+    rounds = 20
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    def entity_ids(idx, offset):
+        """Return the entities a listener tracks in a round."""
+        return {
+            f"sensor.benchmark_{idx % entity_count}",
+            f"sensor.benchmark_{(idx + 1) % entity_count}",
+            f"sensor.benchmark_{(idx * 7 + offset) % entity_count}",
+        }
+
+    start = timer()
+
+    trackers = [
+        async_track_state_change_filtered(
+            hass, TrackStates(False, entity_ids(idx, 0), set()), listener
+        )
+        for idx in range(listener_count)
+    ]
+    event_data = {
+        "entity_id": "sensor.benchmark_0",
+        "old_state": core.State("sensor.benchmark_0", "off"),
+        "new_state": core.State("sensor.benchmark_0", "on"),
+    }
+    for offset in range(1, rounds + 1):
+        for idx, tracker in enumerate(trackers):
+            tracker.async_update_listeners(
+                TrackStates(False, entity_ids(idx, offset), set())
+            )
+        for idx in range(entity_count):
+            event_data["entity_id"] = f"sensor.benchmark_{idx}"
+            hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+        await hass.async_block_till_done()
+    for tracker in trackers:
+        tracker.async_remove()
+
+    assert count >= 2 * listener_count * rounds
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -357,3 +433,707 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row, {})
+
+
+@benchmark
+async def mqtt_retained_burst(hass):
+    """Replay a burst of 50k retained MQTT messages from the paho thread.
+
+    Reports the number of event loop wakeups needed to handle the burst.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import MQTT, Subscription
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.models import MqttData
+
+    count = 0
+    wakeups = 0
+    messages_to_send = 5 * 10**4
+    done = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+        if count == messages_to_send:
+            done.set()
+
+    client = MQTT(hass, None, {})
+    client._mqtt_data = MqttData(client=client, config=[])
+    job = core.HassJob(listener)
+    for topic in ("zigbee2mqtt/+", "tasmota/discovery/#", "homeassistant/#"):
+        client._async_track_subscription(Subscription(topic, job))
+
+    msgs = []
+    for idx in range(messages_to_send):
+        msg = MQTTMessage(topic=f"zigbee2mqtt/device_{idx % 3000}".encode())
+        msg.payload = b'{"state":"ON","brightness":254}'
+        msg.retain = idx < 3000
+        msgs.append(msg)
+
+    loop = hass.loop
+    call_soon_threadsafe = loop.call_soon_threadsafe
+
+    def counting_call_soon_threadsafe(*args, **kwargs):
+        """Count the event loop wakeups."""
+        nonlocal wakeups
+        wakeups += 1
+        return call_soon_threadsafe(*args, **kwargs)
+
+    def replay_burst():
+        """Deliver the messages like the paho thread does."""
+        for msg in msgs:
+            client._mqtt_on_message(None, None, msg)
+
+    loop.call_soon_threadsafe = counting_call_soon_threadsafe
+    try:
+        start = timer()
+        await hass.async_add_executor_job(replay_burst)
+        await done.wait()
+        runtime = timer() - start
+    finally:
+        loop.call_soon_threadsafe = call_soon_threadsafe
+
+    print(f"Event loop wakeups: {wakeups}")
+    return runtime
+
+
+@benchmark
+async def compile_statistics(hass):
+    """Compile mean, min and max of 2,000 sensors with 30 states each.
+
+    Compares compiling one state at a time with datetimes with the
+    flat columns used by the sensor statistics.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from datetime import timedelta
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.columnar_statistics import ColumnarStates
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.models import LazyState
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util import dt as dt_util
+
+    def time_weighted_average(fstates, start, end):
+        """Calculate a time weighted average one state at a time."""
+        old_fstate = old_start_time = None
+        accumulated = 0.0
+        for fstate, state in fstates:
+            start_time = start if state.last_updated < start else state.last_updated
+            if old_start_time is None:
+                start = start_time
+            else:
+                duration = start_time - old_start_time
+                accumulated += old_fstate * duration.total_seconds()
+            old_fstate = fstate
+            old_start_time = start_time
+        accumulated += old_fstate * (end - old_start_time).total_seconds()
+        if (period_seconds := (end - start).total_seconds()) == 0:
+            return 0.0
+        return accumulated / period_seconds
+
+    start = dt_util.utcnow().replace(second=0, microsecond=0)
+    end = start + timedelta(minutes=5)
+    start_ts = start.timestamp()
+    entity_fstates = {}
+    for idx in range(2000):
+        entity_id = f"sensor.benchmark_{idx}"
+        entity_fstates[entity_id] = [
+            (
+                float(idx + state_idx),
+                LazyState(
+                    None,
+                    {},
+                    None,
+                    entity_id,
+                    str(idx + state_idx),
+                    start_ts + state_idx * 10.123456,
+                    False,
+                ),
+            )
+            for state_idx in range(30)
+        ]
+
+    start_time = timer()
+    expected = {}
+    for entity_id, fstates in entity_fstates.items():
+        values = [fstate for fstate, _ in fstates]
+        expected[entity_id] = (
+            time_weighted_average(fstates, start, end),
+            min(values),
+            max(values),
+        )
+    python_runtime = timer() - start_time
+
+    start_time = timer()
+    columns = ColumnarStates()
+    for entity_id, fstates in entity_fstates.items():
+        columns.add(entity_id, fstates)
+    compiled = columns.compile(start, end)
+    runtime = timer() - start_time
+
+    assert compiled == expected
+    print(f"One state at a time done in {python_runtime}s")
+    return runtime
+
+
+@benchmark
+async def history_stream_json(hass):
+    """Build the history json of 200 sensors with 100 states each.
+
+    Compares the time until the response is ready to be sent and the
+    peak traced memory of serializing the compressed state dicts with
+    writing the json straight from the columnar rows.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import tracemalloc
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import config_entries
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import history
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import entity, recorder as recorder_helper
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.setup import async_setup_component
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util import dt as dt_util
+
+    logging.getLogger("homeassistant.components.recorder").setLevel(logging.WARNING)
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(200)]
+
+    def dicts_response(start):
+        """Serialize the compressed state dicts like before."""
+        return JSON_DUMP(
+            history.get_significant_states(
+                hass, start, None, entity_ids, None, True, False, False, False, True
+            )
+        )
+
+    def columnar_response(start):
+        """Write the json straight from the columnar rows."""
+        states, _ = history.get_significant_states_json(
+            hass, start, None, entity_ids, True, False, False, False
+        )
+        return JSON_DUMP(
+            {entity_id: json_fragment(json) for entity_id, json in states.items()}
+        )
+
+    def measure(response, start):
+        """Return the time to the response and its peak traced memory."""
+        start_time = timer()
+        response(start)
+        runtime = timer() - start_time
+        tracemalloc.start()
+        try:
+            response(start)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return runtime, peak
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        entity.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        config = {"recorder": {"db_url": f"sqlite:///{config_dir}/benchmark.db"}}
+        hass.config_entries = config_entries.ConfigEntries(hass, config)
+        await hass.config_entries.async_initialize()
+        await async_setup_component(hass, "recorder", config)
+        await hass.async_start()
+        instance = recorder.get_instance(hass)
+        start = dt_util.utcnow()
+        for state_idx in range(100):
+            for idx, entity_id in enumerate(entity_ids):
+                hass.states.async_set(
+                    entity_id,
+                    str(idx + state_idx),
+                    {"unit_of_measurement": "W", "friendly_name": entity_id},
+                )
+            await instance.async_block_till_done()
+
+        dicts_runtime, dicts_peak = await instance.async_add_executor_job(
+            measure, dicts_response, start
+        )
+        runtime, peak = await instance.async_add_executor_job(
+            measure, columnar_response, start
+        )
+        await hass.async_stop()
+
+    print(
+        f"Compressed state dicts done in {dicts_runtime}s"
+        f" with a peak of {dicts_peak / 1e6:.1f} MB"
+    )
+    print(f"Columnar rows peaked at {peak / 1e6:.1f} MB")
+    return runtime
+
+
+@benchmark
+async def entity_registry_save(hass):
+    """Save entity registries of 1,000 to 20,000 entities.
+
+    Prints the longest event loop stall and the duration of a save
+    when the data is serialized in and out of the event loop.
+    """
+    logging.getLogger(er.__name__).setLevel(logging.WARNING)
+    loop = hass.loop
+    longest_stall = 0.0
+    runtime = 0.0
+
+    async def measure_stalls():
+        """Measure how long the event loop is blocked."""
+        nonlocal longest_stall
+        last = loop.time()
+        while True:
+            await asyncio.sleep(0)
+            now = loop.time()
+            longest_stall = max(longest_stall, now - last)
+            last = now
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        for size in (1000, 5000, 10000, 20000):
+            registry = er.EntityRegistry(hass)
+            await registry.async_load()
+            for idx in range(size):
+                registry.async_get_or_create(
+                    "sensor",
+                    "benchmark",
+                    str(idx),
+                    original_name=f"Benchmark sensor {idx}",
+                )
+            store = registry._store  # pylint: disable=protected-access
+            for serialize_in_event_loop in (True, False):
+                # pylint: disable-next=protected-access
+                store._serialize_in_event_loop = serialize_in_event_loop
+                registry.async_schedule_save()
+                longest_stall = 0.0
+                stall_task = asyncio.create_task(measure_stalls())
+                await asyncio.sleep(0)
+                start = timer()
+                # pylint: disable-next=protected-access
+                await store._async_handle_write_data()
+                duration = timer() - start
+                stall_task.cancel()
+                if not serialize_in_event_loop:
+                    runtime += duration
+                print(
+                    f"{size} entities, serialize in event loop"
+                    f" {serialize_in_event_loop}: save {duration:.4f}s,"
+                    f" longest loop stall {longest_stall:.4f}s"
+                )
+
+    return runtime
+
+
+@benchmark
+async def integration_import(hass):
+    """Import integrations in and out of the event loop.
+
+    Prints the time the event loop is blocked for longer than 10ms when the
+    integration modules are imported in the event loop and with the executor
+    import API. The requirements are imported once before measuring.
+    """
+    logging.getLogger(loader.__name__).setLevel(logging.ERROR)
+    loader.async_setup(hass)
+    loop = hass.loop
+    blocked = 0.0
+    longest_stall = 0.0
+    runtime = 0.0
+
+    async def measure_stalls():
+        """Measure how long the event loop is blocked."""
+        nonlocal blocked, longest_stall
+        last = loop.time()
+        while True:
+            await asyncio.sleep(0)
+            now = loop.time()
+            if now - last > 0.01:
+                blocked += now - last
+            longest_stall = max(longest_stall, now - last)
+            last = now
+
+    integrations = []
+    for int_or_exc in (
+        await loader.async_get_integrations(
+            hass,
+            (
+                "alexa",
+                "climate",
+                "google_assistant",
+                "group",
+                "light",
+                "mqtt",
+                "sensor",
+                "template",
+                "zha",
+                "zwave_js",
+            ),
+        )
+    ).values():
+        if not isinstance(int_or_exc, loader.Integration):
+            continue
+        try:
+            await int_or_exc.async_get_component()
+        except ImportError:
+            continue
+        integrations.append(int_or_exc)
+    domains = {integration.domain for integration in integrations}
+    print("Importing", ", ".join(sorted(domains)))
+
+    for import_in_executor in (False, True):
+        hass.data[loader.DATA_COMPONENTS].clear()
+        for name in list(sys.modules):
+            if (
+                name.startswith("homeassistant.components.")
+                and name.split(".")[2] in domains
+            ):
+                del sys.modules[name]
+        blocked = longest_stall = 0.0
+        stall_task = asyncio.create_task(measure_stalls())
+        await asyncio.sleep(0)
+        start = timer()
+        for integration in integrations:
+            if import_in_executor:
+                await integration.async_get_component()
+            else:
+                integration.get_component()
+                await asyncio.sleep(0)
+        duration = timer() - start
+        stall_task.cancel()
+        runtime += duration
+        print(
+            f"Import in executor {import_in_executor}: import {duration:.4f}s,"
+            f" loop blocked {blocked:.4f}s, longest loop stall {longest_stall:.4f}s"
+        )
+
+    return runtime
+
+
+@benchmark
+async def yaml_config_reload(hass):
+    """Reload a configuration with 600 package files after changing one of them."""
+    packages = 600
+    old_mtime = time.time() - 3600
+
+    def write_file(path: str, content: str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.utime(path, (old_mtime, old_mtime))
+
+    def load(config_file: str, config_dir: str) -> float:
+        start = timer()
+        yaml_util.load_yaml_dict(config_file, yaml_util.Secrets(Path(config_dir)))
+        return timer() - start
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        config_file = os.path.join(config_dir, "configuration.yaml")
+        write_file(
+            config_file,
+            "homeassistant:\n  packages: !include_dir_named packages\n",
+        )
+        write_file(os.path.join(config_dir, "secrets.yaml"), "password: secret\n")
+        os.mkdir(os.path.join(config_dir, "packages"))
+        for idx in range(packages):
+            booleans = "".join(
+                f"  package_{idx}_{entity}:\n    name: Package {idx} {entity}\n"
+                for entity in range(5)
+            )
+            automations = "".join(
+                f"""  - alias: Package {idx} automation {entity}
+    trigger:
+      - platform: state
+        entity_id: input_boolean.package_{idx}_{entity}
+        to: "on"
+    action:
+      - service: notify.notify
+        data:
+          message: "{{{{ states('sensor.package_{idx}') }}}}"
+          password: !secret password
+"""
+                for entity in range(5)
+            )
+            write_file(
+                os.path.join(config_dir, "packages", f"package_{idx}.yaml"),
+                f"input_boolean:\n{booleans}automation:\n{automations}",
+            )
+
+        changed_file = os.path.join(config_dir, "packages", "package_0.yaml")
+        yaml_loader.clear_cache()
+        print(f"Full load without cache: {load(config_file, config_dir):.4f}s")
+        yaml_loader.clear_cache()
+        load(config_file, config_dir)
+        print(f"Reload, nothing changed: {load(config_file, config_dir):.4f}s")
+        old_mtime += 1
+        write_file(changed_file, "input_boolean:\n  changed:\n")
+        runtime = load(config_file, config_dir)
+        print(f"Reload, one file changed: {runtime:.4f}s")
+
+    return runtime
+
+
+@benchmark
+async def template_compile(hass):
+    """Compile the templates of 2,000 template sensors sharing 20 templates."""
+    sources = [
+        f"{{{{ states('sensor.source_{idx % 5}') | float(0) * {idx % 4} | round(2) }}}}"
+        for idx in range(2000)
+    ]
+    template.COMPILED_TEMPLATE_CACHE.clear()
+    start = timer()
+    for source in sources:
+        template.Template(source, hass).ensure_valid()
+    runtime = timer() - start
+    cache = template.COMPILED_TEMPLATE_CACHE
+    print(f"Compiled {cache.misses} templates, {cache.hits} cache hits")
+    return runtime
+
+
+@benchmark
+async def template_state_storm(hass):
+    """Update 500 sensors 10 times tracked by 20 templates of 100 sensors each.
+
+    The templates are tracked twice, re-rendering for every state change and
+    re-rendering once per batch of state changes.
+    """
+    sensors = 500
+
+    @core.callback
+    def listener(event, updates):
+        """Handle template results."""
+
+    for idx in range(sensors):
+        hass.states.async_set(f"sensor.storm_{idx}", "0")
+
+    def sensor_template(idx):
+        entity_ids = [
+            f"sensor.storm_{(idx * 25 + offset) % sensors}" for offset in range(100)
+        ]
+        return template.Template(
+            f"{{{{ {entity_ids} | map('states') | map('int') | sum }}}}", hass
+        )
+
+    async def storm(batch_delay):
+        trackers = [
+            async_track_template_result(
+                hass,
+                [TrackTemplate(sensor_template(idx), None)],
+                listener,
+                batch_delay=batch_delay,
+            )
+            for idx in range(20)
+        ]
+        await hass.async_block_till_done()
+        start = timer()
+        for value in range(1, 11):
+            for idx in range(sensors):
+                hass.states.async_set(f"sensor.storm_{idx}", str(value))
+            await hass.async_block_till_done()
+        runtime = timer() - start
+        saved = sum(tracker.renders_saved for tracker in trackers)
+        for tracker in trackers:
+            tracker.async_remove()
+        return runtime, saved
+
+    runtime, _ = await storm(None)
+    print(f"Re-render per state change: {runtime:.4f}s")
+    runtime, saved = await storm(0)
+    print(f"Re-render per batch: {runtime:.4f}s, saved {saved} renders")
+    return runtime
+
+
+@benchmark
+async def template_attribute_storm(hass):
+    """Change the brightness of 200 lights 10 times with 10 light count templates."""
+    lights = 200
+
+    @core.callback
+    def listener(event, updates):
+        """Handle template results."""
+
+    for idx in range(lights):
+        hass.states.async_set(f"light.storm_{idx}", "on", {"brightness": 0})
+
+    trackers = [
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(
+                    template.Template(
+                        "{{ states.light | selectattr('state', 'eq', 'on')"
+                        f" | list | count + {idx} }}}}",
+                        hass,
+                    ),
+                    None,
+                    timedelta(0),
+                )
+            ],
+            listener,
+        )
+        for idx in range(10)
+    ]
+    await hass.async_block_till_done()
+    start = timer()
+    for brightness in range(1, 11):
+        for idx in range(lights):
+            hass.states.async_set(
+                f"light.storm_{idx}", "on", {"brightness": brightness}
+            )
+        await hass.async_block_till_done()
+    runtime = timer() - start
+    avoided = sum(tracker.rerenders_avoided for tracker in trackers)
+    print(f"Avoided {avoided} re-renders")
+    for tracker in trackers:
+        tracker.async_remove()
+    return runtime
+
+
+@benchmark
+async def entity_registry_lookups(hass):
+    """Look up the entities of 3,000 devices, 50 areas and 20 config entries.
+
+    The entity registry holds 12,000 entities with 4 entities per device.
+    """
+    logging.getLogger(er.__name__).setLevel(logging.WARNING)
+    devices = 3000
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        registry = er.EntityRegistry(hass)
+        await registry.async_load()
+        for idx in range(devices * 4):
+            entry = registry.async_get_or_create(
+                "sensor", "benchmark", str(idx), device_id=f"device_{idx // 4}"
+            )
+            registry.async_update_entity(
+                entry.entity_id,
+                area_id=f"area_{idx % 50}",
+                config_entry_id=f"config_entry_{idx % 20}",
+            )
+        await hass.async_block_till_done()
+
+        start = timer()
+        found = sum(
+            len(er.async_entries_for_device(registry, f"device_{idx}"))
+            for idx in range(devices)
+        )
+        found += sum(
+            len(er.async_entries_for_area(registry, f"area_{idx}")) for idx in range(50)
+        )
+        found += sum(
+            len(er.async_entries_for_config_entry(registry, f"config_entry_{idx}"))
+            for idx in range(20)
+        )
+        runtime = timer() - start
+
+    assert found == devices * 4 * 3
+    return runtime
+
+
+@benchmark
+async def service_area_target(hass):
+    """Resolve an area target 1,000 times with 12,000 entities in 50 areas."""
+    logging.getLogger(er.__name__).setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await ar.async_load(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        area_reg = ar.async_get(hass)
+        ent_reg = er.async_get(hass)
+        areas = [area_reg.async_create(f"Area {idx}").id for idx in range(50)]
+        for idx in range(12000):
+            entry = ent_reg.async_get_or_create("light", "benchmark", str(idx))
+            ent_reg.async_update_entity(entry.entity_id, area_id=areas[idx % 50])
+        await hass.async_block_till_done()
+
+        call = core.ServiceCall("light", "turn_on", {"area_id": areas[0]})
+        start = timer()
+        for _ in range(1000):
+            selected = service.async_extract_referenced_entity_ids(
+                hass, call, expand_group=False
+            )
+        runtime = timer() - start
+
+    assert len(selected.indirectly_referenced) == 240
+    return runtime
+
+
+@benchmark
+async def hls_segment_viewers(hass):
+    """Serve a 4 MB HLS segment of 8 parts 20 times to 32 concurrent viewers."""
+    # pylint: disable=import-outside-toplevel
+    from types import SimpleNamespace
+
+    from aiohttp import ClientSession, web
+
+    # Import http first to avoid a circular import through websocket_api
+    import homeassistant.components.http  # noqa: F401
+    from homeassistant.components.stream.core import Part, Segment
+    from homeassistant.components.stream.hls import HlsSegmentView
+    from homeassistant.util import dt as dt_util
+
+    # pylint: enable=import-outside-toplevel
+    viewers = 32
+    rounds = 20
+    segment = Segment(
+        sequence=1,
+        init=b"",
+        stream_id=0,
+        start_time=dt_util.utcnow(),
+        _stream_outputs=(),
+    )
+    for idx in range(8):
+        segment.parts.append(Part(1.0, idx == 0, os.urandom(512 * 1024)))
+    segment_size = segment.data_size
+    track = SimpleNamespace(
+        idle_timer=SimpleNamespace(awake=lambda: None),
+        get_segment=lambda sequence: segment,
+    )
+    stream = SimpleNamespace(add_provider=lambda provider: track)
+    view = HlsSegmentView()
+
+    async def handle(request):
+        """Serve the segment through the HLS segment view."""
+        return await view.handle(request, stream, "1", "")
+
+    app = web.Application()
+    app.router.add_get("/segment.m4s", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+    url = f"http://127.0.0.1:{port}/segment.m4s"
+
+    async def view_segment(session):
+        """Fetch the segment like a viewer."""
+        async with session.get(url) as response:
+            assert len(await response.read()) == segment_size
+
+    async with ClientSession() as session:
+        start = timer()
+        for _ in range(rounds):
+            await asyncio.gather(*(view_segment(session) for _ in range(viewers)))
+        runtime = timer() - start
+    await runner.cleanup()
+
+    served = segment_size * viewers * rounds
+    print(f"Served {served / runtime / 1e6:.0f} MB/s to {viewers} viewers")
+    return runtime
@@ -0,0 +1,99 @@
+"""Trace points for writing entity states.
+
+Tracing is disabled by default. A disabled trace point only costs checking
+the module level ``active`` flag, the trace points are used as:
+
+    if state_trace.active and state_trace.is_traced(entity_id):
+        state_trace.record("state_machine.async_set", entity_id, state=new_state)
+
+Records are kept in a ring buffer and can be exported with ``records``.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+import time
+from typing import Any
+
+MAX_RECORDS = 10000
+
+active = False
+
+# Entities traced by their entity_id
+_entity_ids: set[str] = set()
+# Integrations traced and their entities that have written a state
+_integrations: dict[str, set[str]] = {}
+# Entities that are traced by their entity_id or their integration
+_traced: set[str] = set()
+_records: deque[dict[str, Any]] = deque(maxlen=MAX_RECORDS)
+
+
+def enable(entity_ids: Iterable[str] = (), integrations: Iterable[str] = ()) -> None:
+    """Start tracing the state writes of entities or integrations."""
+    # pylint: disable-next=global-statement
+    global active  # noqa: PLW0603
+    _entity_ids.update(entity_ids)
+    _traced.update(_entity_ids)
+    for integration in integrations:
+        _integrations.setdefault(integration, set())
+    active = bool(_traced or _integrations)
+
+
+def disable(
+    entity_ids: Iterable[str] | None = None, integrations: Iterable[str] | None = None
+) -> None:
+    """Stop tracing entities or integrations, or everything if none are given."""
+    # pylint: disable-next=global-statement
+    global active  # noqa: PLW0603
+    if entity_ids is None and integrations is None:
+        _entity_ids.clear()
+        _integrations.clear()
+    else:
+        _entity_ids.difference_update(entity_ids or ())
+        for integration in integrations or ():
+            _integrations.pop(integration, None)
+    _traced.clear()
+    _traced.update(_entity_ids)
+    for integration_entity_ids in _integrations.values():
+        _traced.update(integration_entity_ids)
+    active = bool(_traced or _integrations)
+
+
+def is_traced(entity_id: str) -> bool:
+    """Return if the entity is traced."""
+    return entity_id in _traced
+
+
+def is_entity_traced(entity_id: str, integration: str | None) -> bool:
+    """Return if the entity is traced by its entity_id or integration.
+
+    Entities of a traced integration are also traced by the trace points
+    that only know the entity_id after they wrote their state once.
+    """
+    if entity_id in _traced:
+        return True
+    if (
+        integration is None
+        or (integration_entity_ids := _integrations.get(integration)) is None
+    ):
+        return False
+    integration_entity_ids.add(entity_id)
+    _traced.add(entity_id)
+    return True
+
+
+def record(point: str, entity_id: str, **data: Any) -> None:
+    """Record a trace point."""
+    _records.append(
+        {"time": time.time(), "point": point, "entity_id": entity_id, **data}
+    )
+
+
+def records() -> list[dict[str, Any]]:
+    """Return the recorded trace points, oldest first."""
+    return list(_records)
+
+
+def clear() -> None:
+    """Remove the recorded trace points."""
+    _records.clear()
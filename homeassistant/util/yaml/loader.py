@@ -1,13 +1,16 @@
 """Custom loader."""
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable
 from contextlib import suppress
+from dataclasses import dataclass, field
 import fnmatch
-from io import StringIO, TextIOWrapper
+from io import StringIO, TextIOWrapper, UnsupportedOperation
 import logging
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Any, TextIO, TypeVar, overload
 
 import yaml
@@ -35,6 +38,55 @@ _DictT = TypeVar("_DictT", bound=dict)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Files modified this recently are not cached, a change within the resolution
+# of the file system timestamps would not change their modification time.
+_RACY_MTIME_NS = 2 * 10**9
+# Parsed files that are cached, the least recently used are removed first
+_MAX_CACHED_FILES = 1024
+
+
+@dataclass(slots=True)
+class _CachedYaml:
+    """A parsed YAML file and everything the result depends on."""
+
+    data: JSON_TYPE | None = None
+    # Modification time and size of the file and the files it includes
+    files: dict[str, tuple[int, int]] = field(default_factory=dict)
+    # Files found in the included directories
+    listings: dict[tuple[str, str], list[str]] = field(default_factory=dict)
+    # Values of the consumed secrets by requesting file and secret name
+    secrets: dict[tuple[str, str], str] = field(default_factory=dict)
+    # Values of the consumed environment variables
+    env_vars: dict[str, str | None] = field(default_factory=dict)
+
+    def update(self, other: _CachedYaml) -> None:
+        """Add the dependencies of an included file."""
+        self.files.update(other.files)
+        self.listings.update(other.listings)
+        self.secrets.update(other.secrets)
+        self.env_vars.update(other.env_vars)
+
+
+# Parsed files by file name and if secrets were supported, ordered from the
+# least to the most recently used
+_CACHE: dict[tuple[str, bool], _CachedYaml] = {}
+
+
+class _ParsingFiles(threading.local):
+    """Dependencies of the files that are being parsed by a thread."""
+
+    def __init__(self) -> None:
+        """Initialize the stack of files."""
+        self.stack: list[_CachedYaml] = []
+
+
+_parsing = _ParsingFiles()
+
+
+def clear_cache() -> None:
+    """Remove the parsed files from the cache."""
+    _CACHE.clear()
+
 
 class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
@@ -70,6 +122,8 @@ class Secrets:
                     secret,
                     secret_dir,
                 )
+                if stack := _parsing.stack:
+                    stack[-1].secrets[(requester_path, secret)] = secrets[secret]
                 return secrets[secret]
 
         raise HomeAssistantError(f"Secret {secret} not defined")
@@ -216,15 +270,125 @@ LoaderType = FastSafeLoader | PythonSafeLoader
 
 
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE | None:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Parsed files are cached until the file, one of the files it includes or
+    one of the secrets or environment variables it uses changes.
+    """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            return _load_yaml_file(fname, conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
 
+def _load_yaml_file(
+    fname: str, conf_file: TextIO, secrets: Secrets | None
+) -> JSON_TYPE | None:
+    """Load an opened YAML file from the cache or parse it."""
+    try:
+        stat = os.fstat(conf_file.fileno())
+    except (AttributeError, OSError, UnsupportedOperation):
+        # Not a file on disk
+        return parse_yaml(conf_file, secrets)
+
+    stack = _parsing.stack
+    key = (fname, secrets is not None)
+    if (cached := _CACHE.pop(key, None)) is not None:
+        _CACHE[key] = cached
+    if cached is not None and _cache_is_valid(
+        cached, fname, (stat.st_mtime_ns, stat.st_size), secrets
+    ):
+        if stack:
+            stack[-1].update(cached)
+        return _copy_yaml(cached.data)
+
+    parsing = _CachedYaml(files={fname: (stat.st_mtime_ns, stat.st_size)})
+    stack.append(parsing)
+    try:
+        data = parse_yaml(conf_file, secrets)
+    finally:
+        stack.pop()
+    if stack:
+        stack[-1].update(parsing)
+
+    if time.time_ns() - max(mtime for mtime, _ in parsing.files.values()) < (
+        _RACY_MTIME_NS
+    ):
+        _CACHE.pop(key, None)
+        return data
+    parsing.data = data
+    _CACHE[key] = parsing
+    if len(_CACHE) > _MAX_CACHED_FILES:
+        # Another thread may be changing the cache
+        with suppress(KeyError, RuntimeError, StopIteration):
+            del _CACHE[next(iter(_CACHE))]
+    return _copy_yaml(data)
+
+
+def _cache_is_valid(
+    cached: _CachedYaml,
+    fname: str,
+    fingerprint: tuple[int, int],
+    secrets: Secrets | None,
+) -> bool:
+    """Return if a parsed file and its dependencies did not change."""
+    for path, cached_fingerprint in cached.files.items():
+        if path == fname:
+            if fingerprint != cached_fingerprint:
+                return False
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) != cached_fingerprint:
+            return False
+    for (directory, pattern), files in cached.listings.items():
+        if _walk_files(directory, pattern) != files:
+            return False
+    for name, value in cached.env_vars.items():
+        if os.getenv(name) != value:
+            return False
+    if cached.secrets:
+        if secrets is None:
+            return False
+        for (requester_path, secret), value in cached.secrets.items():
+            try:
+                if secrets.get(requester_path, secret) != value:
+                    return False
+            except HomeAssistantError:
+                return False
+    return True
+
+
+def _copy_yaml(obj: Any) -> Any:
+    """Copy the dicts and lists of a parsed file and the file name annotations.
+
+    The strings in the dicts and lists are shared with the cached file, only
+    the returned object is annotated again when it is included.
+    """
+    copy: Any
+    if isinstance(obj, dict):
+        copy = obj.__class__(
+            (key, _copy_yaml(value) if isinstance(value, (dict, list)) else value)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, list):
+        copy = obj.__class__(
+            _copy_yaml(value) if isinstance(value, (dict, list)) else value
+            for value in obj
+        )
+    elif isinstance(obj, NodeStrClass):
+        copy = NodeStrClass(obj)
+    else:
+        return obj
+    if attrs := getattr(obj, "__dict__", None):
+        copy.__dict__.update(attrs)
+    return copy
+
+
 def load_yaml_dict(fname: str, secrets: Secrets | None = None) -> dict:
     """Load a YAML file and ensure the top level is a dict.
 
@@ -337,14 +501,25 @@ def _is_file_valid(name: str) -> bool:
     return not name.startswith(".")
 
 
-def _find_files(directory: str, pattern: str) -> Iterator[str]:
-    """Recursively load files in a directory."""
+def _walk_files(directory: str, pattern: str) -> list[str]:
+    """Recursively find files in a directory."""
+    filenames: list[str] = []
     for root, dirs, files in os.walk(directory, topdown=True):
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
-        for basename in sorted(files):
-            if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
-                filename = os.path.join(root, basename)
-                yield filename
+        filenames.extend(
+            os.path.join(root, basename)
+            for basename in sorted(files)
+            if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern)
+        )
+    return filenames
+
+
+def _find_files(directory: str, pattern: str) -> list[str]:
+    """Recursively load files in a directory."""
+    files = _walk_files(directory, pattern)
+    if stack := _parsing.stack:
+        stack[-1].listings[(directory, pattern)] = files
+    return files
 
 
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
@@ -465,6 +640,8 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    if stack := _parsing.stack:
+        stack[-1].env_vars[args[0]] = os.getenv(args[0])
 
     # Check for a default value
     if len(args) > 1:
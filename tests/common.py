@@ -586,7 +586,7 @@ def mock_device_registry(
     fixture instead.
     """
     registry = dr.DeviceRegistry(hass)
-    registry.devices = dr.DeviceRegistryItems()
+    registry.devices = dr.ActiveDeviceRegistryItems()
     registry._device_data = registry.devices.data
     if mock_entries is None:
         mock_entries = {}
@@ -1257,6 +1257,9 @@ def mock_storage(
         store: storage.Store, path: str, data_to_write: dict[str, Any]
     ) -> None:
         """Mock version of write data."""
+        if "data_func" in data_to_write:
+            # Stores not serializing in the event loop call data_func here
+            data_to_write["data"] = data_to_write.pop("data_func")()
         # To ensure that the data can be serialized
         _LOGGER.debug("Writing data to %s: %s", store.key, data_to_write)
         raise_contains_mocks(data_to_write)
@@ -21,6 +21,7 @@ from homeassistant.components.bluetooth import (
 from homeassistant.components.bluetooth.const import (
     CONNECTABLE_FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS,
     FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS,
+    RAW_ADVERTISEMENT_REPEAT_SECONDS,
     SCANNER_WATCHDOG_INTERVAL,
     SCANNER_WATCHDOG_TIMEOUT,
     UNAVAILABLE_TRACK_SECONDS,
@@ -555,3 +556,82 @@ async def test_scanner_stops_responding(
 
     cancel()
     unsetup()
+
+
+async def test_remote_scanner_raw_advertisements(
+    hass: HomeAssistant, enable_bluetooth: None
+) -> None:
+    """Test the remote scanner drops repeated raw advertisements."""
+    manager = _get_manager()
+
+    new_info_callback = manager.scanner_adv_received
+    connector = (
+        HaBluetoothConnector(MockBleakClient, "mock_bleak_client", lambda: False),
+    )
+    scanner = FakeScanner(hass, "esp32", "esp32", new_info_callback, connector, True)
+    unsetup = scanner.async_setup()
+    cancel = manager.async_register_scanner(scanner, True)
+
+    address = "44:44:33:11:23:45"
+    # Complete local name "wohand" and manufacturer data for company 1
+    raw = b"\x07\x09wohand\x04\xff\x01\x00\x01"
+    raw_2 = b"\x07\x09wohand\x04\xff\x01\x00\x02"
+    details = {"address_type": 1}
+    now = MONOTONIC_TIME()
+
+    scanner._async_on_raw_advertisements(
+        [
+            (address, -60, raw, details),
+            (address, -61, raw, details),
+            (address, -62, raw, details),
+        ],
+        now,
+    )
+    assert scanner.advertisements_received == 3
+    assert scanner.advertisements_deduped == 2
+    assert scanner.advertisements_dispatched == 1
+    device, adv = scanner.discovered_devices_and_advertisement_data[address]
+    assert device.name == "wohand"
+    assert adv.manufacturer_data == {1: b"\x01"}
+    assert adv.rssi == -60
+
+    # A new payload or a large RSSI change is dispatched
+    scanner._async_on_raw_advertisements(
+        [(address, -60, raw_2, details), (address, -70, raw, details)], now + 1
+    )
+    assert scanner.advertisements_deduped == 2
+    assert scanner.advertisements_dispatched == 3
+    device, adv = scanner.discovered_devices_and_advertisement_data[address]
+    assert adv.manufacturer_data == {1: b"\x01"}
+    assert adv.rssi == -70
+
+    # Alternating payloads are all dispatched
+    scanner._async_on_raw_advertisements(
+        [
+            (address, -70, raw_2, details),
+            (address, -70, raw, details),
+            (address, -70, raw, details),
+        ],
+        now + 2,
+    )
+    assert scanner.advertisements_received == 8
+    assert scanner.advertisements_deduped == 3
+    assert scanner.advertisements_dispatched == 5
+    device, adv = scanner.discovered_devices_and_advertisement_data[address]
+    assert adv.manufacturer_data == {1: b"\x01"}
+
+    # Repeats are dispatched again once they are old enough
+    scanner._async_on_raw_advertisements(
+        [(address, -70, raw, details)], now + 2 + RAW_ADVERTISEMENT_REPEAT_SECONDS
+    )
+    assert scanner.advertisements_received == 9
+    assert scanner.advertisements_deduped == 3
+    assert scanner.advertisements_dispatched == 6
+
+    diag = await scanner.async_diagnostics()
+    assert diag["advertisements_received"] == 9
+    assert diag["advertisements_deduped"] == 3
+    assert diag["advertisements_dispatched"] == 6
+
+    cancel()
+    unsetup()
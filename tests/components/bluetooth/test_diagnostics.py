@@ -598,6 +598,9 @@ async def test_diagnostics_remote_adapter(
                         "type": "FakeHaScanner",
                     },
                     {
+                        "advertisements_deduped": 0,
+                        "advertisements_dispatched": 0,
+                        "advertisements_received": 0,
                         "connectable": False,
                         "discovered_device_timestamps": {"44:44:33:11:23:45": ANY},
                         "discovered_devices_and_advertisement_data": [
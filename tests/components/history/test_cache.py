@@ -0,0 +1,273 @@
+"""The tests for the History component cache."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.history.cache import get_significant_states_json
+from homeassistant.components.history.const import DOMAIN
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
+from homeassistant.components.recorder.services import (
+    SERVICE_DISABLE,
+    SERVICE_ENABLE,
+    SERVICE_PURGE_ENTITIES,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.common import get_system_health_info
+from tests.components.recorder.common import (
+    async_block_recorder,
+    async_wait_recording_done,
+)
+from tests.typing import WebSocketGenerator
+
+ENTITY_IDS = ["sensor.before", "sensor.test", "climate.test", "light.removed"]
+
+
+async def _async_record_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Record states of entities that are partly created before the cache."""
+    hass.states.async_set("sensor.before", "1", {"unit": "W"})
+    freezer.tick(1)
+    hass.states.async_set("sensor.before", "2", {"unit": "W"})
+    freezer.tick(1)
+    hass.states.async_set("light.removed", "on", {"brightness": 3})
+    freezer.tick(1)
+    assert await async_setup_component(hass, "history", {})
+    for index, value in enumerate(("on", "on", "off", "off", "on")):
+        freezer.tick(1)
+        hass.states.async_set("sensor.test", value, {"index": index})
+        hass.states.async_set("climate.test", "heat", {"temperature": index})
+        hass.states.async_set("sensor.before", value, {"unit": "W"})
+    freezer.tick(1)
+    hass.states.async_set("sensor.test", "on", {"index": 4}, force_update=True)
+    freezer.tick(1)
+    hass.states.async_remove("light.removed")
+    freezer.tick(1)
+    hass.states.async_set("light.removed", "off")
+    freezer.tick(1)
+    await async_wait_recording_done(hass)
+
+
+async def _async_assert_cache_matches_database(
+    hass: HomeAssistant,
+    start_times: list[timedelta],
+    end_times: list[timedelta | None],
+    entity_ids: list[str] = ENTITY_IDS,
+) -> None:
+    """Assert the cached history matches the history from the database."""
+    cache = hass.data[DOMAIN]
+    now = dt_util.utcnow()
+    for start_offset in start_times:
+        for end_offset in end_times:
+            start_time = now - start_offset
+            end_time = now - end_offset if end_offset is not None else None
+            for options in (
+                (True, True, False, False),
+                (True, False, False, False),
+                (False, True, True, False),
+                (True, False, True, True),
+                (False, False, True, True),
+                (True, True, False, True),
+            ):
+                snapshot = cache.async_snapshot(entity_ids, start_time, end_time)
+                assert snapshot is not None
+                cached, cached_last_time_ts = await hass.async_add_executor_job(
+                    get_significant_states_json,
+                    hass,
+                    snapshot,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    *options,
+                )
+                database, database_last_time_ts = await hass.async_add_executor_job(
+                    get_significant_states_json,
+                    hass,
+                    None,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    *options,
+                )
+                assert json_bytes(cached) == json_bytes(database)
+                assert cached_last_time_ts == database_last_time_ts
+
+
+async def test_cache_matches_database(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the cache returns the same states as the database."""
+    await _async_record_states(hass, freezer)
+    await _async_assert_cache_matches_database(
+        hass,
+        [timedelta(seconds=seconds) for seconds in (30, 12, 9.5, 6.5, 1.5)],
+        [None, timedelta(seconds=5.5), timedelta(seconds=0.5)],
+    )
+    cache = hass.data[DOMAIN]
+    assert cache.hits > 0
+    assert cache.partial_hits > 0
+    assert cache.misses == 0
+
+
+async def test_cache_eviction(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the database is queried for the evicted states."""
+    with patch("homeassistant.components.history.cache.MAX_HISTORY_CACHE_BYTES", 4000):
+        await _async_record_states(hass, freezer)
+    cache = hass.data[DOMAIN]
+    assert cache.cached_entities == 4
+    assert 0 < cache.cached_states < 18
+    assert cache.cached_bytes <= 4000
+    await _async_assert_cache_matches_database(
+        hass,
+        [timedelta(seconds=seconds) for seconds in (30, 9.5, 1.5)],
+        [None, timedelta(seconds=0.5)],
+    )
+    assert cache.partial_hits > 0
+
+
+async def test_cache_misses(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the cache is not used for unknown entities or old time windows."""
+    await _async_record_states(hass, freezer)
+    cache = hass.data[DOMAIN]
+    now = dt_util.utcnow()
+    assert cache.async_snapshot(["sensor.unknown"], now, None) is None
+    assert (
+        cache.async_snapshot(ENTITY_IDS, now - timedelta(hours=1), now - timedelta(1))
+        is None
+    )
+    assert cache.misses == 2
+
+
+async def test_clock_going_backwards(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test entities are no longer cached if their states are out of order."""
+    await _async_record_states(hass, freezer)
+    freezer.tick(-60)
+    hass.states.async_set("sensor.test", "back")
+    cache = hass.data[DOMAIN]
+    assert cache.async_snapshot(["sensor.test"], dt_util.utcnow(), None) is None
+    freezer.tick(120)
+    hass.states.async_set("sensor.test", "forward")
+    assert cache.async_snapshot(["sensor.test"], dt_util.utcnow(), None) is None
+    assert cache.async_snapshot(["climate.test"], dt_util.utcnow(), None) is not None
+
+
+async def test_recorder_disabled(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test nothing is cached while the recorder is disabled."""
+    await _async_record_states(hass, freezer)
+    cache = hass.data[DOMAIN]
+    await hass.services.async_call(RECORDER_DOMAIN, SERVICE_DISABLE, blocking=True)
+    freezer.tick(1)
+    hass.states.async_set("sensor.test", "not recorded")
+    assert cache.cached_states == 0
+    assert cache.async_snapshot(["sensor.test"], dt_util.utcnow(), None) is None
+
+    await hass.services.async_call(RECORDER_DOMAIN, SERVICE_ENABLE, blocking=True)
+    freezer.tick(1)
+    hass.states.async_set("sensor.test", "recorded")
+    freezer.tick(1)
+    await async_wait_recording_done(hass)
+    assert cache.cached_states == 1
+    await _async_assert_cache_matches_database(
+        hass,
+        [timedelta(seconds=seconds) for seconds in (30, 2.5, 0.5)],
+        [None],
+        ["sensor.test"],
+    )
+
+
+async def test_purge_entities(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test purged entities are no longer cached."""
+    await _async_record_states(hass, freezer)
+    cache = hass.data[DOMAIN]
+    await hass.services.async_call(
+        RECORDER_DOMAIN,
+        SERVICE_PURGE_ENTITIES,
+        {"entity_id": "sensor.test", "keep_days": 0},
+        blocking=True,
+    )
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert cache.async_snapshot(["sensor.test"], dt_util.utcnow(), None) is None
+    assert cache.async_snapshot(["climate.test"], dt_util.utcnow(), None) is not None
+    await _async_assert_cache_matches_database(
+        hass,
+        [timedelta(seconds=seconds) for seconds in (30, 1.5)],
+        [None],
+        ["sensor.before", "climate.test", "light.removed"],
+    )
+
+
+async def test_uncommitted_states(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test the database is queried once the states it returns are committed."""
+    await _async_record_states(hass, freezer)
+    cache = hass.data[DOMAIN]
+    start_time = dt_util.utcnow()
+    freezer.tick(1)
+    await async_block_recorder(hass, 0.5)
+    hass.states.async_set("sensor.test", "uncommitted", {"index": 5})
+    freezer.tick(1)
+    hass.states.async_set("sensor.new", "on")
+    freezer.tick(1)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start_time.isoformat(),
+            "entity_ids": ["sensor.test", "sensor.new"],
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert cache.partial_hits == 1
+    assert [state["s"] for state in response["result"]["sensor.test"]] == [
+        "on",
+        "uncommitted",
+    ]
+    assert [state["s"] for state in response["result"]["sensor.new"]] == ["on"]
+
+
+@pytest.mark.usefixtures("recorder_mock")
+async def test_system_health(hass: HomeAssistant) -> None:
+    """Test the cache is reported to system health."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.test", "on")
+    assert await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.test", "off")
+    await hass.async_block_till_done()
+    cache = hass.data[DOMAIN]
+    cache.async_snapshot(["sensor.test"], dt_util.utcnow(), None)
+    cache.async_snapshot(["sensor.unknown"], dt_util.utcnow(), None)
+    info = await get_system_health_info(hass, "history")
+    assert info == {
+        "cached_entities": 1,
+        "cached_states": 1,
+        "cache_hits": 1,
+        "cache_partial_hits": 0,
+        "cache_misses": 1,
+    }
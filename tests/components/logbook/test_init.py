@@ -5,7 +5,7 @@ from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -14,6 +14,7 @@ import voluptuous as vol
 from homeassistant.components import logbook, recorder
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
+from homeassistant.components.logbook.helpers import async_determine_event_types
 from homeassistant.components.logbook.models import LazyEventPartialState
 from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
@@ -170,6 +171,83 @@ async def test_service_call_create_log_book_entry_no_message(hass_) -> None:
     assert len(calls) == 0
 
 
+async def test_stream_events_in_chunks(hass_) -> None:
+    """Test streaming events in chunks returns the events of get_events."""
+    for idx in range(5):
+        hass_.states.async_set(f"switch.test_{idx}", STATE_OFF)
+    context = ha.Context(id="01GTDGKBCH00GW0X476W5TVAAA")
+    hass_.bus.async_fire(
+        EVENT_CALL_SERVICE, {"domain": "switch", "service": "turn_on"}, context=context
+    )
+    for idx in range(5):
+        hass_.states.async_set(f"switch.test_{idx}", STATE_ON, context=context)
+    for idx in range(5):
+        hass_.states.async_set(f"switch.test_{idx}", STATE_OFF)
+    await async_wait_recording_done(hass_)
+
+    start_time = dt_util.utcnow() - timedelta(hours=1)
+    end_time = dt_util.utcnow() + timedelta(hours=1)
+    event_types = async_determine_event_types(hass_, None, None)
+    events = EventProcessor(hass_, event_types).get_events(start_time, end_time)
+    with patch("homeassistant.components.logbook.processor.STREAM_CHUNK_ROWS", 3):
+        chunks = list(
+            EventProcessor(hass_, event_types).stream_events(start_time, end_time)
+        )
+
+    assert len(events) == 10
+    assert events[4]["context_service"] == "turn_on"
+    assert len(chunks) > 1
+    assert [event for chunk in chunks for event in chunk] == events
+
+
+@patch("homeassistant.components.logbook.processor.STREAM_CHUNK_ROWS", 2)
+@patch("homeassistant.components.logbook.processor.MAX_STREAM_CONTEXT_LOOKUP", 3)
+async def test_stream_events_forgets_unused_contexts(hass_) -> None:
+    """Test streaming events only remembers recently referenced contexts."""
+    entity_ids = ["switch.unused", "switch.used"]
+    entity_ids.extend(f"switch.test_{idx}" for idx in range(4))
+    for entity_id in entity_ids:
+        hass_.states.async_set(entity_id, STATE_OFF)
+    unused_context = ha.Context()
+    used_context = ha.Context()
+    hass_.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {"domain": "switch", "service": "turn_on"},
+        context=unused_context,
+    )
+    hass_.states.async_set("switch.unused", STATE_ON, context=unused_context)
+    hass_.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {"domain": "switch", "service": "toggle"},
+        context=used_context,
+    )
+    for idx in range(4):
+        hass_.states.async_set(f"switch.test_{idx}", STATE_ON)
+        hass_.states.async_set("switch.used", str(idx), context=used_context)
+    hass_.states.async_set("switch.unused", STATE_OFF, context=unused_context)
+    await async_wait_recording_done(hass_)
+
+    start_time = dt_util.utcnow() - timedelta(hours=1)
+    end_time = dt_util.utcnow() + timedelta(hours=1)
+    event_types = async_determine_event_types(hass_, None, None)
+    events = EventProcessor(hass_, event_types).get_events(start_time, end_time)
+    streamed = [
+        event
+        for chunk in EventProcessor(hass_, event_types).stream_events(
+            start_time, end_time
+        )
+        for event in chunk
+    ]
+
+    assert len(events) == 10
+    assert streamed[:-1] == events[:-1]
+    # The context used by every chunk is remembered
+    assert streamed[-2]["context_service"] == "toggle"
+    # The context that was not referenced by the last chunks is forgotten
+    assert events[-1]["context_service"] == "turn_on"
+    assert "context_service" not in streamed[-1]
+
+
 async def test_filter_sensor(
     hass_: ha.HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
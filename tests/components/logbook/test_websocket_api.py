@@ -1842,6 +1842,104 @@ async def test_subscribe_unsubscribe_logbook_stream_big_query(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+@patch("homeassistant.components.logbook.processor.STREAM_CHUNK_ROWS", 1)
+async def test_subscribe_unsubscribe_logbook_stream_big_query_in_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a big query is streamed one chunk at a time.
+
+    The chunks of the recent events come first and the chunks of the older
+    events follow, each in ascending order.
+    """
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    four_days_ago = now - timedelta(days=4)
+    five_days_ago = now - timedelta(days=5)
+
+    old_states: list[State] = []
+    for minutes, state in enumerate((STATE_ON, STATE_OFF, STATE_ON)):
+        with freeze_time(four_days_ago + timedelta(minutes=minutes)):
+            hass.states.async_set("binary_sensor.four_days_ago", state)
+            old_states.append(hass.states.get("binary_sensor.four_days_ago"))
+            await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    recent_states: list[State] = []
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("binary_sensor.is_light", state)
+        recent_states.append(hass.states.get("binary_sensor.is_light"))
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    init_listeners = hass.bus.async_listeners()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": five_days_ago.isoformat(),
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    # The first state of an entity is not logged
+    expected_chunks = [
+        ("binary_sensor.is_light", state) for state in recent_states[1:]
+    ] + [("binary_sensor.four_days_ago", state) for state in old_states[1:]]
+    windows = []
+    for entity_id, state in expected_chunks:
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert msg["event"]["partial"] is True
+        assert msg["event"]["events"] == [
+            {
+                "entity_id": entity_id,
+                "state": state.state,
+                "when": state.last_updated.timestamp(),
+            }
+        ]
+        windows.append((msg["event"]["start_time"], msg["event"]["end_time"]))
+
+    # The recent window is sent before the older window it starts at
+    recent_window, older_window = windows[0], windows[-1]
+    assert windows == [recent_window] * 3 + [older_window] * 2
+    assert older_window[1] == recent_window[0]
+
+    # And finally a response without partial set to indicate no more
+    # historical data is coming
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert "partial" not in msg["event"]
+    assert msg["event"]["events"] == []
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+
+    assert msg["id"] == 8
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    # Check our listener got unsubscribed
+    assert listeners_without_writes(
+        hass.bus.async_listeners()
+    ) == listeners_without_writes(init_listeners)
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_device(
     recorder_mock: Recorder,
@@ -10,6 +10,7 @@ from homeassistant.components import logger
 from homeassistant.components.logger import LOGSEVERITY
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util import state_trace
 
 HASS_NS = "unused.homeassistant"
 COMPONENTS_NS = f"{HASS_NS}.components"
@@ -415,3 +416,40 @@ async def test_log_once_removed_from_store(
     assert await async_setup_component(hass, "logger", {})
 
     assert hass_storage["core.logger"]["data"] == {"logs": {}}
+
+
+async def test_state_trace_services(hass: HomeAssistant) -> None:
+    """Test enabling, disabling and getting the state trace."""
+    assert await async_setup_component(hass, "logger", {})
+
+    await hass.services.async_call(
+        "logger",
+        "enable_state_trace",
+        {"entity_id": ["light.kitchen"], "integration": "hue"},
+        blocking=True,
+    )
+    assert state_trace.is_traced("light.kitchen")
+    hass.states.async_set("light.kitchen", "on")
+
+    response = await hass.services.async_call(
+        "logger",
+        "get_state_trace",
+        {"clear": True},
+        blocking=True,
+        return_response=True,
+    )
+    assert [record["point"] for record in response["records"]] == [
+        "state_machine.async_set",
+        "event_bus.async_fire",
+    ]
+    response = await hass.services.async_call(
+        "logger", "get_state_trace", {}, blocking=True, return_response=True
+    )
+    assert response == {"records": []}
+
+    await hass.services.async_call(
+        "logger", "disable_state_trace", {"integration": "hue"}, blocking=True
+    )
+    assert state_trace.active
+    await hass.services.async_call("logger", "disable_state_trace", {}, blocking=True)
+    assert not state_trace.active
@@ -8,12 +8,17 @@ import ssl
 from typing import Any, TypedDict
 from unittest.mock import ANY, MagicMock, call, mock_open, patch
 
+from paho.mqtt.client import MQTTMessage
 import pytest
 import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -28,7 +33,7 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 import homeassistant.core as ha
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CoreState, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
     device_registry as dr,
@@ -1314,6 +1319,115 @@ async def test_subscribe_special_characters(
     assert calls[0].payload == payload
 
 
+def test_subscription_trie() -> None:
+    """Test matching and pruning of the wildcard subscription trie."""
+    job = HassJob(lambda msg: None)
+    trie = SubscriptionTrie()
+    subscriptions = {
+        topic: Subscription(topic, job)
+        for topic in (
+            "home/+/state",
+            "home/#",
+            "home/+/+",
+            "+/kitchen/state",
+            "#",
+            "$SYS/#",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+    assert len(trie) == 6
+    assert set(trie) == set(subscriptions.values())
+
+    def matching(topic: str) -> set[str]:
+        return {subscription.topic for subscription in trie.match(topic)}
+
+    assert matching("home/kitchen/state") == {
+        "home/+/state",
+        "home/#",
+        "home/+/+",
+        "+/kitchen/state",
+        "#",
+    }
+    assert matching("home") == {"home/#", "#"}
+    assert matching("home/kitchen") == {"home/#", "#"}
+    assert matching("home/kitchen/state/extra") == {"home/#", "#"}
+    assert matching("$SYS/broker/uptime") == {"$SYS/#"}
+    assert matching("$SYS") == {"$SYS/#"}
+
+    assert trie.has_topic_filter("home/+/state")
+    assert not trie.has_topic_filter("home/+")
+
+    trie.remove(subscriptions["home/+/state"])
+    trie.remove(subscriptions["home/+/+"])
+    assert not trie.has_topic_filter("home/+/state")
+    assert matching("home/kitchen/state") == {"home/#", "+/kitchen/state", "#"}
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions["home/+/state"])
+
+    for topic in ("home/#", "+/kitchen/state", "#", "$SYS/#"):
+        trie.remove(subscriptions[topic])
+    assert len(trie) == 0
+    assert matching("home/kitchen/state") == set()
+    # All intermediate levels are pruned once the trie is empty
+    assert not trie._root.children
+
+
+@patch("homeassistant.components.mqtt.client.MAX_MESSAGES_PER_BATCH", 3)
+async def test_received_messages_are_batched(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test messages received by the paho thread are handled in batches."""
+    await mqtt_mock_entry()
+    mqtt_client = hass.data["mqtt"].client
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon_threadsafe:
+        for idx in range(5):
+            msg = MQTTMessage(topic=f"test-topic/{idx}".encode())
+            msg.payload = f"payload-{idx}".encode()
+            mqtt_client._mqtt_on_message(None, None, msg)
+        # The second batch is scheduled on the next event loop iteration
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await hass.async_block_till_done()
+
+    assert mock_call_soon_threadsafe.call_count == 1
+    assert [call.payload for call in calls] == [f"payload-{idx}" for idx in range(5)]
+    # All messages of a batch share a timestamp, the burst is split in two batches
+    assert calls[0].timestamp == calls[2].timestamp
+    assert len({call.timestamp for call in calls}) == 2
+
+
+async def test_unsubscribe_during_batch(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+) -> None:
+    """Test a subscription removed while handling a batch gets no more messages."""
+    await mqtt_mock_entry()
+    mqtt_client = hass.data["mqtt"].client
+
+    @callback
+    def record_once(msg: ReceiveMessage) -> None:
+        calls.append(msg)
+        unsub()
+
+    unsub = await mqtt.async_subscribe(hass, "test-topic", record_once)
+    for _ in range(3):
+        msg = MQTTMessage(topic=b"test-topic")
+        msg.payload = b"test-payload"
+        mqtt_client._mqtt_on_message(None, None, msg)
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+
+
 @patch("homeassistant.components.mqtt.client.INITIAL_SUBSCRIBE_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.DISCOVERY_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.SUBSCRIBE_COOLDOWN", 0.0)
@@ -0,0 +1,74 @@
+"""The tests for compiling statistics from flat columns."""
+from datetime import datetime, timedelta
+import random
+
+from homeassistant.components.recorder.columnar_statistics import ColumnarStates
+from homeassistant.components.recorder.models import LazyState
+from homeassistant.core import State
+from homeassistant.util import dt as dt_util
+
+
+def _time_weighted_average(
+    fstates: list[tuple[float, State]], start: datetime, end: datetime
+) -> float:
+    """Calculate a time weighted average one state at a time."""
+    old_fstate: float | None = None
+    old_start_time: datetime | None = None
+    accumulated = 0.0
+    for fstate, state in fstates:
+        start_time = start if state.last_updated < start else state.last_updated
+        if old_start_time is None:
+            start = start_time
+        else:
+            accumulated += old_fstate * (start_time - old_start_time).total_seconds()
+        old_fstate = fstate
+        old_start_time = start_time
+    accumulated += old_fstate * (end - old_start_time).total_seconds()
+    if (period_seconds := (end - start).total_seconds()) == 0:
+        return 0.0
+    return accumulated / period_seconds
+
+
+def test_compile_matches_compiling_one_state_at_a_time() -> None:
+    """Test the columnar compile gives identical results to a Python loop."""
+    rng = random.Random(42)
+    start = dt_util.utcnow().replace(second=0, microsecond=0)
+    end = start + timedelta(minutes=5)
+    start_ts = start.timestamp()
+    columns = ColumnarStates()
+    expected: dict[str, tuple[float, float, float]] = {}
+    for idx in range(200):
+        entity_id = f"sensor.test_{idx}"
+        fstates: list[tuple[float, State]] = []
+        for last_updated_ts in sorted(
+            rng.uniform(start_ts - 300, start_ts + 300)
+            for _ in range(rng.randrange(1, 50))
+        ):
+            fstate = rng.uniform(-1000, 1000)
+            state = LazyState(
+                None, {}, None, entity_id, str(fstate), last_updated_ts, False
+            )
+            fstates.append((fstate, state))
+        fstates.append((5.0, State(entity_id, "5.0", last_updated=end)))
+        fstate_values = [fstate for fstate, _ in fstates]
+        expected[entity_id] = (
+            _time_weighted_average(fstates, start, end),
+            min(fstate_values),
+            max(fstate_values),
+        )
+        columns.add(entity_id, fstates)
+
+    # A single state at the exact end of the period
+    columns.add("sensor.at_end", [(5.0, State("sensor.at_end", "5", last_updated=end))])
+    expected["sensor.at_end"] = (0.0, 5.0, 5.0)
+    # Statistics without states are skipped
+    columns.add("sensor.no_states", [])
+
+    assert len(columns) == 201
+    assert columns.compile(start, end) == expected
+
+
+def test_compile_without_statistics() -> None:
+    """Test compiling without any statistics."""
+    start = dt_util.utcnow()
+    assert ColumnarStates().compile(start, start + timedelta(minutes=5)) == {}
@@ -30,7 +30,7 @@ from homeassistant.components.recorder.models.legacy import (
 from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 import homeassistant.util.dt as dt_util
 
 from .common import (
@@ -522,6 +522,54 @@ def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+@pytest.mark.parametrize("start_offset", [timedelta(0), timedelta(seconds=2)])
+def test_get_significant_states_json(
+    hass_recorder: Callable[..., HomeAssistant],
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    start_offset: timedelta,
+) -> None:
+    """Test the json significant states match the compressed significant states."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    entity_ids = [*states, "zone.home", "sensor.not_recorded"]
+    start = zero + start_offset
+    compressed_states = history.get_significant_states(
+        hass,
+        start,
+        four,
+        entity_ids,
+        None,
+        True,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    json_states, last_time_ts = history.get_significant_states_json(
+        hass,
+        start,
+        four,
+        entity_ids,
+        True,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+    assert json_states == {
+        entity_id: json_bytes(state_list)
+        for entity_id, state_list in compressed_states.items()
+    }
+    assert list(json_states) == list(compressed_states)
+    assert last_time_ts == max(
+        state_list[-1]["lu"] for state_list in compressed_states.values()
+    )
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 def test_get_significant_states_with_initial(
     time_zone, hass_recorder: Callable[..., HomeAssistant]
@@ -79,6 +79,7 @@ from homeassistant.util.json import json_loads
 
 from .common import (
     async_block_recorder,
+    async_recorder_block_till_done,
     async_wait_recording_done,
     convert_pending_states_to_meta,
     corrupt_db_file,
@@ -341,6 +342,157 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_states_and_events_with_bulk_writes(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test states and events are written with bulk inserts."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 1, recorder.CONF_BULK_WRITES: True}
+    )
+    assert instance._bulk_writer is not None
+
+    entity_id = "test.recorder"
+    hass.states.async_set(entity_id, "on", {"test_attr": 5})
+    hass.states.async_set(entity_id, "off", {"test_attr": 5})
+    hass.bus.async_fire("bulk_event", {"test_data": 5})
+    hass.bus.async_fire("bulk_event")
+    # Make sure all events are in the session before triggering the commit
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    # The second commit links to the state_id of the first commit
+    hass.states.async_set(entity_id, "on", {"test_attr": 10})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state for db_state in db_states] == ["on", "off", "on"]
+        assert db_states[0].old_state_id is None
+        assert db_states[1].old_state_id == db_states[0].state_id
+        assert db_states[2].old_state_id == db_states[1].state_id
+        assert db_states[0].attributes_id == db_states[1].attributes_id
+        assert db_states[1].attributes_id != db_states[2].attributes_id
+        assert {db_state.metadata_id for db_state in db_states} == {
+            instance.states_meta_manager.get(entity_id, session, False)
+        }
+        assert [
+            json_loads(shared_attrs)
+            for (shared_attrs,) in session.query(StateAttributes.shared_attrs).order_by(
+                StateAttributes.attributes_id
+            )
+        ] == [{"test_attr": 5}, {"test_attr": 10}]
+
+        db_events = (
+            session.query(Events, EventTypes, EventData)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .filter(EventTypes.event_type == "bulk_event")
+            .order_by(Events.event_id)
+            .all()
+        )
+        assert len(db_events) == 2
+        assert json_loads(db_events[0][2].shared_data) == {"test_data": 5}
+        assert db_events[1][2] is None
+
+    assert instance.states_manager.pop_committed(entity_id) == db_states[2].state_id
+
+
+async def test_ids_are_resolved_in_batch_for_a_queue_drain(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the ids of a queue drain are resolved with one query per table."""
+    entity_ids = [f"test.recorder_{idx}" for idx in range(3)]
+    for idx, entity_id in enumerate(entity_ids):
+        hass.states.async_set(entity_id, "on", {"test_attr": idx})
+    await async_wait_recording_done(hass)
+    queries_saved = recorder_mock.preload_queries_saved
+
+    # Simulate the ids being evicted from the LRU caches
+    recorder_mock.states_meta_manager._id_map.clear()
+    recorder_mock.state_attributes_manager._id_map.clear()
+
+    await async_block_recorder(hass, 0.1)
+    for idx, entity_id in enumerate(entity_ids):
+        hass.states.async_set(entity_id, "off", {"test_attr": idx})
+    await async_wait_recording_done(hass)
+
+    # One query for the three metadata_ids and one for the three
+    # attributes_ids instead of six individual queries
+    assert recorder_mock.preload_queries_saved - queries_saved == 4
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatesMeta).count() == 3
+        assert session.query(StateAttributes).count() == 3
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state for db_state in db_states] == ["on"] * 3 + ["off"] * 3
+        assert [db_state.metadata_id for db_state in db_states[:3]] == [
+            db_state.metadata_id for db_state in db_states[3:]
+        ]
+        assert [db_state.attributes_id for db_state in db_states[:3]] == [
+            db_state.attributes_id for db_state in db_states[3:]
+        ]
+
+
+async def test_saving_state_with_serializable_data_with_bulk_writes(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test bulk writes skip states that cannot be serialized."""
+    await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 1, recorder.CONF_BULK_WRITES: True}
+    )
+
+    hass.states.async_set("test.one", "s1", {})
+    hass.states.async_set("test.one", "s2", {"fail": CannotSerializeMe()})
+    hass.states.async_set("test.two", "s3", {})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s4", {})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id, States.state_id, States.old_state_id, States.state
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 3
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s3"].entity_id == "test.two"
+        assert states_by_state["s4"].entity_id == "test.one"
+        assert states_by_state["s1"].old_state_id is None
+        # The state that could not be serialized was not written
+        assert states_by_state["s4"].old_state_id is None
+
+    assert "State is not JSON serializable" in caplog.text
+    assert "Error while processing event" not in caplog.text
+
+
+async def test_queue_drain_serializes_once(
+    recorder_mock: Recorder, hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the data serialized by the preload of a queue drain is reused."""
+    await async_block_recorder(hass, 0.1)
+    hass.states.async_set("test.one", "on", {"fail": CannotSerializeMe()})
+    hass.states.async_set("test.two", "on", {"test_attr": 5})
+    hass.bus.async_fire("bad_event", {"fail": CannotSerializeMe()})
+    hass.bus.async_fire("good_event", {"test_data": 5})
+    await async_wait_recording_done(hass)
+
+    assert caplog.text.count("State is not JSON serializable") == 1
+    assert caplog.text.count("Event is not JSON serializable") == 1
+    assert recorder_mock.state_attributes_manager._serialized == {}
+    assert recorder_mock.event_data_manager._serialized == {}
+    with session_scope(hass=hass, read_only=True) as session:
+        assert [
+            json_loads(shared_attrs)
+            for (shared_attrs,) in session.query(StateAttributes.shared_attrs)
+        ] == [{"test_attr": 5}]
+
+
 async def test_saving_state_with_intermixed_time_changes(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
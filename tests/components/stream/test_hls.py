@@ -428,6 +428,40 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_segment_view_multiple_parts(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test fetching a segment made of multiple parts."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    segment = Segment(sequence=0, duration=SEGMENT_DURATION)
+    segment.init = INIT_BYTES
+    payloads = [b"first-part", b"second", b"third-payload"]
+    segment.parts = [
+        Part(
+            duration=SEGMENT_DURATION / len(payloads),
+            has_keyframe=i == 0,
+            data=payload,
+        )
+        for i, payload in enumerate(payloads)
+    ]
+    hls.put(segment)
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    segment_response = await hls_client.get("/segment/0.m4s")
+    assert segment_response.status == HTTPStatus.OK
+    assert segment_response.headers["Content-Type"] == "video/iso.segment"
+    assert segment_response.headers["Content-Length"] == str(len(b"".join(payloads)))
+    assert await segment_response.read() == b"".join(payloads)
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
@@ -1006,6 +1006,37 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
     await stream.stop()
 
 
+async def test_get_image_cached(hass: HomeAssistant, h264_video, filename) -> None:
+    """Test images of the same keyframe and size are only encoded once."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        make_recording = hass.async_create_task(stream.async_record(filename))
+        await make_recording
+
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+    assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    assert encode.call_count == 1
+
+    assert await stream.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert await stream.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert encode.call_count == 2
+    assert encode.call_args_list[1][0][0].shape[:2] == (3, 4)
+
+    assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    assert encode.call_count == 2
+
+    await stream.stop()
+
+
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
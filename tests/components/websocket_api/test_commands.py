@@ -5,6 +5,7 @@ import datetime
 import logging
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -24,6 +25,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -31,6 +33,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -909,6 +912,134 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_events_state_changed_filter(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test subscribe state_changed events with a server side filter."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 1})
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+            "filter": {
+                "entity_id": "light.kit*",
+                "domain": ["switch"],
+                "attributes": ["brightness"],
+                "min_interval": 10,
+            },
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    hass.states.async_set("light.living_room", "on", {"brightness": 2})
+    hass.states.async_set("light.kitchen", "off", {"brightness": 1})
+    hass.states.async_set("light.kitchen", "off", {"brightness": 2})
+    freezer.tick(5)
+    hass.states.async_set("light.kitchen", "off", {"brightness": 3})
+    hass.states.async_set("switch.fan", "on", {"brightness": 1})
+    freezer.tick(5)
+    hass.states.async_set("light.kitchen", "off", {"brightness": 4})
+    hass.states.async_remove("switch.fan")
+
+    received = []
+    for _ in range(4):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        data = msg["event"]["data"]
+        received.append(
+            (
+                data["entity_id"],
+                data["new_state"] and data["new_state"]["attributes"]["brightness"],
+            )
+        )
+    assert received == [
+        ("light.kitchen", 2),
+        ("switch.fan", 1),
+        ("light.kitchen", 4),
+        ("switch.fan", None),
+    ]
+
+
+async def test_subscribe_events_state_changed_min_interval(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the last event held back by min_interval is forwarded later."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 1})
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+            "filter": {"min_interval": 10},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    async def _async_receive_brightness() -> int:
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        return msg["event"]["data"]["new_state"]["attributes"]["brightness"]
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 2})
+    assert await _async_receive_brightness() == 2
+    freezer.tick(2)
+    hass.states.async_set("light.kitchen", "on", {"brightness": 3})
+    freezer.tick(2)
+    hass.states.async_set("light.kitchen", "on", {"brightness": 4})
+
+    # The last held back event is forwarded when the interval ends
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(seconds=10))
+    assert await _async_receive_brightness() == 4
+
+    freezer.tick(6)
+    hass.states.async_set("light.kitchen", "on", {"brightness": 5})
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+    # Unsubscribing cancels the forward of the held back event
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(seconds=10))
+    await websocket_client.send_json({"id": 9, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["type"] == "pong"
+
+
+async def test_subscribe_events_filter_not_state_changed(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test filters are refused for other event types."""
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_events",
+            "event_type": "test_event",
+            "filter": {"domain": "light"},
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_SUPPORTED
+
+
 async def test_subscribe_entities_with_unserializable_state(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -1260,6 +1391,54 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shares_listener(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscribe entities streams with the same filter share a listener."""
+    hass.states.async_set("light.permitted", "off")
+    clients = [await hass_ws_client(hass) for _ in range(3)]
+    init_count = sum(hass.bus.async_listeners().values())
+
+    for msg_id, (client, entity_ids) in enumerate(
+        zip(clients, (["light.permitted"], ["light.permitted"], None)), 7
+    ):
+        msg = {"id": msg_id, "type": "subscribe_entities"}
+        if entity_ids:
+            msg["entity_ids"] = entity_ids
+        await client.send_json(msg)
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["event"]["a"]["light.permitted"]["s"] == "off"
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 2
+
+    hass.states.async_set("light.permitted", "on")
+    for msg_id, client in enumerate(clients, 7):
+        msg = await client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["event"]["c"]["light.permitted"]["+"]["s"] == "on"
+
+    await clients[0].send_json(
+        {"id": 10, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await clients[0].receive_json()
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count + 2
+
+    hass.states.async_set("light.permitted", "off")
+    msg = await clients[1].receive_json()
+    assert msg["id"] == 8
+    assert msg["event"]["c"]["light.permitted"]["+"]["s"] == "off"
+
+    await clients[1].send_json(
+        {"id": 11, "type": "unsubscribe_events", "subscription": 8}
+    )
+    msg = await clients[1].receive_json()
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -35,6 +35,24 @@ def mock_low_peak():
         yield
 
 
+@pytest.fixture
+def mock_low_queue_bytes():
+    """Mock a low queue size in bytes."""
+    with patch(
+        "homeassistant.components.websocket_api.http.MAX_PENDING_MSG_BYTES", 100
+    ):
+        yield
+
+
+@pytest.fixture
+def mock_merge_state_diffs():
+    """Mock always merging pending state diffs."""
+    with patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_MERGE_STATE_DIFFS", 0
+    ):
+        yield
+
+
 async def test_pending_msg_overflow(
     hass: HomeAssistant, mock_low_queue, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -45,6 +63,37 @@ async def test_pending_msg_overflow(
     assert msg.type == WSMsgType.close
 
 
+async def test_pending_msg_bytes_overflow(
+    hass: HomeAssistant,
+    mock_low_queue_bytes,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test pending messages overflows the size limit."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    instance._send_message({"overload": "message" * 20})
+
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.close
+    assert "Reached 100 pending bytes" in caplog.text
+    assert "overload" in caplog.text
+
+
 async def test_cleanup_on_cancellation(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -346,6 +395,65 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_pending_state_diffs_merged(
+    hass: HomeAssistant, mock_merge_state_diffs, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test unsent state diffs of an entity are merged."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    hass.states.async_set("light.test", "off", {"color": "red"})
+    hass.states.async_set("light.other", "off")
+    await websocket_client.send_json({"id": 5, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.test", "light.other"}
+    assert instance.pending_messages == 0
+    assert instance.pending_bytes == 0
+
+    hass.states.async_set("light.test", "on", {"brightness": 1})
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.test", "on", {"brightness": 2})
+    hass.states.async_remove("light.other")
+    hass.states.async_set("light.test", "on", {"brightness": 3})
+    assert instance.pending_messages == 2
+    assert instance.pending_bytes == sum(
+        len(str(message)) for message in instance._message_queue
+    )
+    assert instance.pending_bytes > 0
+    assert "pending_messages=2" in repr(instance)
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    diff = msg["event"]["c"]["light.test"]
+    assert diff["+"]["s"] == "on"
+    assert diff["+"]["a"] == {"brightness": 3}
+    assert diff["-"] == {"a": ["color"]}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"] == {"r": ["light.other"]}
+    assert instance.pending_messages == 0
+    assert instance.pending_bytes == 0
+
+    hass.states.async_set("light.test", "off", {"brightness": 3})
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.test"]["+"]["s"] == "off"
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
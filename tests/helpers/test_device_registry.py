@@ -1270,6 +1270,54 @@ async def test_update_remove_config_entries(
     assert "changes" not in update_events[4]
 
 
+async def test_device_registry_items_indexes(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test the config entry and area indexes stay consistent with the devices."""
+    config_entry_1 = MockConfigEntry()
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry()
+    config_entry_2.add_to_hass(hass)
+
+    entry1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        identifiers={("bridgeid", "0123")},
+    )
+    entry2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        identifiers={("bridgeid", "4567")},
+    )
+    entry1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id,
+        identifiers={("bridgeid", "0123")},
+    )
+    entry2 = device_registry.async_update_device(entry2.id, area_id="kitchen")
+
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [entry1, entry2]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [entry1]
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [entry2]
+
+    entry2 = device_registry.async_update_device(entry2.id, area_id="garage")
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+    assert dr.async_entries_for_area(device_registry, "garage") == [entry2]
+
+    device_registry.async_clear_config_entry(config_entry_1.entry_id)
+    entry1 = device_registry.async_get(entry1.id)
+    assert device_registry.async_get(entry2.id) is None
+    assert (
+        dr.async_entries_for_config_entry(device_registry, config_entry_1.entry_id)
+        == []
+    )
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [entry1]
+    assert dr.async_entries_for_area(device_registry, "garage") == []
+
+
 async def test_update_suggested_area(
     hass: HomeAssistant,
     device_registry: dr.DeviceRegistry,
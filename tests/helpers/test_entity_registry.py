@@ -1476,6 +1476,56 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_indexes() -> None:
+    """Test the EntityRegistryItems indexes stay consistent with the entries."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="kitchen",
+        config_entry_id="config_1",
+        device_id="device_1",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        config_entry_id="config_1",
+        device_id="device_1",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_config_entry_id("config_1") == [entry1, entry2]
+    assert entities.get_entries_for_device_id("device_1") == [entry1]
+    assert entities.get_entries_for_device_id("device_1", True) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+
+    entry1_moved = attr.evolve(
+        entry1, area_id="garage", config_entry_id="config_2", device_id="device_2"
+    )
+    entities["test.entity1"] = entry1_moved
+
+    assert entities.get_entries_for_config_entry_id("config_1") == [entry2]
+    assert entities.get_entries_for_config_entry_id("config_2") == [entry1_moved]
+    assert entities.get_entries_for_device_id("device_1", True) == [entry2]
+    assert entities.get_entries_for_device_id("device_2") == [entry1_moved]
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("garage") == [entry1_moved]
+
+    del entities["test.entity1"]
+    entities.pop("test.entity2")
+
+    assert entities.get_entries_for_config_entry_id("config_1") == []
+    assert entities.get_entries_for_config_entry_id("config_2") == []
+    assert entities.get_entries_for_device_id("device_1", True) == []
+    assert entities.get_entries_for_area_id("garage") == []
+    # pylint: disable-next=protected-access
+    assert not entities._config_entry_id_index
+
+
 async def test_disabled_by_str_not_allowed(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
 ) -> None:
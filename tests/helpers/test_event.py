@@ -20,6 +20,8 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_STATE_CHANGE_CALLBACKS,
+    TRACK_STATE_CHANGE_LISTENER,
     EventStateChangedData,
     TrackStates,
     TrackTemplate,
@@ -429,6 +431,87 @@ async def test_async_track_state_change_filtered(hass: HomeAssistant) -> None:
     track_throws.async_remove()
 
 
+async def test_async_track_state_change_filtered_update_entities(
+    hass: HomeAssistant,
+) -> None:
+    """Test only changed entities are resubscribed when updating the listeners."""
+    tracker = []
+
+    @ha.callback
+    def run_callback(event: EventType[EventStateChangedData]) -> None:
+        tracker.append(event.data["entity_id"])
+
+    track_other = async_track_state_change_event(hass, "light.bowl", run_callback)
+    track_filtered = async_track_state_change_filtered(
+        hass, TrackStates(False, {"light.bowl", "light.desk"}, None), run_callback
+    )
+    callbacks = hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+    assert len(callbacks["light.bowl"]) == 2
+    bowl_jobs = callbacks["light.bowl"]
+
+    track_filtered.async_update_listeners(
+        TrackStates(False, {"light.bowl", "light.lamp"}, None)
+    )
+    assert set(callbacks) == {"light.bowl", "light.lamp"}
+    assert callbacks["light.bowl"] is bowl_jobs
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.desk", "on")
+    hass.states.async_set("light.lamp", "on")
+    await hass.async_block_till_done()
+    assert tracker == ["light.bowl", "light.bowl", "light.lamp"]
+
+    track_filtered.async_update_listeners(TrackStates(False, set(), None))
+    assert set(callbacks) == {"light.bowl"}
+    assert len(callbacks["light.bowl"]) == 1
+
+    track_filtered.async_update_listeners(
+        TrackStates(False, {"light.lamp"}, {"switch"})
+    )
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+    assert set(callbacks) == {"light.bowl", "light.lamp", "switch.kitchen"}
+
+    track_filtered.async_remove()
+    track_other()
+    assert not callbacks
+    assert TRACK_STATE_CHANGE_LISTENER not in hass.data
+
+
+async def test_async_track_state_change_event_remove_during_dispatch(
+    hass: HomeAssistant,
+) -> None:
+    """Test a listener removed while an event is dispatched still gets it."""
+    calls = []
+    unsubs = []
+
+    @ha.callback
+    def remove_other(event: EventType[EventStateChangedData]) -> None:
+        calls.append("first")
+        while unsubs:
+            unsubs.pop()()
+
+    @ha.callback
+    def other(event: EventType[EventStateChangedData]) -> None:
+        calls.append("other")
+
+    unsub = async_track_state_change_event(hass, "light.bowl", remove_other)
+    unsubs.append(async_track_state_change_event(hass, "light.bowl", other))
+    jobs = hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]
+    # The snapshot is only rebuilt after the jobs changed
+    assert jobs.snapshot() is jobs.snapshot()
+
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert calls == ["first", "other"]
+    assert len(jobs) == 1
+
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert calls == ["first", "other", "first"]
+    unsub()
+
+
 async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     """Test async_track_state_change_event."""
     single_entity_id_tracker = []
@@ -3100,6 +3183,153 @@ async def test_track_template_result_refresh_cancel(hass: HomeAssistant) -> None
     assert refresh_runs == ["duck"]
 
 
+async def test_track_template_result_state_value_only(hass: HomeAssistant) -> None:
+    """Test attribute changes of iterated states do not re-render state templates."""
+    template_on = Template(
+        "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}", hass
+    )
+    template_brightness = Template(
+        "{{ states.light | map(attribute='attributes.brightness') | sum }}", hass
+    )
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.hall", "off", {"brightness": 0})
+
+    runs = []
+
+    @ha.callback
+    def listener(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend((update.template, update.result) for update in updates)
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_on, None, timedelta(seconds=0)),
+            TrackTemplate(template_brightness, None, timedelta(seconds=0)),
+        ],
+        listener,
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 50})
+    await hass.async_block_till_done()
+    assert runs == [(template_brightness, 50)]
+    assert info.rerenders_avoided == 1
+
+    hass.states.async_set("light.hall", "on", {"brightness": 0})
+    await hass.async_block_till_done()
+    assert runs == [(template_brightness, 50), (template_on, 2)]
+    assert info.rerenders_avoided == 1
+
+    runs.clear()
+    hass.states.async_set("light.porch", "on", {"brightness": 10})
+    await hass.async_block_till_done()
+    assert runs == [(template_on, 3), (template_brightness, 60)]
+
+    runs.clear()
+    hass.states.async_remove("light.porch")
+    await hass.async_block_till_done()
+    assert runs == [(template_on, 2), (template_brightness, 50)]
+    assert info.rerenders_avoided == 1
+
+    info.async_remove()
+
+
+async def test_track_template_result_batched(hass: HomeAssistant) -> None:
+    """Test state changes of one loop iteration re-render templates once."""
+    template_sensors = Template(
+        "{{ states.sensor | map(attribute='state') | join(' ') }}", hass
+    )
+    template_switch = Template("{{ states('switch.test') }}", hass)
+    hass.states.async_set("sensor.one", "0")
+    hass.states.async_set("sensor.two", "0")
+    hass.states.async_set("switch.test", "off")
+
+    batched_runs = []
+
+    @ha.callback
+    def batched_listener(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        batched_runs.append(
+            (event and event.data["entity_id"], {u.template: u.result for u in updates})
+        )
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_sensors, None), TrackTemplate(template_switch, None)],
+        batched_listener,
+        batch_delay=0,
+    )
+    await hass.async_block_till_done()
+    batched_runs.clear()
+
+    for value in range(5):
+        hass.states.async_set("sensor.one", str(value))
+        hass.states.async_set("sensor.two", str(value * 2))
+    hass.states.async_set("switch.test", "on")
+    await hass.async_block_till_done()
+
+    assert batched_runs == [
+        ("switch.test", {template_sensors: "4 8", template_switch: "on"})
+    ]
+    assert info.renders_saved == 7
+
+    hass.states.async_set("sensor.one", "4")
+    hass.states.async_set("sensor.two", "8")
+    await hass.async_block_till_done()
+    assert len(batched_runs) == 1
+
+    info.async_remove()
+    hass.states.async_set("switch.test", "off")
+    await hass.async_block_till_done()
+    assert len(batched_runs) == 1
+
+
+async def test_track_template_result_batch_delay(hass: HomeAssistant) -> None:
+    """Test state changes are batched for the delay."""
+    template_sensor = Template("{{ states('sensor.test') }}", hass)
+
+    batched_runs = []
+
+    @ha.callback
+    def batched_listener(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        batched_runs.append((updates[0].last_result, updates[0].result))
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_sensor, None)],
+        batched_listener,
+        batch_delay=0.5,
+    )
+    await hass.async_block_till_done()
+    batched_runs.clear()
+
+    hass.states.async_set("sensor.test", "1")
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.test", "2")
+    await hass.async_block_till_done()
+    assert batched_runs == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert batched_runs == [(None, 2)]
+    assert info.renders_saved == 1
+
+    hass.states.async_set("sensor.test", "3")
+    await hass.async_block_till_done()
+    info.async_remove()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert batched_runs == [(None, 2)]
+
+
 async def test_async_track_template_result_multiple_templates(
     hass: HomeAssistant,
 ) -> None:
@@ -21,6 +21,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import Context, HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.helpers import (
+    area_registry as ar,
     device_registry as dr,
     entity_registry as er,
     service,
@@ -30,6 +31,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.setup import async_setup_component
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockUser,
     async_mock_service,
@@ -552,6 +554,63 @@ async def test_extract_entity_ids_from_devices(hass: HomeAssistant, area_mock) -
     )
 
 
+async def test_extract_referenced_entity_ids_cache(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test resolved targets follow registry changes."""
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    kitchen = area_registry.async_create("Kitchen")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("test", "device")}
+    )
+    light = entity_registry.async_get_or_create(
+        "light", "test", "light", device_id=device.id
+    )
+    switch = entity_registry.async_get_or_create("switch", "test", "switch")
+    area_call = ServiceCall("light", "turn_on", {"area_id": kitchen.id})
+    device_call = ServiceCall("light", "turn_on", {"device_id": device.id})
+
+    assert await service.async_extract_entity_ids(hass, area_call) == set()
+    assert await service.async_extract_entity_ids(hass, device_call) == {
+        light.entity_id
+    }
+
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    assert await service.async_extract_entity_ids(hass, area_call) == {light.entity_id}
+
+    entity_registry.async_update_entity(switch.entity_id, area_id=kitchen.id)
+    assert await service.async_extract_entity_ids(hass, area_call) == {
+        light.entity_id,
+        switch.entity_id,
+    }
+
+    entity_registry.async_update_entity(
+        light.entity_id, hidden_by=er.RegistryEntryHider.USER
+    )
+    assert await service.async_extract_entity_ids(hass, area_call) == {switch.entity_id}
+    assert await service.async_extract_entity_ids(hass, device_call) == set()
+
+    entity_registry.async_update_entity(
+        switch.entity_id, new_entity_id="switch.renamed"
+    )
+    assert await service.async_extract_entity_ids(hass, area_call) == {"switch.renamed"}
+
+    area_registry.async_delete(kitchen.id)
+    selected = service.async_extract_referenced_entity_ids(hass, area_call)
+    assert selected.missing_areas == {kitchen.id}
+    assert selected.indirectly_referenced == set()
+
+    device_registry.async_remove_device(device.id)
+    selected = service.async_extract_referenced_entity_ids(hass, device_call)
+    assert selected.missing_devices == {device.id}
+    assert selected.referenced_devices == {device.id}
+    assert selected.indirectly_referenced == set()
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group = hass.components.group
@@ -3,6 +3,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+import threading
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -18,6 +19,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
+from homeassistant.util.file import WriteError
 
 from tests.common import async_fire_time_changed, async_test_home_assistant
 
@@ -733,3 +735,55 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_serialize_in_executor(tmpdir: py.path.local) -> None:
+    """Test data is built off the event loop and unchanged data is not written."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, serialize_in_event_loop=False)
+    data_func_threads = []
+
+    def data_func():
+        data_func_threads.append(threading.get_ident())
+        return MOCK_DATA
+
+    store.async_delay_save(data_func, 1)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert data_func_threads
+    assert threading.get_ident() not in data_func_threads
+    assert await store.async_load() == MOCK_DATA
+
+    with patch(
+        "homeassistant.helpers.storage.json_helper.write_json_data"
+    ) as mock_write:
+        await store.async_save(MOCK_DATA)
+        assert not mock_write.called
+        await store.async_save(MOCK_DATA2)
+        assert mock_write.called
+
+    # A failed write or removing the data always writes the next save
+    with patch(
+        "homeassistant.helpers.storage.json_helper.write_json_data",
+        side_effect=WriteError("Failed"),
+    ):
+        await store.async_save(MOCK_DATA)
+    with patch(
+        "homeassistant.helpers.storage.json_helper.write_json_data"
+    ) as mock_write:
+        await store.async_save(MOCK_DATA2)
+        assert mock_write.called
+
+    await store.async_remove()
+    with patch(
+        "homeassistant.helpers.storage.json_helper.write_json_data"
+    ) as mock_write:
+        await store.async_save(MOCK_DATA2)
+        assert mock_write.called
+
+    await hass.async_stop(force=True)
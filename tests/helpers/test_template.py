@@ -20,6 +20,7 @@ from homeassistant.components import group
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     STATE_ON,
     STATE_UNAVAILABLE,
     VOLUME_LITERS,
@@ -29,6 +30,7 @@ from homeassistant.const import (
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
+    __version__,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import TemplateError
@@ -4275,27 +4277,76 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
-    template_string = (
-        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
-    )
-    tpl = template.Template(
-        (template_string),
-    )
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared by environments of the same type."""
+    cache = template.COMPILED_TEMPLATE_CACHE
+    template_string = "{{ 'COMPILED' | lower }}"
+    hits = cache.hits
+    misses = cache.misses
+
+    tpl = template.Template(template_string, hass)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert cache.misses == misses + 1
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string, hass)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert cache.hits == hits + 1
+    assert tpl2._compiled_code is tpl._compiled_code
+
+    del tpl, tpl2
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    assert cache.hits == hits + 2
+
+    # Environments without hass have other filters and compile separately
+    no_hass = template.Template(template_string)
+    no_hass.ensure_valid()
+    assert no_hass._compiled_code is not tpl._compiled_code
+    assert cache.misses == misses + 2
+
+    with patch.object(
+        template,
+        "COMPILED_TEMPLATE_CACHE",
+        template.CompiledTemplateCache(1),
+    ) as small_cache:
+        template.Template("{{ 1 }}", hass).ensure_valid()
+        template.Template("{{ 2 }}", hass).ensure_valid()
+        template.Template("{{ 1 }}", hass).ensure_valid()
+        assert len(small_cache) == 1
+        assert small_cache.misses == 3
+        assert small_cache.hits == 0
+
+
+async def test_template_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the bytecode of compiled templates is stored and loaded."""
+    template_string = "{{ 'bytecode' | upper }}"
+
+    with patch.object(
+        template,
+        "COMPILED_TEMPLATE_CACHE",
+        template.CompiledTemplateCache(template.COMPILED_TEMPLATE_CACHE_SIZE),
+    ):
+        await template.async_load_bytecode_cache(hass)
+        assert template.Template(template_string, hass).async_render() == "BYTECODE"
+        await hass.async_block_till_done()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    assert len(data["bytecode"]) == 1
+
+    with patch.object(
+        template,
+        "COMPILED_TEMPLATE_CACHE",
+        template.CompiledTemplateCache(template.COMPILED_TEMPLATE_CACHE_SIZE),
+    ), patch("jinja2.sandbox.ImmutableSandboxedEnvironment.compile") as mock_compile:
+        await template.async_load_bytecode_cache(hass)
+        assert template.Template(template_string, hass).async_render() == "BYTECODE"
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    assert not mock_compile.called
 
 
 def test_is_template_string() -> None:
@@ -4749,6 +4800,45 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_domains_full_state(hass: HomeAssistant) -> None:
+    """Test reading more than the state value of iterated states is collected."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("sensor.power", "50", {"unit_of_measurement": "W"})
+
+    info = render_to_info(
+        hass, "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}"
+    )
+    assert_result_info(info, 1, [], ["light"])
+    assert info.domains_full_state == set()
+
+    info = render_to_info(
+        hass,
+        "{{ states | map(attribute='domain') | unique | list }}"
+        " {{ states.light | map(attribute='object_id') | list }}",
+    )
+    assert info.domains_full_state == set()
+
+    for template_str in (
+        "{{ states.light | map(attribute='attributes.brightness') | list }}",
+        "{{ states.light | map(attribute='name') | list }}",
+        "{{ states.light | list }}",
+        "{{ states.light | map(attribute='last_changed') | max }}",
+        "{{ (states.light | first).as_dict() }}",
+    ):
+        info = render_to_info(hass, template_str)
+        assert info.domains_full_state == {"light"}, template_str
+
+    info = render_to_info(
+        hass, "{{ states | map(attribute='state_with_unit') | list }}"
+    )
+    assert info.domains_full_state == {"light", "sensor"}
+
+    # Directly referenced states are collected as entities
+    info = render_to_info(hass, "{{ states.light.kitchen.attributes.brightness }}")
+    assert_result_info(info, 100, ["light.kitchen"])
+    assert info.domains_full_state == set()
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, runner
+from homeassistant import bootstrap, requirements, runner
 import homeassistant.config as config_util
 from homeassistant.config_entries import HANDLERS, ConfigEntry
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -16,7 +16,7 @@ from homeassistant.core import HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import Integration
+from homeassistant.loader import Integration, async_get_integrations
 
 from .common import (
     MockConfigEntry,
@@ -346,6 +346,67 @@ async def test_setup_after_deps_via_platform(hass: HomeAssistant) -> None:
     assert order == ["after_dep_of_platform_int", "platform_int"]
 
 
+async def test_preload_integrations(hass: HomeAssistant) -> None:
+    """Test the integrations and their known platforms are preloaded."""
+    mock_integration(
+        hass, MockModule(domain="flow_int", partial_manifest={"config_flow": True})
+    )
+    mock_integration(hass, MockModule(domain="platform_int"))
+    preloaded: dict[str, list[str]] = {}
+
+    async def mock_preload(self: Integration, platform_names: Iterable[str] = ()):
+        preloaded[self.domain] = list(platform_names)
+
+    with patch.object(Integration, "async_preload", mock_preload):
+        await bootstrap._async_set_up_integrations(
+            hass, {"light": {"platform": "platform_int"}, "flow_int": {}}
+        )
+        await hass.async_block_till_done()
+
+    assert preloaded == {
+        "flow_int": ["config_flow"],
+        "light": [],
+        "platform_int": ["light"],
+    }
+
+
+async def test_preload_integrations_with_requirements(hass: HomeAssistant) -> None:
+    """Test integrations are only preloaded once their requirements are installed."""
+    hass.config.skip_pip = False
+    mock_integration(hass, MockModule(domain="dep_int", requirements=["dep-req==1"]))
+    mock_integration(hass, MockModule(domain="req_int", requirements=["req==1"]))
+    mock_integration(hass, MockModule(domain="uses_dep_int", dependencies=["dep_int"]))
+    mock_integration(hass, MockModule(domain="no_req_int"))
+    domains = ["dep_int", "req_int", "uses_dep_int", "no_req_int"]
+    integrations = await async_get_integrations(hass, domains)
+    preloaded: list[str] = []
+
+    async def mock_preload(self: Integration, platform_names: Iterable[str] = ()):
+        preloaded.append(self.domain)
+
+    async def _async_preload() -> list[str]:
+        preloaded.clear()
+        with patch.object(Integration, "async_preload", mock_preload):
+            await bootstrap._async_preload_integrations(
+                hass, {}, [integrations[domain] for domain in domains]
+            )
+        return preloaded
+
+    assert await _async_preload() == ["no_req_int"]
+
+    # The requirement was installed by setting up dep_int
+    requirements._async_get_manager(hass).is_installed_cache.add("dep-req==1")
+    assert await _async_preload() == ["dep_int", "uses_dep_int", "no_req_int"]
+
+    hass.config.skip_pip_packages = ["req"]
+    assert await _async_preload() == domains
+
+    hass.config.skip_pip_packages = []
+    hass.config.skip_pip = True
+    requirements._async_get_manager(hass).is_installed_cache.clear()
+    assert await _async_preload() == domains
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_not_trigger_load(hass: HomeAssistant) -> None:
     """Test after_dependencies does not trigger loading it."""
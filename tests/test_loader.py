@@ -1,4 +1,10 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -7,8 +13,14 @@ from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -188,6 +200,156 @@ async def test_get_integration_exceptions(hass: HomeAssistant) -> None:
         assert hue_light == integration.get_platform("light")
 
 
+async def test_async_get_component_in_executor(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test the component and platforms are imported in the executor."""
+    integration = await loader.async_get_integration(hass, "test_embedded")
+    for name in (
+        "custom_components.test_embedded",
+        "custom_components.test_embedded.switch",
+    ):
+        sys.modules.pop(name, None)
+    import_module = importlib.import_module
+    loop_thread_id = threading.get_ident()
+    imported_in_loop: dict[str, bool] = {}
+
+    def _import_module(name: str) -> ModuleType:
+        imported_in_loop.setdefault(name, threading.get_ident() == loop_thread_id)
+        return import_module(name)
+
+    with patch("homeassistant.loader.importlib.import_module", _import_module):
+        component = await integration.async_get_component()
+        platform = await integration.async_get_platform("switch")
+
+    assert component.DOMAIN == "test_embedded"
+    assert component is integration.get_component()
+    assert platform is integration.get_platform("switch")
+    assert imported_in_loop == {
+        "custom_components.test_embedded": False,
+        "custom_components.test_embedded.switch": False,
+    }
+
+
+async def test_async_get_component_exceptions(hass: HomeAssistant) -> None:
+    """Test exceptions importing in the executor are raised from the event loop."""
+    integration = await loader.async_get_integration(hass, "hue")
+    hass.data[loader.DATA_COMPONENTS].clear()
+
+    with pytest.raises(ImportError), patch.dict(sys.modules), patch(
+        "homeassistant.loader.importlib.import_module", side_effect=ValueError("Boom")
+    ):
+        sys.modules.pop("homeassistant.components.hue")
+        await integration.async_get_component()
+
+    with pytest.raises(ImportError), patch(
+        "homeassistant.loader.importlib.import_module",
+        side_effect=ImportError("No module named 'aiohue'"),
+    ):
+        await integration.async_get_platform("not_a_platform")
+
+
+async def test_async_preload(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test preloading imports the modules without caching them."""
+    integration = await loader.async_get_integration(hass, "test_embedded")
+    for name in (
+        "custom_components.test_embedded",
+        "custom_components.test_embedded.switch",
+    ):
+        sys.modules.pop(name, None)
+
+    await integration.async_preload(["switch", "not_a_platform"])
+
+    assert "custom_components.test_embedded" in sys.modules
+    assert "custom_components.test_embedded.switch" in sys.modules
+    assert "test_embedded" not in hass.data[loader.DATA_COMPONENTS]
+    assert (
+        integration.get_platform("switch")
+        is (sys.modules["custom_components.test_embedded.switch"])
+    )
+
+
+async def _async_resolve_with_manifest_cache(
+    hass: HomeAssistant, domain: str
+) -> loader.Integration:
+    """Resolve an integration and its dependencies with a new manifest cache."""
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+    await loader.async_load_manifest_cache(hass)
+    integration = await loader.async_get_integration(hass, domain)
+    assert await integration.resolve_dependencies()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    return integration
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test manifests and dependencies are loaded from the manifest cache."""
+    integration = await _async_resolve_with_manifest_cache(hass, "tasmota")
+    assert integration.all_dependencies == {"file_upload", "http", "mqtt"}
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["manifests"]["tasmota"][2]["name"] == "Tasmota"
+    assert data["dependencies"]["tasmota"] == ["file_upload", "http", "mqtt"]
+
+    with patch(
+        "homeassistant.loader._async_component_dependencies"
+    ) as mock_dependencies, patch(
+        "pathlib.Path.read_text", side_effect=OSError
+    ) as mock_read_text:
+        cached = await _async_resolve_with_manifest_cache(hass, "tasmota")
+    assert cached is not integration
+    assert cached.name == "Tasmota"
+    assert cached.all_dependencies == integration.all_dependencies
+    assert not mock_dependencies.called
+    assert not mock_read_text.called
+
+
+async def test_manifest_cache_invalidation(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+) -> None:
+    """Test changed manifests and new Home Assistant versions are read again."""
+    await _async_resolve_with_manifest_cache(hass, "test_package")
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    data["manifests"]["test_package"][1] -= 1
+    data["manifests"]["test_package"][2]["name"] = "Changed"
+
+    integration = await _async_resolve_with_manifest_cache(hass, "test_package")
+    assert integration.name == "Test Package"
+
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    data["manifests"]["test_package"][2]["name"] = "Changed"
+    data["ha_version"] = "0.1"
+
+    integration = await _async_resolve_with_manifest_cache(hass, "test_package")
+    assert integration.name == "Test Package"
+
+
+async def test_manifest_cache_dependency_changed(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test dependencies are resolved again when a dependency changed."""
+    await _async_resolve_with_manifest_cache(hass, "tasmota")
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    data["manifests"]["mqtt"][1] -= 1
+
+    with patch(
+        "homeassistant.loader._async_component_dependencies",
+        return_value={"mqtt"},
+    ) as mock_dependencies:
+        await _async_resolve_with_manifest_cache(hass, "tasmota")
+    assert mock_dependencies.called
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["dependencies"]["tasmota"] == ["mqtt"]
+
+
 async def test_get_integration_legacy(
     hass: HomeAssistant, enable_custom_integrations: None
 ) -> None:
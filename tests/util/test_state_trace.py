@@ -0,0 +1,86 @@
+"""Test Home Assistant state trace points."""
+from collections.abc import Generator
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from homeassistant.util import state_trace
+
+from tests.common import MockEntityPlatform
+
+
+@pytest.fixture(autouse=True)
+def reset_state_trace() -> Generator[None, None, None]:
+    """Reset the state trace after each test."""
+    yield
+    state_trace.disable()
+    state_trace.clear()
+
+
+async def test_disabled_by_default(hass: HomeAssistant) -> None:
+    """Test nothing is recorded unless tracing is enabled."""
+    assert not state_trace.active
+    hass.states.async_set("light.kitchen", "on")
+    assert state_trace.records() == []
+
+
+async def test_trace_entity_id(hass: HomeAssistant) -> None:
+    """Test tracing the state machine and event bus for an entity."""
+    state_trace.enable(entity_ids=["light.kitchen"])
+    assert state_trace.active
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.other", "on")
+    hass.bus.async_fire("custom_event", {"entity_id": ["light.kitchen"]})
+
+    records = state_trace.records()
+    assert [(record["point"], record["entity_id"]) for record in records] == [
+        ("state_machine.async_set", "light.kitchen"),
+        ("event_bus.async_fire", "light.kitchen"),
+        ("state_machine.async_set", "light.kitchen"),
+    ]
+    assert records[0]["state"] == "on"
+    assert records[0]["state_changed"] is True
+    assert records[1]["event_type"] == "state_changed"
+    assert records[2]["state_changed"] is False
+    assert records[2]["attributes_changed"] is False
+
+    state_trace.disable(entity_ids=["light.kitchen"])
+    assert not state_trace.active
+    hass.states.async_set("light.kitchen", "off")
+    assert len(state_trace.records()) == 3
+
+    state_trace.clear()
+    assert state_trace.records() == []
+
+
+async def test_trace_integration(hass: HomeAssistant) -> None:
+    """Test tracing the state writes of the entities of an integration."""
+    state_trace.enable(integrations=["test_platform"])
+    entity = Entity()
+    entity.hass = hass
+    entity.entity_id = "light.kitchen"
+    entity.platform = MockEntityPlatform(hass, platform_name="test_platform")
+    entity._attr_state = "on"
+    entity.async_write_ha_state()
+    other = Entity()
+    other.hass = hass
+    other.entity_id = "light.other"
+    other.platform = MockEntityPlatform(hass, platform_name="other_platform")
+    other.async_write_ha_state()
+
+    records = state_trace.records()
+    assert [record["point"] for record in records] == [
+        "entity.async_write_ha_state",
+        "state_machine.async_set",
+        "event_bus.async_fire",
+    ]
+    assert records[0]["entity_id"] == "light.kitchen"
+    assert records[0]["state"] == "on"
+    assert records[0]["duration"] >= 0
+    assert state_trace.is_traced("light.kitchen")
+
+    state_trace.disable(integrations=["test_platform"])
+    assert not state_trace.is_traced("light.kitchen")
+    assert not state_trace.active
@@ -719,3 +719,116 @@ def test_load_yaml_dict_fail(try_both_loaders, mock_hass_config_yaml: None) -> N
     """Test item without a key."""
     with pytest.raises(yaml_loader.YamlTypeError):
         yaml_loader.load_yaml_dict(YAML_CONFIG_FILE)
+
+
+def _write_old_file(path: pathlib.Path, content: str, age: int = 3600) -> None:
+    """Write a file with a modification time in the past."""
+    path.write_text(content, encoding="utf-8")
+    mtime = path.stat().st_mtime - age
+    os.utime(path, (mtime, mtime))
+
+
+def test_load_yaml_cache(try_both_loaders, tmp_path: pathlib.Path) -> None:
+    """Test parsed files are cached until a dependency changes."""
+    yaml_loader.clear_cache()
+    _write_old_file(
+        tmp_path / "configuration.yaml",
+        "included: !include included.yaml\n"
+        "packages: !include_dir_named packages\n"
+        "password: !secret password\n"
+        "env: !env_var CACHE_TEST_ENV default\n",
+    )
+    _write_old_file(tmp_path / "included.yaml", "key: value\n")
+    _write_old_file(tmp_path / "secrets.yaml", "password: pwhere\n")
+    (tmp_path / "packages").mkdir()
+    _write_old_file(tmp_path / "packages" / "one.yaml", "sensor: one\n")
+    config_file = str(tmp_path / "configuration.yaml")
+
+    def load() -> tuple[dict, int]:
+        with patch.object(
+            yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+        ) as mock_parse:
+            data = yaml.load_yaml_dict(config_file, yaml.Secrets(tmp_path))
+        return data, mock_parse.call_count
+
+    data, parsed = load()
+    assert data == {
+        "included": {"key": "value"},
+        "packages": {"one": {"sensor": "one"}},
+        "password": "pwhere",
+        "env": "default",
+    }
+    assert parsed == 4
+
+    data["included"]["key"] = "changed"
+    cached, parsed = load()
+    assert parsed == 0
+    assert cached["included"] == {"key": "value"}
+    assert cached["included"].__config_file__ == config_file
+    assert cached["included"].__line__ == 1
+    assert cached["packages"]["one"]["sensor"].__config_file__ == str(
+        tmp_path / "packages" / "one.yaml"
+    )
+
+    # A changed included file is parsed again with the files including it
+    _write_old_file(tmp_path / "included.yaml", "key: other\n", 1800)
+    data, parsed = load()
+    assert data["included"] == {"key": "other"}
+    assert parsed == 2
+
+    # A new file in an included directory
+    _write_old_file(tmp_path / "packages" / "two.yaml", "sensor: two\n")
+    data, parsed = load()
+    assert data["packages"] == {"one": {"sensor": "one"}, "two": {"sensor": "two"}}
+    assert parsed == 2
+
+    # A changed secret
+    _write_old_file(tmp_path / "secrets.yaml", "password: changed\n", 1800)
+    data, parsed = load()
+    assert data["password"] == "changed"
+    assert parsed == 2
+
+    # A changed environment variable
+    with patch.dict(os.environ, {"CACHE_TEST_ENV": "set"}):
+        data, parsed = load()
+    assert data["env"] == "set"
+    assert parsed == 1
+
+
+def test_load_yaml_cache_recently_modified(tmp_path: pathlib.Path) -> None:
+    """Test recently modified files are not cached."""
+    yaml_loader.clear_cache()
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text("key: value\n", encoding="utf-8")
+
+    for _ in range(2):
+        with patch.object(
+            yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+        ) as mock_parse:
+            assert yaml.load_yaml_dict(str(config_file)) == {"key": "value"}
+        assert mock_parse.call_count == 1
+
+
+def test_load_yaml_cache_bounded(tmp_path: pathlib.Path) -> None:
+    """Test the least recently used files are removed from the cache."""
+    yaml_loader.clear_cache()
+    for name in ("one", "two", "three"):
+        _write_old_file(tmp_path / f"{name}.yaml", f"key: {name}\n")
+
+    def load(name: str) -> int:
+        with patch.object(
+            yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+        ) as mock_parse:
+            assert yaml.load_yaml_dict(str(tmp_path / f"{name}.yaml")) == {"key": name}
+        return mock_parse.call_count
+
+    with patch.object(yaml_loader, "_MAX_CACHED_FILES", 2):
+        assert load("one") == 1
+        assert load("two") == 1
+        # Using a cached file makes it the most recently used
+        assert load("one") == 0
+        assert load("three") == 1
+        assert len(yaml_loader._CACHE) == 2
+        assert load("one") == 0
+        assert load("three") == 0
+        assert load("two") == 1